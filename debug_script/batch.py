@@ -0,0 +1,112 @@
+# batch.py | Version: 5.2.0
+# Non-interactive exports for scripts and cron jobs.
+# Snapshots a list of projects, one export_snapshot per project, optionally
+# spread over a process pool, then prints a throughput summary.
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from config import SNAPSHOT_BACKEND, SHARD_SNAPSHOTS
+from utils import generate_output_path
+from snapshot_writer import snapshot_bytes
+from snapshot_export import export_snapshot
+from profiling import print_profile
+from progress import ExportProgress
+
+# ─────────────────────────────────────────────────
+# 📤 ONE PROJECT
+# ─────────────────────────────────────────────────
+
+def export_project(project_path, output_root, mode, workers=1, token_budget=None, closure=None, profile=False,
+                   progress=False, index=False, backend=SNAPSHOT_BACKEND, walked=None, skeleton_cache=None,
+                   metadata=None, name=None):
+    """
+    Export one project into <output_root>/<name, default: its folder name>/.
+    Never raises (but Ctrl-C), the result says what happened.
+    """
+    project_path = Path(project_path)
+    name = name or project_path.name
+    result = {'project': name, 'output': None, 'files': 0, 'bytes': 0, 'seconds': 0.0, 'error': None}
+    start = time.perf_counter()
+    progress = ExportProgress() if progress else None
+    try:
+        output_file = generate_output_path(output_root, name, mode, backend=backend)
+        stats = export_snapshot(project_path, output_file, mode, workers=workers, token_budget=token_budget,
+                                closure=closure, profile=profile, progress=progress, index=index, walked=walked,
+                                skeleton_cache=skeleton_cache, metadata=metadata)
+        result['output'] = str(output_file)
+        result['files'] = stats['total_files']
+        result['bytes'] = snapshot_bytes(output_file, SHARD_SNAPSHOTS)
+        result['profile'] = stats.get('profile')
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        if progress is not None:
+            progress.finish(cancelled=result['output'] is None)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+# ─────────────────────────────────────────────────
+# 🚚 MANY PROJECTS
+# ─────────────────────────────────────────────────
+
+def run_batch(projects, output_root, mode, jobs=1, workers=1, token_budget=None, closure=None, profile=False,
+              progress=False, index=False, backend=SNAPSHOT_BACKEND):
+    """
+    Export every project, `jobs` at a time (live `progress` only when jobs is 1).
+    Returns: list of export_project results, in project order
+    """
+    results = []
+    if jobs <= 1:
+        for project in projects:
+            results.append(export_project(project, output_root, mode, workers, token_budget, closure, profile,
+                                          progress, index, backend))
+            print_result(results[-1])
+        return results
+    
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(export_project, project, output_root, mode, workers, token_budget, closure, profile,
+                        index=index, backend=backend)
+            for project in projects
+        ]
+        for future in futures:
+            results.append(future.result())
+            print_result(results[-1])
+    return results
+
+def print_result(result):
+    """One line per finished export (and its profile when there is one)"""
+    if result['error']:
+        print(f"❌ {result['project']}: {result['error']}")
+    else:
+        print(f"✅ {result['project']}: {result['files']} files, "
+              f"{result['bytes'] / (1024 * 1024):.1f} MB in {result['seconds']:.2f}s")
+        if result.get('profile'):
+            print_profile(result['profile'])
+
+def print_summary(results, wall_seconds):
+    """Totals and throughput for a finished batch"""
+    done = [r for r in results if not r['error']]
+    files = sum(r['files'] for r in done)
+    megabytes = sum(r['bytes'] for r in done) / (1024 * 1024)
+    busy = sum(r['seconds'] for r in results)
+    
+    print(f"\n{'='*60}")
+    print(f"📊 {len(done)}/{len(results)} projects exported in {wall_seconds:.2f}s")
+    print(f"{'='*60}")
+    print(f"  Files:      {files:,} ({files / wall_seconds if wall_seconds else 0:,.0f} files/s)")
+    print(f"  Output:     {megabytes:,.1f} MB ({megabytes / wall_seconds if wall_seconds else 0:,.1f} MB/s)")
+    print(f"  Busy time:  {busy:.2f}s across projects ({busy / wall_seconds if wall_seconds else 0:.1f}x parallel)")
+    
+    slowest = sorted(done, key=lambda r: r['seconds'], reverse=True)[:5]
+    if slowest:
+        print("  Slowest:")
+        for r in slowest:
+            print(f"    • {r['project']}: {r['seconds']:.2f}s")
+    
+    failed = [r for r in results if r['error']]
+    if failed:
+        print("  Failed:")
+        for r in failed:
+            print(f"    • {r['project']}: {r['error']}")
@@ -0,0 +1,362 @@
+# benchmark.py | Version: 5.2.0
+# Benchmark harness for the export pipeline.
+# Generates a synthetic project tree, then times every stage of an export
+# (walk, read, skeletonize, JSON encode, end to end) for each script variant.
+#
+# Every (variant, mode) pair runs in its own interpreter: the variants share
+# module names (config, utils, snapshot_export...). Peak RSS comes from yet
+# another one that does a single export and nothing else, so the harness's
+# own copies of the tree (read, skeleton and encode stages) don't count.
+#
+# Usage:
+#   python benchmark.py                         # all variants, both modes
+#   python benchmark.py --variants current v5.1 --depth 4 --fanout 5
+#   python benchmark.py --tree D:\Coding\SoulLink --json bench.json
+
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+# 🧬 The three generations of the script
+VARIANTS = {
+    'current': HERE,
+    'v5.1': HERE / 'V5.1',
+    'barebones': HERE.parent / 'debug_script_barebones',
+}
+
+MODES = ('full', 'skeleton')
+
+# Relative weight of each extension in the generated tree
+DEFAULT_MIX = {'.py': 4, '.dart': 3, '.json': 2, '.md': 1}
+
+# ─────────────────────────────────────────────────
+# 🏗️ SYNTHETIC PROJECT GENERATOR
+# ─────────────────────────────────────────────────
+# Deterministic for a given seed, so two runs compare the same bytes.
+
+_WORDS = ('soul', 'link', 'vault', 'echo', 'state', 'bundle', 'tribunal', 'cookie', 'route', 'memory')
+
+def _name(rng, sep='_'):
+    return sep.join(rng.sample(_WORDS, 2))
+
+def _py_source(rng, lines):
+    out = ['"""Generated module for benchmarking"""', 'import os', 'from pathlib import Path', '']
+    while len(out) < lines:
+        cls = _name(rng, '').title()
+        out += ['', f'class {cls}:', f'    """{cls} docs"""', '    limit = 10', '']
+        for _ in range(rng.randint(2, 5)):
+            out += [
+                '    @property' if rng.random() < 0.2 else '    # helper',
+                f'    def {_name(rng)}(self, value, *, scale=1):',
+                '        """Do the thing"""',
+            ]
+            out += [f'        value = value * scale + {n}' for n in range(rng.randint(3, 12))]
+            out += ['        return value', '']
+    out += ['', "if __name__ == '__main__':", '    main()']
+    return '\n'.join(out)
+
+def _dart_source(rng, lines):
+    out = ["import 'package:flutter/material.dart';", '']
+    while len(out) < lines:
+        cls = _name(rng, '').title()
+        out += [f'class {cls} extends StatelessWidget {{', '  // Generated widget']
+        for _ in range(rng.randint(2, 4)):
+            out += [f'  void {_name(rng)}() {{']
+            out += [f'    print({n});' for n in range(rng.randint(3, 10))]
+            out += ['  }', '']
+        out += ['  Widget build(BuildContext context) {', '    return Container();', '  }', '}', '']
+    return '\n'.join(out)
+
+def _json_source(rng, lines):
+    data = {_name(rng) + str(n): {'id': n, 'tags': rng.sample(_WORDS, 3)} for n in range(max(1, lines // 7))}
+    return json.dumps(data, indent=2)
+
+def _md_source(rng, lines):
+    out = [f'# {_name(rng, " ").title()}', '']
+    while len(out) < lines:
+        out += [f'## {_name(rng, " ")}', ' '.join(rng.choices(_WORDS, k=12)), '']
+    return '\n'.join(out)
+
+_GENERATORS = {'.py': _py_source, '.dart': _dart_source, '.json': _json_source, '.md': _md_source}
+
+def generate_tree(root, projects=2, depth=3, fanout=3, files_per_dir=4, lines=120, mix=None, seed=42):
+    """
+    Build `projects` synthetic projects under root.
+    Returns: {'files': n, 'bytes': n} for the exportable files written
+    """
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    exts, weights = list(mix), list(mix.values())
+    totals = {'files': 0, 'bytes': 0}
+
+    def fill(folder, level):
+        folder.mkdir(parents=True, exist_ok=True)
+        for n in range(files_per_dir):
+            ext = rng.choices(exts, weights)[0]
+            size = max(5, int(lines * rng.uniform(0.5, 1.5)))
+            text = _GENERATORS[ext](rng, size)
+            (folder / f'{_name(rng)}_{n}{ext}').write_text(text, encoding='utf-8')
+            totals['files'] += 1
+            totals['bytes'] += len(text.encode('utf-8'))
+        if level < depth:
+            for n in range(fanout):
+                fill(folder / f'{_name(rng)}_{n}', level + 1)
+
+    for p in range(projects):
+        project = Path(root) / f'project_{p}'
+        fill(project, 1)
+        # 🚫 Noise the walker has to skip
+        (project / '__pycache__').mkdir()
+        (project / '__pycache__' / 'cached.py').write_text('x = 1\n', encoding='utf-8')
+        (project / '.env').write_text('SECRET=1\n', encoding='utf-8')
+
+    return totals
+
+# ─────────────────────────────────────────────────
+# ⏱️ MEASUREMENTS (run inside the child process)
+# ─────────────────────────────────────────────────
+
+def _best_of(repeat, fn):
+    """Returns: (best_seconds, last_result)"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None     # Windows: no getrusage
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def _walk(variant_dir, project):
+    """Returns: [(path, name, ext)] using the variant's own filters"""
+    if (Path(variant_dir) / 'walker.py').exists():
+        from walker import walk_files
+        return [(f.path, f.name, f.ext) for f in walk_files(project)]
+
+    # Older variants walk inside export_snapshot: mirror their rules here
+    import config
+    from utils import should_ignore_dir
+    ignored_files = getattr(config, 'IGNORED_FILES', set())
+    found = []
+    for dirpath, dirnames, filenames in os.walk(project):
+        dirnames[:] = sorted(d for d in dirnames if not should_ignore_dir(d))
+        for name in sorted(filenames):
+            ext = os.path.splitext(name)[1].lower()
+            if ext in config.ALLOWED_EXTENSIONS and name not in ignored_files:
+                found.append((os.path.join(dirpath, name), name, ext))
+    return found
+
+def _list_tree(project):
+    """Explorer listing of every directory in the project"""
+    try:
+        from listing_cache import list_directory
+    except ImportError:
+        from utils import should_ignore_dir
+
+        def list_directory(path):
+            items = sorted(Path(path).iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
+            return [d for d in items if d.is_dir() and not should_ignore_dir(d.name)], [f for f in items if f.is_file()]
+
+    pending = [Path(project)]
+    while pending:
+        dirs, _ = list_directory(pending.pop())
+        pending.extend(dirs)
+
+def measure(variant_dir, project, mode, repeat=3):
+    """Time every pipeline stage for one variant and mode"""
+    sys.path[0] = str(variant_dir)
+    import utils
+    import snapshot_export
+
+    result = {'mode': mode}
+    project = str(project)
+
+    result['list_projects_s'], _ = _best_of(repeat, lambda: utils.list_projects(Path(project).parent))
+    result['listing_s'], _ = _best_of(repeat, lambda: _list_tree(project))
+    result['walk_s'], files = _best_of(repeat, lambda: _walk(variant_dir, project))
+    result['files'] = len(files)
+
+    def read_all():
+        contents = []
+        for path, _, _ in files:
+            with open(path, encoding='utf-8') as fh:
+                contents.append(fh.read())
+        return contents
+
+    result['read_s'], contents = _best_of(repeat, read_all)
+    total_bytes = sum(os.path.getsize(path) for path, _, _ in files)
+    result['read_mb_s'] = total_bytes / (1024 * 1024) / result['read_s'] if result['read_s'] else None
+
+    if mode == 'skeleton':
+        total_lines = sum(content.count('\n') + 1 for content in contents)
+
+        def skeleton_all():
+            out = []
+            for (_, name, ext), content in zip(files, contents):
+                skeleton = snapshot_export.skeletonize(content, ext, name)
+                # v5.1 returns a bare string, later versions (content, imports)
+                out.append(skeleton[0] if isinstance(skeleton, tuple) else skeleton)
+            return out
+
+        result['skeleton_s'], contents = _best_of(repeat, skeleton_all)
+        result['skeleton_lines_s'] = total_lines / result['skeleton_s'] if result['skeleton_s'] else None
+
+    document = {
+        'metadata': {'project_name': Path(project).name, 'mode': mode},
+        'files': [
+            {'path': path, 'bundle': utils.find_bundle(name), 'language': ext[1:], 'content': content}
+            for (path, name, ext), content in zip(files, contents)
+        ],
+        'stats': {'total_files': len(files), 'by_language': {}},
+    }
+    result['encode_s'], _ = _best_of(repeat, lambda: json.dumps(document, indent=2, ensure_ascii=False))
+
+    # 📤 End to end, with the incremental manifest off so every run does the work
+    kwargs = _export_kwargs(snapshot_export)
+    with tempfile.TemporaryDirectory() as out_dir:
+        output_file = Path(out_dir) / 'bench.json'
+        with contextlib.redirect_stdout(io.StringIO()):
+            result['export_s'], _ = _best_of(
+                repeat, lambda: snapshot_export.export_snapshot(project, output_file, mode, **kwargs)
+            )
+        result['output_mb'] = output_file.stat().st_size / (1024 * 1024)
+
+    result['peak_rss_mb'] = _run_child('--export-child', variant_dir, project, mode).get('peak_rss_mb')
+    return result
+
+def _export_kwargs(snapshot_export):
+    if 'incremental' in inspect.signature(snapshot_export.export_snapshot).parameters:
+        return {'incremental': False}
+    return {}
+
+def export_once(variant_dir, project, mode):
+    """One export_snapshot call in an otherwise idle interpreter: its peak RSS is the export's"""
+    sys.path[0] = str(variant_dir)
+    import snapshot_export
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            snapshot_export.export_snapshot(str(project), Path(out_dir) / 'bench.json', mode,
+                                            **_export_kwargs(snapshot_export))
+    return {'peak_rss_mb': _peak_rss_mb()}
+
+# ─────────────────────────────────────────────────
+# 🧪 RUNNER (parent process)
+# ─────────────────────────────────────────────────
+
+def _run_child(flag, variant_dir, project, mode, *extra):
+    """Run this script with `flag` in a fresh interpreter; returns its JSON result"""
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), flag, str(variant_dir), str(project), mode, *extra],
+        capture_output=True, text=True, encoding='utf-8'
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {'mode': mode, 'error': lines[-1] if lines else f'exit code {proc.returncode}'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def run_variant(variant_dir, project, mode, repeat=3):
+    """Run measure() in a fresh interpreter with only variant_dir importable"""
+    return _run_child('--child', variant_dir, project, mode, '--repeat', str(repeat))
+
+def _fmt(value, scale=1.0, digits=1):
+    return '-' if value is None else f'{value * scale:,.{digits}f}'
+
+def print_report(results):
+    """One table per mode, one row per variant"""
+    header = (f"{'variant':<11}{'walk ms':>9}{'read MB/s':>11}{'skel lines/s':>14}"
+              f"{'encode ms':>11}{'export ms':>11}{'list ms':>9}{'proj ms':>9}{'RSS MB':>8}")
+    for mode in MODES:
+        rows = [(name, runs[mode]) for name, runs in results.items() if mode in runs]
+        if not rows:
+            continue
+        print(f"\n📊 {mode.upper()}")
+        print(header)
+        print('─' * len(header))
+        for name, r in rows:
+            if 'error' in r:
+                print(f"{name:<11}❌ {r['error']}")
+                continue
+            print(f"{name:<11}{_fmt(r['walk_s'], 1000):>9}{_fmt(r['read_mb_s']):>11}"
+                  f"{_fmt(r.get('skeleton_lines_s'), 1, 0):>14}{_fmt(r['encode_s'], 1000):>11}"
+                  f"{_fmt(r['export_s'], 1000):>11}{_fmt(r['listing_s'], 1000):>9}"
+                  f"{_fmt(r['list_projects_s'], 1000, 2):>9}{_fmt(r['peak_rss_mb']):>8}")
+
+def parse_args(argv=None):
+    """Command-line switches for the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark the snapshot export pipeline')
+    parser.add_argument('--variants', nargs='+', choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--tree', type=Path, help='benchmark an existing project instead of a generated one')
+    parser.add_argument('--projects', type=int, default=2, help='generated projects (default: 2)')
+    parser.add_argument('--depth', type=int, default=3, help='directory depth (default: 3)')
+    parser.add_argument('--fanout', type=int, default=3, help='subdirectories per directory (default: 3)')
+    parser.add_argument('--files', type=int, default=4, help='files per directory (default: 4)')
+    parser.add_argument('--lines', type=int, default=120, help='average lines per file (default: 120)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='keep the best of N runs (default: 3)')
+    parser.add_argument('--keep', action='store_true', help='keep the generated tree')
+    parser.add_argument('--json', type=Path, metavar='PATH', help='also write raw results to PATH')
+    parser.add_argument('--child', nargs=3, metavar=('VARIANT_DIR', 'PROJECT', 'MODE'), help=argparse.SUPPRESS)
+    parser.add_argument('--export-child', nargs=3, metavar=('VARIANT_DIR', 'PROJECT', 'MODE'), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.child:
+        variant_dir, project, mode = args.child
+        print(json.dumps(measure(variant_dir, project, mode, args.repeat)))
+        return
+    if args.export_child:
+        print(json.dumps(export_once(*args.export_child)))
+        return
+
+    workdir = None
+    if args.tree:
+        project = args.tree.resolve()
+    else:
+        workdir = Path(tempfile.mkdtemp(prefix='snapshot_bench_'))
+        totals = generate_tree(workdir, args.projects, args.depth, args.fanout, args.files, args.lines,
+                               seed=args.seed)
+        project = workdir / 'project_0'
+        print(f"🏗️ Generated {totals['files']} files ({totals['bytes'] / 1024:,.0f} KiB) "
+              f"across {args.projects} project(s) in {workdir}")
+
+    results = {}
+    try:
+        for name in args.variants:
+            results[name] = {}
+            for mode in args.modes:
+                print(f"⏱️ {name} / {mode}...")
+                results[name][mode] = run_variant(VARIANTS[name], project, mode, args.repeat)
+    finally:
+        if workdir is not None and not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"\n✅ Raw results saved to: {args.json}")
+
+if __name__ == '__main__':
+    main()
@@ -27,6 +27,10 @@ from pathlib import Path
 ROOT_PATH = Path(r'D:\Coding')
 OUTPUT_PATH = ROOT_PATH / 'Debug'
 
+# More project folders for batch/workspace mode, searched after ROOT_PATH
+# (same as extra --root flags), e.g. [Path(r'E:\Work')]
+EXTRA_ROOT_PATHS = []
+
 # ─────────────────────────────────────────────────
 # 🚫 FILTERING RULES
 # ─────────────────────────────────────────────────
@@ -48,6 +52,13 @@ IGNORED_FILES = {
 # The allowed extensions for files to be included in the debug process.
 ALLOWED_EXTENSIONS = {'.py', '.json', '.yaml', '.yml', '.txt', '.md', '.dart', '.sql'}
 
+# Extra exclusions in .gitignore syntax, relative to the exported project
+# (e.g. 'generated/', '*.g.dart', 'docs/**/*.txt').
+IGNORE_PATTERNS = []
+
+# Ignore files honored in every folder of the tree; later ones win.
+IGNORE_RULE_FILES = ('.gitignore', '.snapshotignore')
+
 # ─────────────────────────────────────────────────
 # 📦 BUNDLES
 # ─────────────────────────────────────────────────
@@ -89,6 +100,75 @@ MODE_FULL = 'full'
 MODE_SKELETON = 'skeleton'
 MODE_BLUEPRINT = 'blueprint'  # Alias for skeleton
 
+# Stream each file entry straight to disk instead of building the whole
+# document in memory. Same schema, stats and metadata just come last.
+STREAM_SNAPSHOTS = True
+
+# Keep a manifest next to each skeleton/blueprint snapshot and only re-read
+# files whose size/mtime changed since the last export of the same project and
+# mode; unchanged entries are read back through the snapshot's .idx (written
+# automatically). Full mode has nothing to save: reading the file costs the same.
+INCREMENTAL_EXPORTS = True
+
+# Split snapshots into one file per bundle (see BUNDLE_MAP) behind a small
+# index, so downstream tools can load only the bundles they need.
+SHARD_SNAPSHOTS = False
+
+# Snapshot compression: None, 'gzip' (.json.gz) or 'lzma' (.json.xz).
+# COMPACT_JSON drops the indent=2 pretty-printing (smaller, still valid JSON).
+SNAPSHOT_COMPRESSION = None
+COMPACT_JSON = False
+
+# Snapshot backend: 'json' or 'sqlite' (<name>_snapshot.db: one row per file,
+# FTS5 full-text index over content). Compression only applies to JSON.
+SNAPSHOT_BACKEND = 'json'
+
+# Store each distinct file content once in a `blobs` table; entries then
+# point at it with `blob: <hash>`. Pays off on trees full of copied files.
+DEDUP_CONTENT = False
+
+# Save a <snapshot>.idx sidecar with the byte offset of every entry, so one
+# file can be read back without parsing the whole snapshot (snapshot_index).
+# Uncompressed snapshots only; a buffered export then streams instead.
+WRITE_SNAPSHOT_INDEX = False
+
+# Files above MAX_FILE_BYTES (data dumps that happen to be .json/.sql) are
+# never loaded whole. LARGE_FILE_POLICY: 'truncate' keeps the head, 'sample'
+# keeps head + tail, 'skip' leaves them out. Either way stats say why.
+MAX_FILE_BYTES = 2 * 1024 * 1024
+LARGE_FILE_POLICY = 'sample'
+
+# Extra blueprint engines: modules imported at startup (and in worker
+# processes) that call skeletons.register_skeletonizer('.ext').
+SKELETONIZER_PLUGINS = []
+
+# ─────────────────────────────────────────────────
+# 🎯 TOKEN BUDGET
+# ─────────────────────────────────────────────────
+# Average characters per LLM token for code and JSON. Rough on purpose:
+# it only has to rank and pack files, not bill anyone.
+
+CHARS_PER_TOKEN = 4
+
+# ─────────────────────────────────────────────────
+# 🕸️ IMPORT GRAPH
+# ─────────────────────────────────────────────────
+# Who imports whom, resolved to project files (import_graph.py).
+
+# Save the resolved import graph (<snapshot>.graph.json) with every export.
+# Off by default: resolving every import adds most of an export's time again.
+# --closure builds the graph it needs either way.
+WRITE_IMPORT_GRAPH = False
+
+# ─────────────────────────────────────────────────
+# ⏱️ PROFILING
+# ─────────────────────────────────────────────────
+# Where an export spends its time (profiling.py).
+
+# Record per-phase timers, counters and the slowest files in stats['profile']
+# and dump a cProfile file next to the snapshot (same as --profile)
+PROFILE_EXPORTS = False
+
 # If this doesn't work, remember: Just keep swimming, just keep swimming...
 # 
 # It's pouring out here! Wait, the water levels aren't rising, are they?
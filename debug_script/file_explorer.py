@@ -11,17 +11,34 @@
 
 from pathlib import Path
 from config import ROOT_PATH, MODE_FULL, MODE_SKELETON, MODE_BLUEPRINT
-from utils import should_ignore_dir, generate_output_path
+from utils import generate_output_path
 from snapshot_export import export_snapshot
+from profiling import print_profile
+from progress import ExportProgress
+from listing_cache import ListingCache
+from subtree_scan import SubtreeScanner, describe
+
+# Shared by every explore() call: revisited folders come straight from here
+_listings = ListingCache()
+_scanner = SubtreeScanner()
+
+# How long the menu waits for a size scan before showing "scanning..."
+SCAN_WAIT_SECONDS = 0.3
 
 # ─────────────────────────────────────────────────
 # 📂 DIRECTORY EXPLORER LOOP
 # ─────────────────────────────────────────────────
 
-def explore(start_path: str):
+def explore(start_path: str, workers: int = 1, token_budget: int | None = None, profile: bool = False):
     """Interactive directory explorer with export capabilities"""
-    current_path = Path(start_path)
-    
+    try:
+        _explore(Path(start_path), workers, token_budget, profile)
+    finally:
+        # The scan and prefetch threads would otherwise keep the interpreter alive after [q]
+        _scanner.close()
+        _listings.close()
+
+def _explore(current_path, workers, token_budget, profile):
     while True:
         print(f"\n{'='*60}")
         print(f"📂 Current: {current_path}")
@@ -29,18 +46,27 @@ def explore(start_path: str):
         
         # Collect directories and files
         try:
-            items = sorted(current_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
+            dirs, files = _listings.get(current_path)
         except PermissionError:
             print("❌ Permission denied!")
             return
         
-        dirs = [d for d in items if d.is_dir() and not should_ignore_dir(d.name)]
-        files = [f for f in items if f.is_file()]
+        # Warm up every way out of here while the menu is being read
+        _listings.prefetch(dirs + [current_path.parent])
+        
+        # 📏 Sizes and export estimates (a new folder cancels the old scan)
+        _scanner.request(current_path)
+        scan = _scanner.result(current_path, timeout=SCAN_WAIT_SECONDS)
+        if scan is None:
+            print("📏 Scanning sizes... ([r] to refresh)")
+        else:
+            print(f"📏 {describe(scan.totals)}")
         
         # Display folders
         print("\n📁 Directories:")
         for idx, d in enumerate(dirs, 1):
-            print(f"  [{idx}] {d.name}/")
+            sizes = scan.children.get(d.name) if scan is not None else None
+            print(f"  [{idx}] {d.name}/" + (f"  ({describe(sizes)})" if sizes else ""))
         
         if not dirs:
             print("  (none)")
@@ -58,6 +84,7 @@ def explore(start_path: str):
         print("  [f] Export FULL snapshot")
         print("  [s] Export SKELETON/blueprint")
         print("  [b] Go BACK")
+        print("  [r] REFRESH")
         print("  [q] QUIT")
         if dirs:
             print("  [1-9] Enter directory")
@@ -78,9 +105,28 @@ def explore(start_path: str):
                 mode
             )
             
-            print(f"\n🚀 Exporting {mode.upper()} snapshot...")
-            export_snapshot(current_path, output_file, mode)
+            print(f"\n🚀 Exporting {mode.upper()} snapshot... (Ctrl-C to cancel)")
+            # Always a fresh walk: a background scan's stats would hide edits made since.
+            # The scan itself stops here so it doesn't compete for the disk.
+            _scanner.cancel()
+            progress = ExportProgress()
+            try:
+                stats = export_snapshot(current_path, output_file, mode, workers=workers,
+                                        token_budget=token_budget, profile=profile, progress=progress)
+            except KeyboardInterrupt:
+                progress.finish(cancelled=True)
+                print("🛑 Export cancelled, the previous snapshot (if any) is untouched.")
+                input("\nPress Enter to continue...")
+                continue
+            progress.finish()
             print(f"✅ Saved to: {output_file}")
+            if token_budget:
+                packed = stats['token_budget']
+                print(f"🎯 ~{packed['estimated_tokens']:,} of {token_budget:,} tokens: "
+                      f"{packed['full']} full, {packed['skeleton']} skeleton, "
+                      f"{packed['path']} path-only, {packed['dropped']} dropped")
+            if profile:
+                print_profile(stats['profile'])
             input("\nPress Enter to continue...")
         
         # ────────────────────────
@@ -93,6 +139,12 @@ def explore(start_path: str):
                 continue
             current_path = current_path.parent
         
+        # ────────────────────────
+        # REFRESH (sizes that were still scanning)
+        # ────────────────────────
+        elif choice == 'r':
+            continue
+        
         # ────────────────────────
         # QUIT
         # ────────────────────────
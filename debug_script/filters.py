@@ -0,0 +1,165 @@
+# filters.py | Version: 5.2.0
+# Compiled include/exclude rules for the walker.
+# Folds IGNORED_DIRS, IGNORED_FILES, ALLOWED_EXTENSIONS, IGNORE_PATTERNS and any
+# .gitignore / .snapshotignore met on the way into one object: each entry
+# costs a couple of set lookups plus one combined regex per ignore file.
+
+import os
+import re
+from config import (IGNORED_DIRS, IGNORED_FILES, ALLOWED_EXTENSIONS, IGNORE_PATTERNS,
+                    IGNORE_RULE_FILES)
+
+# ─────────────────────────────────────────────────
+# 📜 GITIGNORE PATTERNS
+# ─────────────────────────────────────────────────
+# The usual subset: comments, `!` negation, trailing `/` for directories,
+# leading or inner `/` to anchor, `*`, `?`, `[...]` and `**`.
+
+def _translate(pattern):
+    """Glob body -> regex body (paths use forward slashes)"""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[' and pattern.find(']', i + 2) != -1:
+            j = pattern.find(']', i + 2)
+            body = pattern[i + 1:j].replace('\\', '\\\\')
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            out.append('[' + body + ']')
+            i = j + 1
+            continue
+        elif c == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+def _parse_line(line):
+    """Returns: (regex, negate, dir_only) or None for blanks and comments"""
+    line = line.rstrip('\r\n')
+    if not line.strip() or line.startswith('#'):
+        return None
+    if not line.endswith('\\ '):
+        line = line.rstrip(' ')
+    negate = line.startswith('!')
+    if negate or line.startswith(('\\!', '\\#')):
+        line = line[1:]
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+    # No slash but the trailing one: match the name at any depth
+    anchored = '/' in line
+    regex = _translate(line.lstrip('/'))
+    return (regex if anchored else '(?:.*/)?' + regex), negate, dir_only
+
+def _combine(regexes):
+    return re.compile('|'.join(f'(?:{rx})' for rx in regexes)) if regexes else None
+
+class IgnoreRules:
+    """The rules of one directory's ignore file(s), relative to that directory"""
+
+    def __init__(self, lines, base=''):
+        self.base = base
+        rules = [rule for rule in map(_parse_line, lines) if rule]
+        self._ordered = None
+        if any(negate for _, negate, _ in rules):
+            # Last match wins, so negations need the rules one by one
+            self._ordered = [(re.compile(rx), negate, dir_only) for rx, negate, dir_only in reversed(rules)]
+        else:
+            self._any = _combine([rx for rx, _, dir_only in rules if not dir_only])
+            self._dirs = _combine([rx for rx, _, dir_only in rules if dir_only])
+
+    def match(self, rel_path, is_dir):
+        """True (ignore), False (re-included by `!`) or None (no opinion)"""
+        sub = rel_path[len(self.base):]
+        if self._ordered is None:
+            if self._any is not None and self._any.fullmatch(sub):
+                return True
+            if is_dir and self._dirs is not None and self._dirs.fullmatch(sub):
+                return True
+            return None
+        for regex, negate, dir_only in self._ordered:
+            if (is_dir or not dir_only) and regex.fullmatch(sub):
+                return not negate
+        return None
+
+# ─────────────────────────────────────────────────
+# 🧰 THE FILTER
+# ─────────────────────────────────────────────────
+
+class PathFilter:
+    """Every include/exclude decision of a walk, compiled once"""
+
+    def __init__(self, ignored_dirs=IGNORED_DIRS, ignored_files=IGNORED_FILES,
+                 allowed_extensions=ALLOWED_EXTENSIONS, patterns=IGNORE_PATTERNS,
+                 rule_files=IGNORE_RULE_FILES):
+        self.ignored_dirs = frozenset(ignored_dirs)
+        self.ignored_files = frozenset(ignored_files)
+        self.allowed_extensions = frozenset(allowed_extensions)
+        self.rule_files = tuple(rule_files)
+        self._rule_file_names = frozenset(rule_files)
+        # Config patterns behave like an ignore file at the project root
+        self.root_rules = (IgnoreRules(patterns),) if patterns else ()
+
+    def rules_for(self, dir_path, prefix, entries, inherited):
+        """Rules active inside a directory, given its (already scanned) entries"""
+        found = {entry.name for entry in entries if entry.name in self._rule_file_names}
+        if not found:
+            return inherited
+        lines = []
+        # Listed order: a .snapshotignore can re-include what .gitignore drops
+        for name in self.rule_files:
+            if name in found:
+                try:
+                    with open(os.path.join(dir_path, name), encoding='utf-8', errors='replace') as f:
+                        lines.extend(f)
+                except OSError:
+                    continue
+        return inherited + (IgnoreRules(lines, prefix),)
+
+    def _ignored(self, rel_path, is_dir, rules):
+        # The deepest ignore file with an opinion decides
+        for rule in reversed(rules):
+            verdict = rule.match(rel_path, is_dir)
+            if verdict is not None:
+                return verdict
+        return False
+
+    def skip_dir(self, name, rel_path, rules):
+        """True when the whole subtree should be pruned"""
+        return (name in self.ignored_dirs or name.startswith('.')
+                or (bool(rules) and self._ignored(rel_path, True, rules)))
+
+    def accept_file(self, name, ext, rel_path, rules):
+        # 🛡️ SECURITY: Stop .env processing
+        if name in self.ignored_files or ext not in self.allowed_extensions:
+            return False
+        return not (rules and self._ignored(rel_path, False, rules))
+
+    # Which rule said no (profiling only, so the hot path stays boolean)
+    def dir_skip_reason(self, name, rel_path, rules):
+        if name in self.ignored_dirs:
+            return 'ignored_dirs'
+        return 'hidden_dirs' if name.startswith('.') else 'ignore_rules'
+
+    def file_skip_reason(self, name, ext, rel_path, rules):
+        if name in self.ignored_files:
+            return 'ignored_files'
+        return 'extension' if ext not in self.allowed_extensions else 'ignore_rules'
@@ -0,0 +1,246 @@
+# import_graph.py | Version: 5.2.0
+# Resolved dependency graph between the files of a snapshot.
+# Python `import` / `from ... import` and Dart `import` / `export` / `part`
+# statements are mapped to in-project paths and saved as an adjacency index
+# next to the snapshot (<name>.json.graph.json). The same graph answers
+# "which files does X need", so a snapshot can be limited to that slice.
+
+import json
+import os
+import posixpath
+from collections import deque
+from pathlib import Path
+from config import MAX_FILE_BYTES
+from walker import walk_files
+
+GRAPH_VERSION = 1
+GRAPH_EXTENSIONS = ('.py', '.dart')
+
+def graph_path_for(output_file):
+    """Debug/<project>/<name>_snapshot.json -> <name>_snapshot.json.graph.json"""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + '.graph.json')
+
+# ─────────────────────────────────────────────────
+# 🔗 IMPORT STATEMENTS
+# ─────────────────────────────────────────────────
+
+def _python_statements(content):
+    """Yield import statements, parenthesized/backslashed ones joined"""
+    lines = iter(content.split('\n'))
+    for line in lines:
+        stripped = line.strip()
+        if not stripped.startswith(('import ', 'from ')):
+            continue
+        statement = stripped.split('#', 1)[0].strip()
+        while statement.endswith('\\') or statement.count('(') > statement.count(')'):
+            more = next(lines, None)
+            if more is None:
+                break
+            statement = statement.rstrip('\\') + ' ' + more.split('#', 1)[0].strip()
+        yield statement
+
+def python_modules(statement):
+    """'from a import b, c' -> ['a.b', 'a.c', 'a']; 'import a.b as x' -> ['a.b']"""
+    statement = statement.replace('(', ' ').replace(')', ' ')
+    if statement.startswith('import '):
+        return [part.split(' as ')[0].strip() for part in statement[7:].split(',') if part.strip()]
+    module, sep, names = statement[5:].partition(' import ')
+    module = module.strip()
+    if not sep or not module:
+        return []
+    prefix = module if module.endswith('.') else module + '.'
+    found = [prefix + name.split(' as ')[0].strip() for name in names.split(',')
+             if name.strip() and name.strip() != '*']
+    return found + [module]
+
+def dart_targets(content):
+    """URIs of import/export/part directives"""
+    targets = []
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith(('import ', 'export ', 'part ')) and not stripped.startswith('part of'):
+            quote = stripped.find("'") if "'" in stripped else stripped.find('"')
+            if quote != -1:
+                end = stripped.find(stripped[quote], quote + 1)
+                if end != -1:
+                    targets.append(stripped[quote + 1:end])
+    return targets
+
+def entry_imports(entry, ext):
+    """
+    Import specs of one snapshot entry, whatever its mode: one tuple per
+    import, holding the alternatives it may resolve to.
+    """
+    if ext == '.py':
+        # Skeleton entries already carry their statements
+        statements = entry.get('imports') or _python_statements(entry.get('content', ''))
+        specs = []
+        for statement in statements:
+            modules = python_modules(statement)
+            if statement.startswith('from '):
+                # a.b or a for `from a import b`: one import, whichever exists
+                specs.extend([tuple(modules)] if modules else [])
+            else:
+                specs.extend((module,) for module in modules)
+        return specs
+    if ext == '.dart':
+        if 'imports' in entry:
+            return [(uri,) for uri in dart_targets('\n'.join(entry['imports']))]
+        return [(uri,) for uri in dart_targets(entry.get('content', ''))]
+    return []
+
+# ─────────────────────────────────────────────────
+# 🧭 RESOLUTION
+# ─────────────────────────────────────────────────
+
+def _dotted(rel_path):
+    """'pkg/sub/mod.py' -> 'pkg.sub.mod', 'pkg/__init__.py' -> 'pkg'"""
+    parts = rel_path[:-3].split('/')
+    if parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts)
+
+class _Resolver:
+    def __init__(self, paths, package=None):
+        self.paths = set(paths)
+        # The project folder may itself be the package (`from email import x`)
+        self.package_prefix = package + '.' if package else None
+        self.modules = {}      # full dotted name -> path
+        self.suffixes = {}     # trailing dotted name -> path, None when ambiguous
+        self.dart_lib = {}     # 'x/y.dart' under some lib/ -> path
+        for path in paths:
+            if path.endswith('.py'):
+                dotted = _dotted(path)
+                if not dotted:
+                    continue
+                self.modules[dotted] = path
+                # Source roots (src/, backend/...) are unknown: index every tail
+                parts = dotted.split('.')
+                for i in range(1, len(parts)):
+                    tail = '.'.join(parts[i:])
+                    self.suffixes[tail] = path if tail not in self.suffixes else None
+            elif path.endswith('.dart') and '/lib/' in '/' + path:
+                lib_rel = ('/' + path).rsplit('/lib/', 1)[1]
+                self.dart_lib[lib_rel] = path if lib_rel not in self.dart_lib else None
+
+    def python(self, importer, module):
+        if module.startswith('.'):
+            level = len(module) - len(module.lstrip('.'))
+            package = _dotted(importer).split('.')
+            if not importer.endswith('__init__.py'):
+                package = package[:-1]
+            if level > 1:
+                package = package[:len(package) - (level - 1)]
+            rest = module[level:]
+            module = '.'.join(package + ([rest] if rest else []))
+            return self.modules.get(module)
+        if self.package_prefix and module.startswith(self.package_prefix):
+            inner = module[len(self.package_prefix):]
+            return self.modules.get(inner) or self.suffixes.get(inner)
+        return self.modules.get(module) or self.suffixes.get(module)
+
+    def dart(self, importer, uri):
+        if uri.startswith('dart:'):
+            return None
+        if uri.startswith('package:'):
+            _, _, lib_rel = uri[8:].partition('/')
+            return self.dart_lib.get(lib_rel)
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(importer), uri))
+        return target if target in self.paths else None
+
+class ImportGraph:
+    """Collects import specs per file, resolves them once every path is known"""
+
+    def __init__(self, project_name=None):
+        self.project_name = project_name
+        self.specs = {}        # rel_path -> [(alternative, ...) per import]
+
+    def add(self, rel_path, entry):
+        ext = os.path.splitext(rel_path)[1].lower()
+        self.specs[rel_path] = entry_imports(entry, ext) if ext in GRAPH_EXTENSIONS else []
+
+    def resolve(self):
+        """Returns: (edges, external) as {path: sorted list}"""
+        resolver = _Resolver(self.specs, self.project_name)
+        edges, external = {}, {}
+        for path, specs in self.specs.items():
+            deps, unresolved = set(), set()
+            is_python = path.endswith('.py')
+            for alternatives in specs:
+                targets = [resolver.python(path, spec) if is_python else resolver.dart(path, spec)
+                           for spec in alternatives]
+                deps.update(target for target in targets if target is not None and target != path)
+                if any(target is not None for target in targets):
+                    continue
+                # External only when no alternative of the import is in the project
+                spec = alternatives[-1]
+                if not is_python:
+                    unresolved.add(spec)
+                elif not spec.startswith('.') and spec.split('.')[0] != self.project_name:
+                    unresolved.add(spec.split('.')[0])
+            edges[path] = sorted(deps)
+            if unresolved:
+                # Python: the top-level name only (the package to install)
+                external[path] = sorted(unresolved)
+        return edges, external
+
+    def save(self, path):
+        edges, external = self.resolve()
+        reverse = {node: [] for node in edges}
+        for node, deps in edges.items():
+            for dep in deps:
+                reverse[dep].append(node)
+        data = {
+            'version': GRAPH_VERSION,
+            'project_name': self.project_name,
+            'edges': edges,
+            'reverse': reverse,
+            'external': external
+        }
+        path = Path(path)
+        part_file = path.with_name(path.name + '.part')
+        with open(part_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(part_file, path)
+
+# ─────────────────────────────────────────────────
+# 🕸️ TRANSITIVE CLOSURE
+# ─────────────────────────────────────────────────
+
+def closure(edges, roots):
+    """Every path reachable from roots (roots included), BFS order"""
+    seen = [root for root in roots if root in edges]
+    queue = deque(seen)
+    seen = set(seen)
+    order = list(queue)
+    while queue:
+        for dep in edges.get(queue.popleft(), ()):
+            if dep not in seen:
+                seen.add(dep)
+                order.append(dep)
+                queue.append(dep)
+    return order
+
+def closure_files(project_path, roots, walked=None):
+    """
+    Walk the project, scan imports (one read per .py/.dart file) and keep only
+    the FileEntry items in the transitive closure of roots, in walk order.
+    """
+    items = list(walk_files(project_path) if walked is None else walked)
+    graph = ImportGraph(Path(project_path).name)
+    for item in items:
+        content = ''
+        if item.ext in GRAPH_EXTENSIONS and item.dir_entry.stat().st_size <= MAX_FILE_BYTES:
+            try:
+                with open(item.path, encoding='utf-8') as fh:
+                    content = fh.read()
+            except (OSError, UnicodeDecodeError):
+                pass
+        graph.add(item.rel_path, {'content': content})
+    edges, _ = graph.resolve()
+    missing = [root for root in roots if root not in edges]
+    if missing:
+        raise FileNotFoundError(f"Not in the snapshot: {', '.join(missing)}")
+    keep = set(closure(edges, roots))
+    return [item for item in items if item.rel_path in keep]
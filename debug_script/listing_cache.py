@@ -0,0 +1,119 @@
+# listing_cache.py | Version: 5.2.0
+# Directory listings for the interactive explorer.
+# Listings are cached (LRU) and validated with a single stat of the folder,
+# and child folders are prefetched on a background thread while the menu is
+# being read, so revisiting or entering a folder doesn't hit the disk again.
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from utils import should_ignore_dir
+from manifest import RACY_WINDOW_NS
+
+MAX_CACHED_LISTINGS = 256
+PREFETCH_WORKERS = 2
+
+# ─────────────────────────────────────────────────
+# 📋 ONE LISTING
+# ─────────────────────────────────────────────────
+
+def list_directory(path):
+    """Returns: (visible_dirs, files), directories first then by name"""
+    # scandir's DirEntry answers is_dir()/is_file() from the listing itself
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
+    dirs = [Path(e.path) for e in entries if e.is_dir() and not should_ignore_dir(e.name)]
+    files = [Path(e.path) for e in entries if e.is_file()]
+    return dirs, files
+
+# ─────────────────────────────────────────────────
+# 🗃️ THE CACHE
+# ─────────────────────────────────────────────────
+# A folder's mtime changes whenever an entry is added, removed or renamed,
+# which is all a listing shows. Listings taken within RACY_WINDOW_NS of the
+# folder's mtime are re-listed next time (coarse FAT/SMB timestamps).
+
+class ListingCache:
+    """LRU cache of list_directory results keyed by path + folder mtime"""
+
+    def __init__(self, maxsize=MAX_CACHED_LISTINGS, lister=list_directory):
+        self.maxsize = maxsize
+        self.lister = lister
+        self._listings = OrderedDict()   # key -> (mtime_ns, listed_ns, result)
+        self._inflight = {}              # key -> Future of a running prefetch
+        self._lock = threading.Lock()
+        self._pool = None
+        self._wanted = frozenset()       # keys of the latest prefetch() call
+
+    def _fresh(self, key, mtime_ns):
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is None:
+                return None
+            cached_mtime, listed_ns, result = cached
+            if cached_mtime != mtime_ns or mtime_ns >= listed_ns - RACY_WINDOW_NS:
+                return None
+            self._listings.move_to_end(key)
+            return result
+
+    def _store(self, key, mtime_ns, listed_ns, result):
+        with self._lock:
+            self._listings[key] = (mtime_ns, listed_ns, result)
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.maxsize:
+                self._listings.popitem(last=False)
+
+    def _load(self, key, path):
+        mtime_ns = os.stat(path).st_mtime_ns
+        result = self._fresh(key, mtime_ns)
+        if result is None:
+            listed_ns = time.time_ns()
+            result = self.lister(path)
+            self._store(key, mtime_ns, listed_ns, result)
+        return result
+
+    def get(self, path):
+        """Returns: (visible_dirs, files) for path, listing it only when needed"""
+        key = str(path)
+        with self._lock:
+            pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                # A prefetch is already on it: wait instead of listing twice
+                pending.result()
+            except Exception:
+                pass
+        return self._load(key, path)
+
+    # ────────────────────────
+    # PREFETCH
+    # ────────────────────────
+
+    def _prefetch_one(self, key, path):
+        try:
+            # The user moved on since this was queued: not worth the I/O
+            if key in self._wanted:
+                self._load(key, path)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def prefetch(self, paths):
+        """List paths in the background; drops whatever an earlier call queued"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix='prefetch')
+        paths = {str(path): path for path in paths}
+        self._wanted = frozenset(paths)
+        for key, path in paths.items():
+            with self._lock:
+                if key in self._inflight:
+                    continue
+                self._inflight[key] = self._pool.submit(self._prefetch_one, key, path)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
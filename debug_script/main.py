@@ -13,12 +13,224 @@
 #
 # Also, support SoulLink on mobile and pc... just saying!
 
-from config import ROOT_PATH, OUTPUT_PATH
-from utils import list_projects, ensure_dir
+import argparse
+import sys
+import time
+from pathlib import Path
+from config import (ROOT_PATH, EXTRA_ROOT_PATHS, OUTPUT_PATH, MODE_FULL, MODE_SKELETON, MODE_BLUEPRINT,
+                    PROFILE_EXPORTS, WRITE_SNAPSHOT_INDEX, SNAPSHOT_BACKEND)
+from utils import list_projects, ensure_dir, generate_output_path, BACKENDS
 from file_explorer import explore
 
-def main():
+def parse_args(argv=None):
+    """Command-line switches for the navigator and batch mode"""
+    parser = argparse.ArgumentParser(
+        description='Project snapshot debugger',
+        epilog='Without --all/--project the interactive navigator starts.'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1, metavar='N',
+        help='read files on N threads and skeletonize on N processes (default: 1)'
+    )
+    parser.add_argument(
+        '--token-budget', type=int, default=None, metavar='N',
+        help='pack each snapshot into ~N tokens: full, then skeleton, then path-only files by bundle order'
+    )
+    parser.add_argument(
+        '--profile', action='store_true', default=PROFILE_EXPORTS,
+        help="time each export phase (stats['profile']) and save a cProfile dump next to the snapshot"
+    )
+    parser.add_argument(
+        '--index', action='store_true', default=WRITE_SNAPSHOT_INDEX,
+        help='save a <snapshot>.idx of byte offsets so single files can be read back without parsing it all'
+    )
+    
+    # 🚚 Batch mode (no input() anywhere, cron friendly)
+    batch = parser.add_argument_group('batch mode')
+    batch.add_argument(
+        '--root', type=Path, action='append', metavar='DIR',
+        help=f'projects folder (repeatable; default: {ROOT_PATH} and EXTRA_ROOT_PATHS)'
+    )
+    batch.add_argument('--output', type=Path, default=OUTPUT_PATH, help=f'snapshot folder (default: {OUTPUT_PATH})')
+    batch.add_argument(
+        '--mode', choices=[MODE_FULL, MODE_SKELETON, MODE_BLUEPRINT], default=MODE_FULL,
+        help='snapshot mode (default: full)'
+    )
+    which = batch.add_mutually_exclusive_group()
+    which.add_argument('--all', action='store_true', help='export every project in --root')
+    which.add_argument(
+        '--project', action='append', metavar='NAME',
+        help='export this project, by name in a --root or as a folder path (repeatable)'
+    )
+    batch.add_argument('--jobs', type=int, default=1, metavar='N', help='export N projects at once (default: 1)')
+    batch.add_argument(
+        '--backend', choices=BACKENDS, default=SNAPSHOT_BACKEND,
+        help=f'json document or sqlite database with full-text search (default: {SNAPSHOT_BACKEND})'
+    )
+    batch.add_argument(
+        '--workspace', nargs='?', const='', metavar='NAME',
+        help='walk all selected projects at once and share caches; with NAME, write one combined '
+             'snapshot with <project>/ paths instead of one per project'
+    )
+    batch.add_argument(
+        '--watch', action='store_true',
+        help='with a single --project: export it, then keep the snapshot up to date as files change'
+    )
+    batch.add_argument(
+        '--closure', action='append', metavar='PATH',
+        help='only export PATH (relative to the project) and every file it imports, transitively (repeatable)'
+    )
+    
+    # 🔍 Diff mode (compares two existing snapshots, exports nothing)
+    compare = parser.add_argument_group('diff mode')
+    compare.add_argument(
+        '--diff', nargs=2, type=Path, metavar=('OLD', 'NEW'),
+        help='report added/removed/modified files between two snapshots, with unified diffs'
+    )
+    compare.add_argument('--stat', action='store_true', help='with --diff: list the changed files only')
+    compare.add_argument(
+        '--delta', type=Path, metavar='FILE',
+        help='with --diff: also write the changes as a delta snapshot (.gz/.xz compress it)'
+    )
+    
+    # 🔎 Search mode (full-text query over a --backend sqlite snapshot)
+    find = parser.add_argument_group('search mode')
+    find.add_argument(
+        '--search', nargs=2, metavar=('DB', 'QUERY'),
+        help='full-text search a .db snapshot (FTS5 syntax: foo AND bar, "a phrase", pref*)'
+    )
+    find.add_argument('--limit', type=int, default=20, metavar='N', help='with --search: at most N hits (default: 20)')
+    return parser.parse_args(argv)
+
+def select_projects(args):
+    """
+    Projects named by --project (or all of them with --all) across every root.
+    Returns: (projects, roots label, missing names)
+    """
+    roots = args.root or [ROOT_PATH, *EXTRA_ROOT_PATHS]
+    projects = [project for root in roots if Path(root).is_dir() for project in list_projects(root)]
+    label = ', '.join(str(root) for root in roots)
+    if not args.project:
+        return projects, label, []
+    by_name = {}
+    for p in projects:
+        by_name.setdefault(p.name.lower(), p)     # First root wins on a name clash
+    selected, missing = [], []
+    for name in args.project:
+        if name.lower() in by_name:
+            selected.append(by_name[name.lower()])
+        elif Path(name).is_dir():
+            selected.append(Path(name).resolve())
+        else:
+            missing.append(name)
+    return selected, label, missing
+
+def batch_main(args):
+    """Export the selected projects without asking anything. Returns the exit code."""
+    from batch import run_batch, print_summary
+    from workspace import export_workspace
+    
+    projects, roots, missing = select_projects(args)
+    if missing:
+        print(f"❌ Unknown project(s) in {roots}: {', '.join(missing)}")
+        return 2
+    
+    if not projects:
+        print(f"❌ No projects found in {roots}")
+        return 1
+    
+    ensure_dir(args.output)
+    print(f"🚀 Exporting {len(projects)} project(s) as {args.mode.upper()} "
+          f"with {args.jobs} job(s) into {args.output}")
+    
+    start = time.perf_counter()
+    try:
+        # Live progress only makes sense for one project at a time on a terminal
+        if args.workspace is not None:
+            if args.jobs > 1 or args.closure:
+                print("⚠️  --jobs/--closure are ignored in workspace mode (one process shares the caches)")
+            results = export_workspace(projects, args.output, args.mode, name=args.workspace or None,
+                                       workers=args.workers, token_budget=args.token_budget, profile=args.profile,
+                                       progress=sys.stdout.isatty(), index=args.index, backend=args.backend)
+        else:
+            results = run_batch(projects, args.output, args.mode, jobs=args.jobs, workers=args.workers,
+                                token_budget=args.token_budget, closure=args.closure, profile=args.profile,
+                                progress=sys.stdout.isatty(), index=args.index, backend=args.backend)
+    except KeyboardInterrupt:
+        print("\n🛑 Batch cancelled; snapshots not finished yet were left untouched.")
+        return 130
+    print_summary(results, time.perf_counter() - start)
+    return 1 if any(r['error'] for r in results) else 0
+
+def watch_main(args):
+    """Keep one project's snapshot live until Ctrl-C. Returns the exit code."""
+    from watch import watch
+    
+    if not args.project or len(args.project) != 1:
+        print("❌ --watch needs exactly one --project NAME")
+        return 2
+    projects, roots, missing = select_projects(args)
+    if missing:
+        print(f"❌ Unknown project in {roots}: {args.project[0]}")
+        return 2
+    project = projects[0]
+    if args.token_budget or args.closure:
+        print("⚠️  --token-budget/--closure are ignored in watch mode")
+    
+    ensure_dir(args.output)
+    output_file = generate_output_path(args.output, project.name, args.mode, backend=args.backend)
+    watch(project, output_file, args.mode, workers=args.workers)
+    return 0
+
+def diff_main(args):
+    """Compare two snapshots. Returns the exit code: 0 same, 1 different, 2 trouble (like diff)."""
+    import lzma
+    from snapshot_diff import diff_snapshots, print_diff, write_delta
+    
+    old_file, new_file = args.diff
+    try:
+        diff = diff_snapshots(old_file, new_file)
+    except (OSError, EOFError, lzma.LZMAError, ValueError) as e:
+        print(f"❌ Could not read the snapshots: {e}")
+        return 2
+    print_diff(diff, stat_only=args.stat)
+    if args.delta:
+        stats = write_delta(diff, args.delta)
+        print(f"🧾 Delta snapshot: {stats['total_files']} file(s), "
+              f"{args.delta.stat().st_size / 1024:.1f} KB → {args.delta}")
+    return 1 if diff else 0
+
+def search_main(args):
+    """Query a .db snapshot. Returns the exit code: 0 hits, 1 none, 2 trouble."""
+    import sqlite3
+    from snapshot_sqlite import search_snapshot, print_hits
+    
+    db_file, query = args.search
+    if not Path(db_file).is_file():
+        print(f"❌ No such snapshot database: {db_file}")
+        return 2
+    start = time.perf_counter()
+    try:
+        hits = search_snapshot(db_file, query, limit=args.limit)
+    except sqlite3.Error as e:
+        print(f"❌ Could not search {db_file}: {e}")
+        return 2
+    print_hits(hits)
+    print(f"⏱️  {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0 if hits else 1
+
+def main(argv=None):
     """The gateway to the Master Navigator's domain!"""
+    args = parse_args(argv)
+    
+    if args.diff:
+        return diff_main(args)
+    if args.search:
+        return search_main(args)
+    if args.watch:
+        return watch_main(args)
+    if args.all or args.project:
+        return batch_main(args)
     
     print("="*60)
     print("🎯 PROJECT SNAPSHOT DEBUGGER v5.1.0")
@@ -56,14 +268,15 @@ def main():
     if choice.isdigit():
         idx = int(choice) - 1
         if 0 <= idx < len(projects):
-            explore(str(projects[idx]))
+            explore(str(projects[idx]), workers=args.workers, token_budget=args.token_budget,
+                    profile=args.profile)
         else:
             print("❌ Invalid project number!")
     else:
         print("❌ Invalid choice!")
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
 
 # The lights are green, and they're off!
 # And remember, life isn't always Gung, Gung, Woo!
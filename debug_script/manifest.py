@@ -0,0 +1,155 @@
+# manifest.py | Version: 5.2.0
+# Persistent per-export manifest for incremental snapshots.
+# Lives next to the snapshot in Debug/<project>/ and remembers, for every
+# exported file, its size, mtime_ns, st_mode and content hash. The entries
+# themselves are not copied: a reused entry is read back from the previous
+# snapshot through its .idx (snapshot_index), one seek per file, so neither
+# the manifest file nor memory grows with the project's content.
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from config import MAX_FILE_BYTES, LARGE_FILE_POLICY
+from snapshot_index import SnapshotIndex
+
+# Bump whenever build_entry would produce different output for the same
+# file (new skeleton rules, new entry keys...). Old manifests are then ignored.
+MANIFEST_VERSION = 7
+
+# Filesystems with coarse timestamps (FAT: 2s) can hide an edit made in the
+# same tick the manifest was recorded; such entries are re-hashed, not trusted.
+RACY_WINDOW_NS = 2_000_000_000
+
+def manifest_path_for(output_file):
+    """Debug/<project>/<name>_snapshot.json -> <name>_snapshot.json.manifest"""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + '.manifest')
+
+def _settings():
+    """Config that changes entries without changing files: a new value invalidates the manifest"""
+    return {'max_file_bytes': MAX_FILE_BYTES, 'large_file_policy': LARGE_FILE_POLICY}
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+class Manifest:
+    """Stat/hash records keyed by relative path; entries come from the previous snapshot"""
+
+    def __init__(self, path, export_mode, snapshot_file):
+        self.path = Path(path)
+        self.export_mode = export_mode
+        self.snapshot_file = Path(snapshot_file)
+        self.started_ns = time.time_ns()
+        self.previous = {}
+        self.previous_started_ns = 0
+        self.snapshot = None
+        self._lock = threading.Lock()     # Reader threads share the snapshot's file handles
+        self.current = {}
+        self.reused = []
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (data.get('version') != MANIFEST_VERSION or data.get('export_mode') != self.export_mode
+                or data.get('settings') != _settings()):
+            return
+        # Only the very snapshot this manifest was saved with (not a later
+        # --token-budget or watch rewrite) may hand out entries
+        if data.get('snapshot') is None or data['snapshot'] != _stamp(self.snapshot_file):
+            return
+        try:
+            self.snapshot = SnapshotIndex(self.snapshot_file)
+        except (OSError, ValueError):
+            return
+        self.previous = data.get('files', {})
+        self.previous_started_ns = data.get('started_ns', 0)
+
+    def _entry(self, rel_path):
+        try:
+            with self._lock:
+                return self.snapshot.get(rel_path)
+        except (KeyError, OSError, ValueError):
+            return None
+
+    def close(self):
+        """Let go of the previous snapshot (before it gets replaced)"""
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
+
+    # ────────────────────────
+    # LOOKUPS
+    # ────────────────────────
+
+    def by_stat(self, rel_path, st):
+        """Cached entry when size, mtime and mode all match, else None"""
+        record = self.previous.get(rel_path)
+        if record is None:
+            return None
+        if (record['size'] != st.st_size or record['mtime_ns'] != st.st_mtime_ns
+                or record['mode'] != st.st_mode):
+            return None
+        if record['mtime_ns'] >= self.previous_started_ns - RACY_WINDOW_NS:
+            return None
+        entry = self._entry(rel_path)
+        if entry is None:
+            return None
+        self.current[rel_path] = record
+        self.reused.append(rel_path)
+        return entry
+
+    def by_hash(self, rel_path, digest, st):
+        """Cached entry when the content is unchanged despite a new stat"""
+        record = self.previous.get(rel_path)
+        if record is None or record['hash'] != digest:
+            return None
+        entry = self._entry(rel_path)
+        if entry is None:
+            return None
+        self.record(rel_path, st, digest)
+        self.reused.append(rel_path)
+        return entry
+
+    def keep(self, rel_path):
+        """Carry an unchanged file's record over (its entry is still held by the caller)"""
+        record = self.previous.get(rel_path)
+        if record is not None:
+            self.current[rel_path] = record
+
+    def record(self, rel_path, st, digest):
+        self.current[rel_path] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'mode': st.st_mode,
+            'hash': digest
+        }
+
+    # ────────────────────────
+    # PERSISTENCE
+    # ────────────────────────
+
+    def save(self):
+        """Atomically replace the manifest with this run's records (snapshot and .idx already written)"""
+        self.close()
+        data = {
+            'version': MANIFEST_VERSION,
+            'export_mode': self.export_mode,
+            'settings': _settings(),
+            'started_ns': self.started_ns,
+            'snapshot': _stamp(self.snapshot_file),
+            'files': self.current
+        }
+        part_file = self.path.with_name(self.path.name + '.part')
+        with open(part_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(part_file, self.path)
@@ -0,0 +1,97 @@
+# profiling.py | Version: 5.2.0
+# Export instrumentation: per-phase timers, counters and the slowest files.
+# Off unless asked for (--profile / PROFILE_EXPORTS): every hook sits behind
+# an `if profile is not None`, so a normal export pays one comparison per
+# call site. When on, the export also runs under cProfile and the pstats
+# dump lands next to the snapshot (<name>.json.prof). With --workers > 1,
+# read/skeletonize times are summed over the reader threads.
+
+import heapq
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+SLOWEST_FILES = 10
+
+def profile_path_for(output_file):
+    """Debug/<project>/<name>_snapshot.json -> <name>_snapshot.json.prof"""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + '.prof')
+
+class ExportProfile:
+    """Timers and counters of one export; safe to feed from reader threads"""
+
+    def __init__(self, slowest=SLOWEST_FILES):
+        self.slowest = slowest
+        self.phases = defaultdict(float)      # phase -> seconds
+        self.counters = defaultdict(int)
+        self.skipped_by = defaultdict(int)    # walker rule -> entries pruned
+        self._slowest = []                    # min-heap of (seconds, rel_path)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        with self._lock:
+            self.phases[name] += seconds
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def skipped(self, rule):
+        with self._lock:
+            self.skipped_by[rule] += 1
+
+    def file_done(self, rel_path, seconds):
+        with self._lock:
+            if len(self._slowest) < self.slowest:
+                heapq.heappush(self._slowest, (seconds, rel_path))
+            elif seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, (seconds, rel_path))
+
+    def timed(self, iterable, name):
+        """Iterate, charging the time spent producing items to phase `name`"""
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_time(name, time.perf_counter() - start)
+                return
+            self.add_time(name, time.perf_counter() - start)
+            yield item
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                'phases': {name: round(seconds, 4) for name, seconds in self.phases.items()},
+                'counters': dict(self.counters),
+                'skipped_by': dict(self.skipped_by),
+                'slowest_files': [{'path': path, 'seconds': round(seconds, 4)}
+                                  for seconds, path in sorted(self._slowest, reverse=True)]
+            }
+
+def print_profile(profile):
+    """Pretty-print the `profile` dict of an export's stats"""
+    print("⏱️  Phases:")
+    for name, seconds in sorted(profile['phases'].items(), key=lambda kv: -kv[1]):
+        print(f"    {name:<12} {seconds:8.3f}s")
+    counters = profile['counters']
+    if counters:
+        print("🔢 " + ", ".join(f"{name}: {value:,}" for name, value in sorted(counters.items())))
+    if profile['skipped_by']:
+        print("🚫 Skipped by " + ", ".join(f"{rule}: {n:,}" for rule, n in sorted(profile['skipped_by'].items())))
+    if profile['slowest_files']:
+        print("🐢 Slowest files:")
+        for slow in profile['slowest_files']:
+            print(f"    {slow['seconds'] * 1000:8.1f}ms  {slow['path']}")
@@ -0,0 +1,83 @@
+# progress.py | Version: 5.2.0
+# Live progress for long exports: files done / total, files/s, MB/s, ETA.
+# The total comes from a quick walk, which the export then reuses instead
+# of walking again. Redraws are rate-limited
+# (one clock read per file), so the terminal never slows the export down.
+
+import sys
+import time
+
+REDRAW_SECONDS = 0.25          # In-place redraws on a terminal
+LOG_LINE_SECONDS = 5.0         # One full line this often when piped/logged
+
+def _clock(seconds):
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60}:{rest % 60:02d}"
+
+class ExportProgress:
+    """Call start() once the totals are known, advance() per file, finish() at the end"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.tty = self.stream.isatty()
+        self.interval = REDRAW_SECONDS if self.tty else LOG_LINE_SECONDS
+        self.total_files = 0
+        self.total_bytes = 0
+        self.files = 0
+        self.bytes = 0
+        self._started = None
+        self._next_draw = 0.0
+        self._width = 0
+
+    def start(self, total_files, total_bytes):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self._started = time.monotonic()
+        self._next_draw = self._started + self.interval
+
+    def advance(self, nbytes):
+        self.files += 1
+        self.bytes += nbytes
+        now = time.monotonic()
+        if now >= self._next_draw:
+            self._next_draw = now + self.interval
+            self._draw(now)
+
+    def line(self, now=None):
+        """Returns: the current status line"""
+        elapsed = max((now or time.monotonic()) - self._started, 1e-9)
+        files_rate = self.files / elapsed
+        mb_rate = self.bytes / elapsed / (1024 * 1024)
+        # Bytes predict the remaining time better than files of mixed sizes
+        if self.total_bytes and self.bytes:
+            eta = (self.total_bytes - self.bytes) * elapsed / self.bytes
+        elif self.files:
+            eta = (self.total_files - self.files) * elapsed / self.files
+        else:
+            eta = None
+        percent = 100 * self.files / self.total_files if self.total_files else 100.0
+        return (f"⏳ {self.files:,}/{self.total_files:,} files ({percent:.0f}%) · "
+                f"{files_rate:,.0f} files/s · {mb_rate:.1f} MB/s · "
+                f"ETA {_clock(max(eta, 0)) if eta is not None else '?'}")
+
+    def _draw(self, now):
+        text = self.line(now)
+        if self.tty:
+            # Pad over the previous, possibly longer, line
+            self.stream.write('\r' + text.ljust(self._width))
+            self._width = len(text)
+        else:
+            self.stream.write(text + '\n')
+        self.stream.flush()
+
+    def finish(self, cancelled=False):
+        if self._started is None:
+            return
+        if self.tty and self._width:
+            self.stream.write('\r' + ' ' * self._width + '\r')
+        elapsed = time.monotonic() - self._started
+        verb = 'Cancelled after' if cancelled else 'Processed'
+        self.stream.write(f"{'🛑' if cancelled else '📦'} {verb} {self.files:,}/{self.total_files:,} files "
+                          f"({self.bytes / (1024 * 1024):.1f} MB) in {_clock(elapsed)}\n")
+        self.stream.flush()
@@ -0,0 +1,276 @@
+# skeleton_dart.py | Version: 5.2.0
+# Structural blueprint engine for .dart files.
+# A single forward scan that understands braces, strings (raw, triple-quoted,
+# ${...} interpolation) and nested comments. Keeps class/mixin/extension/enum
+# declarations, every member signature (generic methods, getters, setters,
+# constructors, fields) and doc comments; bodies collapse to `{ ... }`.
+# The scan jumps between special characters with regexes, so it stays linear.
+
+import re
+
+# ─────────────────────────────────────────────────
+# 🧩 LEXING
+# ─────────────────────────────────────────────────
+
+# What matters in a declaration scope / inside a skipped body
+_SCOPE_CHARS = re.compile(r'[{}()\[\];=\'"/]')
+_BODY_CHARS = re.compile(r'[{}\'"/]')
+_BLOCK_COMMENT = re.compile(r'/\*|\*/')
+
+_STRING_STOPS = {}
+
+def _string_stop(delim, raw):
+    key = (delim, raw)
+    if key not in _STRING_STOPS:
+        parts = [re.escape(delim)]
+        if not raw:
+            parts[:0] = [r'\\', r'\$\{']
+        if len(delim) == 1:
+            parts.append('\n')
+        _STRING_STOPS[key] = re.compile('|'.join(parts))
+    return _STRING_STOPS[key]
+
+def _string_end(src, i):
+    """Index just past the string literal opening at src[i]"""
+    quote = src[i]
+    raw = i > 0 and src[i - 1] in 'rR' and (i < 2 or not (src[i - 2].isalnum() or src[i - 2] in '_$'))
+    delim = quote * 3 if src.startswith(quote * 3, i) else quote
+    stop = _string_stop(delim, raw)
+    j = i + len(delim)
+    while True:
+        m = stop.search(src, j)
+        if m is None:
+            return len(src)
+        token = m.group()
+        if token == '\\':
+            j = m.end() + 1
+        elif token == '${':
+            j = _block_end(src, m.end())
+        elif token == '\n':
+            return m.start()      # Unterminated: give up at the end of the line
+        else:
+            return m.end()
+
+def _comment_end(src, i):
+    """Index past the comment at src[i] ('/'), or i + 1 for a plain slash"""
+    nxt = src[i + 1:i + 2]
+    if nxt == '/':
+        end = src.find('\n', i)
+        return len(src) if end == -1 else end
+    if nxt != '*':
+        return i + 1
+    # Dart block comments nest
+    depth, j = 1, i + 2
+    while depth:
+        m = _BLOCK_COMMENT.search(src, j)
+        if m is None:
+            return len(src)
+        depth += 1 if m.group() == '/*' else -1
+        j = m.end()
+    return j
+
+def _block_end(src, i):
+    """i is just past a '{'; returns the index just past its matching '}'"""
+    depth = 1
+    while True:
+        m = _BODY_CHARS.search(src, i)
+        if m is None:
+            return len(src)
+        c, p = m.group(), m.start()
+        if c == '{':
+            depth += 1
+            i = p + 1
+        elif c == '}':
+            depth -= 1
+            i = p + 1
+            if depth == 0:
+                return i
+        elif c == '/':
+            i = _comment_end(src, p)
+        else:
+            i = _string_end(src, p)
+
+# ─────────────────────────────────────────────────
+# 🏷️ DECLARATIONS
+# ─────────────────────────────────────────────────
+
+_TYPE_DECL = re.compile(
+    r'(?:(?:abstract|base|final|interface|sealed|augment|macro)\s+)*'
+    r'(?:mixin\s+)?(?:class|mixin|enum|extension)\b'
+)
+_ANNOTATION = re.compile(r'@[\w$.]+\s*')
+_LEADING_COMMENT = re.compile(r'(?://[^\n]*|/\*.*?\*/)\s*', re.S)
+_DIRECTIVES = ('import ', 'export ', 'part ')
+
+def _strip_annotations(header):
+    """'@Foo(1) @bar class X' -> 'class X'"""
+    while True:
+        m = _LEADING_COMMENT.match(header)
+        if m:
+            header = header[m.end():]
+            continue
+        m = _ANNOTATION.match(header)
+        if not m:
+            return header
+        header = header[m.end():]
+        if header.startswith('('):
+            depth = 0
+            for k, c in enumerate(header):
+                depth += (c == '(') - (c == ')')
+                if depth == 0:
+                    header = header[k + 1:].lstrip()
+                    break
+            else:
+                return ''
+
+def _is_type_declaration(header):
+    return _TYPE_DECL.match(_strip_annotations(header)) is not None
+
+def _line_indent(src, i, fallback=''):
+    """Whitespace before src[i] on its line, or fallback when i isn't first on it"""
+    start = src.rfind('\n', 0, i) + 1
+    prefix = src[start:i]
+    return prefix if not prefix.strip() else fallback
+
+# ─────────────────────────────────────────────────
+# 🎯 SCANNER
+# ─────────────────────────────────────────────────
+
+class _Scanner:
+    def __init__(self, src):
+        self.src = src
+        self.out = []
+        self.imports = []
+
+    def emit(self, start, text, gap, indent):
+        # One blank line where the source had at least one
+        if gap.count('\n') >= 2 and self.out and self.out[-1] != '':
+            self.out.append('')
+        self.out.append(_line_indent(self.src, start, indent) + text)
+
+    def scope(self, i, indent=None):
+        """Emit the declarations of one scope; returns the index past its '}'"""
+        src = self.src
+        top = indent is None
+        indent = '' if top else indent + '  '   # For members sharing a line with `{`
+        last = i                  # end of the previous statement
+        gap = i                   # ... or of the last thing emitted
+        paren = 0
+        assign = arrow = None     # positions of a top-level '=' / '=>'
+        opened = False            # a '(' was met at depth 0 (params, not an initializer)
+
+        def start_of(p):
+            return len(src[last:p]) - len(src[last:p].lstrip()) + last
+
+        while True:
+            m = _SCOPE_CHARS.search(src, i)
+            if m is None:
+                self.flush(last, len(src), assign, arrow, gap, indent)
+                return len(src)
+            c, p = m.group(), m.start()
+            i = p + 1
+
+            if c in '\'"':
+                i = _string_end(src, p)
+            elif c == '/':
+                i = _comment_end(src, p)
+                if i > p + 1 and paren == 0 and not src[last:p].strip():
+                    # A comment between statements: doc comments stay, the rest go
+                    if src.startswith(('///', '/**'), p) and not src.startswith('/**/', p):
+                        self.emit(p, src[p:i], src[gap:p], indent)
+                        gap = i
+                    last = i
+            elif c in '([':
+                paren += 1
+                opened = opened or (c == '(' and assign is None and arrow is None)
+            elif c in ')]':
+                paren = max(paren - 1, 0)
+            elif paren:
+                if c == '{':
+                    i = _block_end(src, i)     # Named parameters, closures in arguments
+            elif c == '=':
+                nxt = src[p + 1:p + 2]
+                prev = src[p - 1:p]
+                if nxt == '>':
+                    arrow = p if arrow is None else arrow
+                    i = p + 2
+                elif nxt == '=' or prev in ('=', '!', '<', '>', ']'):
+                    i = p + 2 if nxt == '=' else i      # Operators, `operator []=`
+                elif assign is None and arrow is None and not opened:
+                    assign = p
+            elif c == '{':
+                if assign is not None or arrow is not None:
+                    i = _block_end(src, i)     # Map/set literal or closure in an initializer
+                    continue
+                start = start_of(p)
+                header = src[start:p].rstrip()
+                if _is_type_declaration(header):
+                    self.emit(start, header + ' {', src[gap:start], indent)
+                    header_indent = _line_indent(src, start, indent)
+                    i = self.scope(i, header_indent)
+                    self.out.append(header_indent + '}')
+                else:
+                    self.emit(start, header + ' { ... }', src[gap:start], indent)
+                    i = _block_end(src, i)
+                last = gap = i
+                assign, arrow, opened = None, None, False
+            elif c == ';':
+                self.flush(last, i, assign, arrow, gap, indent)
+                last = gap = i
+                assign, arrow, opened = None, None, False
+            elif c == '}':
+                if top:
+                    last = gap = i         # Stray brace: keep going
+                    continue
+                self.flush(last, p, assign, arrow, gap, indent)
+                return i
+
+    def flush(self, last, end, assign, arrow, gap, indent):
+        """Emit the statement src[last:end] (';' included when present)"""
+        src = self.src
+        text = src[last:end].strip()
+        if not text:
+            return
+        start = end - len(src[last:end].lstrip())
+        if text.startswith(_DIRECTIVES):
+            self.imports.append(' '.join(text.split()))
+            return
+        if arrow is not None and (assign is None or arrow < assign):
+            text = src[start:arrow].rstrip() + ' => ...;'
+        elif assign is not None and '\n' in text:
+            # Multi-line initializers (route tables, themes...) collapse
+            text = src[start:assign].rstrip() + ' = ...;'
+        self.emit(start, text, src[gap:start], indent)
+
+# ─────────────────────────────────────────────────
+# 🧓 LAST RESORT: LINE PREFIXES
+# ─────────────────────────────────────────────────
+
+_SIGNALS = ('class ', 'abstract ', 'mixin ', 'extension ', 'enum ', 'void ', 'Future', 'Widget ', '@')
+
+def _skeletonize_lines(content):
+    skeleton_lines = []
+    imports = []
+    for line in content.split('\n'):
+        stripped = line.lstrip()
+        if stripped.startswith(_DIRECTIVES):
+            imports.append(stripped)
+        elif not stripped or stripped.startswith(_SIGNALS) or stripped.startswith('///'):
+            skeleton_lines.append(line)
+    return '\n'.join(skeleton_lines), imports
+
+# ─────────────────────────────────────────────────
+# 🚪 ENTRY POINT
+# ─────────────────────────────────────────────────
+
+def skeletonize_dart(content):
+    """
+    Returns: (processed_content, list_of_imports)
+    """
+    try:
+        scanner = _Scanner(content)
+        scanner.scope(0)
+    except RecursionError:
+        # Absurdly nested string interpolation
+        return _skeletonize_lines(content)
+    return '\n'.join(scanner.out), scanner.imports
@@ -0,0 +1,350 @@
+# skeleton_data.py | Version: 5.2.0
+# Blueprint engines for data-ish files: SQL, JSON and YAML.
+# SQL keeps the schema (DDL) and counts the data statements it drops;
+# JSON and YAML keep their key shape with arrays cut after a few items and
+# long strings shortened. Fixtures and migrations shrink to what matters.
+# JSON files too big to load (MAX_FILE_BYTES) are outlined straight from
+# disk by skeletonize_json_file, one chunk at a time.
+
+import json
+import re
+
+# How much of the data survives an outline
+OUTLINE_MAX_ITEMS = 3       # Array/sequence items kept
+OUTLINE_MAX_KEYS = 50       # Keys kept per object (dicts keyed by ids...)
+OUTLINE_MAX_STRING = 80     # Characters kept of a string value
+
+def _short(text):
+    return text if len(text) <= OUTLINE_MAX_STRING else text[:OUTLINE_MAX_STRING] + '…'
+
+# ─────────────────────────────────────────────────
+# 🗄️ SQL
+# ─────────────────────────────────────────────────
+# Statements are split on `;` outside quotes, $$-bodies and comments.
+# pg_dump `COPY ... FROM stdin;` data blocks (ended by `\.`) are skipped.
+
+_SQL_STOPS = re.compile(r"""[;'"]|--|/\*|\$[A-Za-z_]*\$""")
+_SQL_WORDS = re.compile(r'[A-Za-z_]+')
+_DDL = {'CREATE', 'ALTER', 'DROP', 'COMMENT', 'RENAME', 'TRUNCATE'}
+# CREATE <kind> whose body is code, not schema: keep the signature only
+_CODE_OBJECTS = {'FUNCTION', 'PROCEDURE', 'TRIGGER', 'VIEW', 'RULE'}
+_CODE_BODY = re.compile(r'\s(?:AS|BEGIN)\b|\$[A-Za-z_]*\$', re.I)
+_COPY_STDIN = re.compile(r'\s*COPY\b.*\bFROM\s+stdin\s*$', re.I | re.S)
+
+def _sql_statements(content):
+    """Yield statements (without their ';'), comments between them dropped"""
+    i, start, n = 0, 0, len(content)
+    while i < n:
+        m = _SQL_STOPS.search(content, i)
+        if m is None:
+            break
+        token, p = m.group(), m.start()
+        if token == ';':
+            statement = content[start:p]
+            yield statement
+            i = start = p + 1
+            if _COPY_STDIN.match(statement):
+                end = content.find('\n\\.', i)
+                i = start = n if end == -1 else end + 3
+        elif token == '--':
+            end = content.find('\n', p)
+            i = n if end == -1 else end
+            if not content[start:p].strip():
+                start = i
+        elif token == '/*':
+            end = content.find('*/', p + 2)
+            i = n if end == -1 else end + 2
+            if not content[start:p].strip():
+                start = i
+        elif token[0] == '$':
+            end = content.find(token, m.end())
+            i = n if end == -1 else end + len(token)
+        else:
+            end = p + 1
+            while True:
+                end = content.find(token, end)
+                if end == -1 or content[end + 1:end + 2] != token:
+                    break
+                end += 2        # '' escapes a quote
+            i = n if end == -1 else end + 1
+    if content[start:].strip():
+        yield content[start:]
+
+def skeletonize_sql(content):
+    """
+    Returns: (processed_content, list_of_imports)
+    """
+    kept = []
+    dropped = {}
+    for statement in _sql_statements(content):
+        statement = statement.strip()
+        words = [w.upper() for w in _SQL_WORDS.findall(statement[:200])[:6]]
+        if not words:
+            continue
+        if words[0] not in _DDL:
+            dropped[words[0]] = dropped.get(words[0], 0) + 1
+            continue
+        if words[0] == 'CREATE' and _CODE_OBJECTS.intersection(words[1:5]):
+            body = _CODE_BODY.search(statement)
+            if body is not None:
+                statement = statement[:body.end()].rstrip() + ' ...'
+        kept.append(statement + ';')
+    if dropped:
+        counts = ', '.join(f"{count} {verb}" for verb, count in sorted(dropped.items()))
+        kept.append(f"-- omitted: {counts}")
+    return '\n\n'.join(kept), []
+
+# ─────────────────────────────────────────────────
+# 🧾 JSON
+# ─────────────────────────────────────────────────
+
+def _outline(value):
+    if isinstance(value, dict):
+        keys = list(value)
+        out = {key: _outline(value[key]) for key in keys[:OUTLINE_MAX_KEYS]}
+        if len(keys) > OUTLINE_MAX_KEYS:
+            out['…'] = f"{len(keys) - OUTLINE_MAX_KEYS} more keys"
+        return out
+    if isinstance(value, list):
+        out = [_outline(item) for item in value[:OUTLINE_MAX_ITEMS]]
+        if len(value) > OUTLINE_MAX_ITEMS:
+            out.append(f"… {len(value) - OUTLINE_MAX_ITEMS} more items")
+        return out
+    if isinstance(value, str):
+        return _short(value)
+    return value
+
+def skeletonize_json(content):
+    """
+    Returns: (processed_content, list_of_imports)
+    """
+    try:
+        return json.dumps(_outline(json.loads(content)), indent=2, ensure_ascii=False), []
+    except ValueError:
+        pass
+    # JSON Lines: outline the first records, count the rest
+    lines = [line for line in content.split('\n') if line.strip()]
+    try:
+        head = [json.dumps(_outline(json.loads(line)), ensure_ascii=False) for line in lines[:OUTLINE_MAX_ITEMS]]
+    except ValueError:
+        return content, []      # Not JSON after all (comments, templates): leave it
+    if len(lines) > OUTLINE_MAX_ITEMS:
+        head.append(f"// … {len(lines) - OUTLINE_MAX_ITEMS} more lines")
+    return '\n'.join(head), []
+
+# Streaming twin of skeletonize_json: same outline, but only what the outline
+# keeps is ever decoded. Everything else is skipped by regex (brackets
+# counted, strings stepped over whole), so memory stays at a chunk or two.
+
+_READ_CHUNK = 1 << 20
+_BLANK = re.compile(r'[ \t\r\n]*')
+_BARE = re.compile(r'[-+.\w]*')
+# A whole string, else a bracket, else a string cut at the end of the buffer
+_STRUCTURE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]|"')
+
+class _JsonOutliner:
+    def __init__(self, fh):
+        self.fh = fh
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Read more (at least as much as is buffered: one huge value isn't re-scanned endlessly)"""
+        if self.eof:
+            return False
+        chunk = self.fh.read(max(_READ_CHUNK, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf, self.pos = self.buf[self.pos:] + chunk, 0
+        return True
+
+    def peek(self):
+        """Next non-blank character ('' at end of file)"""
+        while True:
+            self.pos = _BLANK.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def _next(self, closing):
+        """Consume ',' (True: more to come) or `closing` (False)"""
+        char = self.peek()
+        self.pos += 1
+        if char == closing:
+            return False
+        if char != ',':
+            raise ValueError(f"Expected ',' or {closing!r}")
+        return True
+
+    def scalar(self):
+        """A string, number or literal, decoded whole"""
+        self.peek()
+        while True:
+            # A number or literal cut at the end of the buffer ("0." of "0.5")
+            # would decode too early: read on until something follows it
+            if self.buf[self.pos:self.pos + 1] != '"' and not self.eof \
+                    and _BARE.match(self.buf, self.pos).end() == len(self.buf):
+                self._fill()
+                continue
+            try:
+                value, self.pos = self.decoder.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def skip(self):
+        """Step over one value without building it"""
+        if self.peek() not in ('[', '{'):
+            self.scalar()
+            return
+        depth = 0
+        while True:
+            found = _STRUCTURE.search(self.buf, self.pos)
+            if found is None or found.group() == '"':
+                # Nothing left in the buffer, or a string running past its end
+                self.pos = len(self.buf) if found is None else found.start()
+                if not self._fill():
+                    raise ValueError("Unexpected end of JSON")
+                continue
+            self.pos = found.end()
+            token = found.group()
+            if token in ('[', '{'):
+                depth += 1
+            elif token in (']', '}'):
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def outline(self):
+        """_outline() of the next value, read from the stream"""
+        char = self.peek()
+        if char == '{':
+            self.pos += 1
+            out, count = {}, 0
+            if self.peek() == '}':
+                self.pos += 1
+                return out
+            more = True
+            while more:
+                key = self.scalar()
+                if not isinstance(key, str) or self.peek() != ':':
+                    raise ValueError("Expected an object key")
+                self.pos += 1
+                if count < OUTLINE_MAX_KEYS:
+                    out[key] = self.outline()
+                else:
+                    self.skip()
+                count += 1
+                more = self._next('}')
+            if count > OUTLINE_MAX_KEYS:
+                out['…'] = f"{count - OUTLINE_MAX_KEYS} more keys"
+            return out
+        if char == '[':
+            self.pos += 1
+            out, count = [], 0
+            if self.peek() == ']':
+                self.pos += 1
+                return out
+            more = True
+            while more:
+                if count < OUTLINE_MAX_ITEMS:
+                    out.append(self.outline())
+                else:
+                    self.skip()
+                count += 1
+                more = self._next(']')
+            if count > OUTLINE_MAX_ITEMS:
+                out.append(f"… {count - OUTLINE_MAX_ITEMS} more items")
+            return out
+        if char == '':
+            raise ValueError("Unexpected end of JSON")
+        value = self.scalar()
+        return _short(value) if isinstance(value, str) else value
+
+def _outline_json_lines(path):
+    head, count = [], 0
+    with open(path, encoding='utf-8') as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            if count < OUTLINE_MAX_ITEMS:
+                head.append(json.dumps(_outline(json.loads(line)), ensure_ascii=False))
+            count += 1
+    if count > OUTLINE_MAX_ITEMS:
+        head.append(f"// … {count - OUTLINE_MAX_ITEMS} more lines")
+    return '\n'.join(head)
+
+def skeletonize_json_file(path):
+    """
+    Outline a JSON (or JSON Lines) file of any size from disk.
+    Returns: (processed_content, list_of_imports), or None when it isn't JSON
+    """
+    try:
+        with open(path, encoding='utf-8') as fh:
+            reader = _JsonOutliner(fh)
+            outline = reader.outline()
+            single = reader.peek() == ''
+        if single:
+            return json.dumps(outline, indent=2, ensure_ascii=False), []
+        return _outline_json_lines(path), []
+    except (ValueError, RecursionError):
+        return None
+
+# ─────────────────────────────────────────────────
+# 📐 YAML
+# ─────────────────────────────────────────────────
+# Indentation-based, no parser needed: keys stay, sequences keep their first
+# items, block scalars (`key: |`) collapse to `...`.
+
+_BLOCK_SCALAR = re.compile(r':\s*[|>][-+0-9]*\s*(?:#.*)?$')
+
+def skeletonize_yaml(content):
+    """
+    Returns: (processed_content, list_of_imports)
+    """
+    out = []
+    items = {}          # indent -> sequence items seen at that indent
+    skip_deeper = None  # indent whose deeper lines are being dropped
+    omitted = {}        # indent -> items dropped from the running sequence
+
+    def close_sequences(indent, keep_level=False):
+        for level in sorted(items, reverse=True):
+            if level > indent or (level == indent and not keep_level):
+                if omitted.get(level):
+                    out.append(' ' * level + f"# … {omitted[level]} more items")
+                items.pop(level)
+                omitted.pop(level, None)
+
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        indent = len(line) - len(line.lstrip(' '))
+        if skip_deeper is not None:
+            if indent > skip_deeper[0]:
+                if skip_deeper[1] and not out[-1].endswith('...'):
+                    out.append(' ' * indent + '...')
+                continue
+            skip_deeper = None
+        if stripped in ('---', '...'):
+            close_sequences(-1)
+            out.append(stripped)
+            continue
+        is_item = stripped == '-' or stripped.startswith('- ')
+        close_sequences(indent, keep_level=is_item)
+        if is_item:
+            items[indent] = items.get(indent, 0) + 1
+            if items[indent] > OUTLINE_MAX_ITEMS:
+                omitted[indent] = omitted.get(indent, 0) + 1
+                skip_deeper = (indent, False)
+                continue
+        if _BLOCK_SCALAR.search(stripped):
+            out.append(line)
+            skip_deeper = (indent, True)
+            continue
+        out.append(' ' * indent + _short(stripped))
+    close_sequences(-1)
+    return '\n'.join(out), []
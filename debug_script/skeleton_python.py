@@ -0,0 +1,495 @@
+# skeleton_python.py | Version: 5.2.0
+# AST-based blueprint engine for .py files.
+# Emits exact (multi-line) signatures, every decorator, class fields and
+# full docstrings; function bodies collapse to `...`.
+# Files that don't parse fall back to a tokenize scan, then to line prefixes.
+
+import ast
+import gc
+import io
+import re
+import tokenize
+from typing import NamedTuple
+
+# ─────────────────────────────────────────────────
+# 🧩 HELPERS
+# ─────────────────────────────────────────────────
+
+_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_FIELDS = (ast.Assign, ast.AnnAssign, ast.AugAssign)
+_IMPORTS = (ast.Import, ast.ImportFrom)
+
+def _is_docstring(node):
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    )
+
+def _is_main_guard(node):
+    test = node.test
+    return (
+        isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Name)
+        and test.left.id == '__name__'
+    )
+
+def _is_gap_line(line):
+    stripped = line.lstrip()
+    return not stripped or stripped.startswith('#')
+
+def _join(text):
+    """Collapse a multi-line statement onto one line"""
+    return ' '.join(text.split()).replace('( ', '(').replace(' )', ')')
+
+def _join_import(text):
+    """One-line form of an import, comments dropped (imports hold no strings)"""
+    return _join('\n'.join(line.split('#', 1)[0] for line in text.split('\n')))
+
+def _segment(lines, node):
+    """ast.get_source_segment over already split lines (offsets are UTF-8 bytes)"""
+    first = lines[node.lineno - 1].encode('utf-8')
+    if node.end_lineno == node.lineno:
+        return first[node.col_offset:node.end_col_offset].decode('utf-8')
+    last = lines[node.end_lineno - 1].encode('utf-8')
+    return '\n'.join([first[node.col_offset:].decode('utf-8'), *lines[node.lineno:node.end_lineno - 1],
+                      last[:node.end_col_offset].decode('utf-8')])
+
+def _indent(lines, node):
+    """The indentation a node's line really uses (tabs stay tabs)"""
+    line = lines[node.lineno - 1]
+    prefix = line[:len(line) - len(line.lstrip())]
+    return prefix if len(prefix) == node.col_offset else ' ' * node.col_offset
+
+def _start(node):
+    """First line of a node, decorators included"""
+    decorators = getattr(node, 'decorator_list', None)
+    if decorators:
+        return decorators[0].lineno
+    return node.lineno
+
+def _collect_imports(stmts, lines, imports):
+    """Find imports anywhere in a statement tree (function bodies included)"""
+    for node in stmts:
+        if isinstance(node, _IMPORTS):
+            imports.append((node.lineno, _join_import(_segment(lines, node))))
+            continue
+        for field in ('body', 'orelse', 'finalbody', 'handlers', 'cases'):
+            children = getattr(node, field, None)
+            if children:
+                _collect_imports(children, lines, imports)
+
+# ─────────────────────────────────────────────────
+# 🌳 AST ENGINE
+# ─────────────────────────────────────────────────
+
+class _Emitter:
+    def __init__(self, lines, stubs):
+        self.lines = lines
+        self.stubs = stubs      # def line -> _Stub, for bodies pruned before parsing
+        self.out = []
+        self.imports = []
+
+    def imports_from(self, stmts):
+        _collect_imports(stmts, self.lines, self.imports)
+
+    def header(self, node):
+        """Decorators + signature, verbatim, up to the colon"""
+        lines = self.lines
+        first = _start(node)
+        body = node.body[0]
+        body_start = _start(body)
+        body_line = lines[body_start - 1]
+
+        if body_line[:body.col_offset].strip():
+            # Body shares a line with the signature: `def f(): return 1`
+            self.out.extend(lines[first - 1:body_start - 1])
+            self.out.append(body_line[:body.col_offset].rstrip() + ' ...')
+            return None
+
+        end = body_start - 1
+        while end > node.lineno and _is_gap_line(lines[end - 1]):
+            end -= 1
+        self.out.extend(lines[first - 1:end])
+        return end + 1
+
+    def statement(self, node, one_line=False):
+        lines = self.lines
+        if one_line and node.end_lineno > node.lineno:
+            self.out.append(lines[node.lineno - 1] + ' ...')
+        else:
+            self.out.extend(lines[node.lineno - 1:node.end_lineno])
+
+    def _keeps(self, node):
+        if isinstance(node, (_DEFS, _FIELDS)):
+            return True
+        if isinstance(node, ast.If) and _is_main_guard(node):
+            return True
+        if isinstance(node, (ast.If, ast.Try, ast.With)):
+            # Only worth a header when something inside survives
+            return any(isinstance(child, (_DEFS, _FIELDS)) for child in node.body)
+        return False
+
+    def gap(self, start, end):
+        """Blank and comment lines between statements, at most two blanks in a row"""
+        out = self.out
+        for line in self.lines[start - 1:end - 1]:
+            if not line.strip() and len(out) > 1 and not out[-1].strip() and not out[-2].strip():
+                continue
+            out.append(line)
+
+    def body(self, stmts, scope, start):
+        """Emit a module or class body, keeping comments between statements"""
+        lines = self.lines
+        prev_end = start
+        for node in stmts:
+            self.gap(prev_end, _start(node))
+            prev_end = node.end_lineno + 1
+
+            if node is stmts[0] and scope == 'module' and _is_docstring(node):
+                self.statement(node)
+                continue
+            if not self._keeps(node):
+                self.imports_from([node])
+                continue
+
+            if isinstance(node, _DEFS):
+                self.definition(node)
+            elif isinstance(node, _FIELDS):
+                self.statement(node, one_line=scope == 'module')
+            elif isinstance(node, ast.If) and _is_main_guard(node):
+                self.out.append(lines[node.lineno - 1])
+                self.out.append(_indent(lines, node.body[0]) + '...')
+                self.imports_from(node.body)
+            else:
+                # if/try/with holding definitions: header + what's inside
+                self.out.append(lines[node.lineno - 1])
+                self.body(node.body, scope, node.body[0].lineno)
+                for field in ('orelse', 'finalbody', 'handlers'):
+                    self.imports_from(getattr(node, field, None) or [])
+
+    def stub(self, node, stub):
+        """A def whose header, docstring and body were located by _prune_bodies"""
+        lines = self.lines
+        self.out.extend(lines[_start(node) - 1:stub.header_end])
+        if stub.doc_start:
+            self.gap(stub.header_end + 1, stub.doc_start)
+            self.out.extend(lines[stub.doc_start - 1:stub.doc_end])
+        if stub.placeholder:
+            self.out.append(stub.placeholder)
+
+    def definition(self, node):
+        stub = self.stubs.get(node.lineno)
+        if stub is not None:
+            self.stub(node, stub)
+            return
+
+        start = self.header(node)
+        if start is None:
+            return
+
+        body = node.body
+        rest = body
+        if _is_docstring(body[0]):
+            self.gap(start, body[0].lineno)
+            self.statement(body[0])
+            start = body[0].end_lineno + 1
+            rest = body[1:]
+
+        if isinstance(node, ast.ClassDef):
+            emitted = len(self.out)
+            self.body(rest, 'class', start)
+            if len(self.out) == emitted and rest:
+                # Nothing structural inside (`pass`, plain logic)
+                self.out.append(_indent(self.lines, body[0]) + '...')
+        elif rest:
+            self.out.append(_indent(self.lines, body[0]) + '...')
+            self.imports_from(rest)
+
+# ─────────────────────────────────────────────────
+# ✂️ BODY PRUNING (speed)
+# ─────────────────────────────────────────────────
+# Most AST nodes live inside function bodies we throw away anyway, so
+# bodies are blanked out by indentation before parsing. Line numbers are
+# preserved. Whenever a cut could be wrong (a triple quote in the body, which
+# may be an open string or just a quote inside another string), the untouched
+# source is parsed instead: a wrong cut can still parse and silently drop
+# whole functions. Bodies holding imports are left to the parser too, so
+# their imports come from the AST.
+
+_QUOTES = ('"""', "'''")
+_MAX_HEADER_LINES = 64
+_dedent_patterns = {}
+
+def _toggle_string(line, open_quote):
+    """Track whether a line leaves us inside a triple-quoted string"""
+    for quote in _QUOTES:
+        if quote in line and (open_quote is None or open_quote == quote):
+            if line.count(quote) % 2:
+                return None if open_quote else quote
+    return open_quote
+
+def _balanced(text):
+    return text.count('"""') % 2 == 0 and text.count("'''") % 2 == 0
+
+def _is_string_line(line):
+    """A one-line docstring, not `'...'.join(x)` or another expression"""
+    try:
+        return isinstance(ast.literal_eval(line.strip()), str)
+    except (ValueError, SyntaxError):
+        return False
+
+def _header_end(lines, i, indent):
+    """Index of the line closing a def header, or None when unsure"""
+    depth = 0
+    for j in range(i, min(i + _MAX_HEADER_LINES, len(lines))):
+        line = lines[j]
+        code = line.split('#', 1)[0]
+        if j > i:
+            # Continuation lines sit deeper than the def, bar closing brackets
+            stripped = code.lstrip()
+            if stripped and len(code) - len(stripped) <= indent and stripped[0] not in ')]}':
+                return None
+        depth += code.count('(') + code.count('[') + code.count('{')
+        depth -= code.count(')') + code.count(']') + code.count('}')
+        if depth <= 0:
+            return j if code.rstrip().endswith(':') else None
+    return None
+
+def _def_lines(content):
+    """Yield (line offset, indent) for every line opening a def"""
+    pos = content.find('def ')
+    while pos != -1:
+        line_start = content.rfind('\n', 0, pos) + 1
+        prefix = content[line_start:pos]
+        head = prefix.strip()
+        if not head or head == 'async':
+            yield line_start, len(prefix) - len(prefix.lstrip())
+        pos = content.find('def ', pos + 4)
+
+def _dedent_pattern(indent):
+    """Regex for the next code line indented at most `indent` columns"""
+    pattern = _dedent_patterns.get(indent)
+    if pattern is None:
+        pattern = re.compile(r'\n[ \t]{0,%d}[^ \t\n#]' % indent)
+        _dedent_patterns[indent] = pattern
+    return pattern
+
+def _block_end(content, lines, start, offset, indent):
+    """
+    Index just past the last code line of the block whose first line is
+    lines[start] (at character `offset`), or None when a triple-quoted
+    string makes the cut ambiguous.
+    """
+    if start >= len(lines):
+        return start
+    found = _dedent_pattern(indent).search(content, offset - 1)
+    if found:
+        stop = start + content.count('\n', offset, found.start()) + 1
+        block = content[offset:found.start()]
+    else:
+        stop = len(lines)
+        block = content[offset:]
+
+    if not _balanced(block):
+        # A string spilling past the dedent, or `"'''"` in plain code: can't tell
+        return None
+
+    # Trailing blanks/comments belong to whatever comes next
+    while stop > start and _is_gap_line(lines[stop - 1]):
+        stop -= 1
+    return stop
+
+def _docstring_end(lines, k, end):
+    """Index past the docstring starting at line k (the line is a string start)"""
+    quote = _toggle_string(lines[k], None)
+    k += 1
+    while quote is not None and k < end:
+        quote = _toggle_string(lines[k], quote)
+        k += 1
+    return k
+
+class _Stub(NamedTuple):
+    """Where a pruned def's pieces sit in the original source (1-based lines)"""
+    header_end: int
+    doc_start: int          # 0 when there is no docstring
+    doc_end: int
+    placeholder: str        # '<indent>...' when the body has code, else ''
+
+def _prune_bodies(content, lines):
+    """
+    Returns: (pruned_lines, stubs)
+    or (None, {}) when the source can't be pruned safely.
+    Each pruned def is reduced to `def _(): ...` so the parser builds a
+    handful of nodes for it; its real layout is kept in stubs.
+    """
+    pruned = list(lines)
+    stubs = {}
+    resume = 0
+    i = prev_offset = 0
+
+    for offset, indent in _def_lines(content):
+        i += content.count('\n', prev_offset, offset)
+        prev_offset = offset
+        if i < resume:
+            continue      # Nested inside a body that is already gone
+        line = lines[i]
+        if line.endswith(':') and '#' not in line and line.count('(') == line.count(')'):
+            j = i     # One-line signature, by far the most common case
+            body_offset = offset + len(line) + 1
+        else:
+            j = _header_end(lines, i, indent)
+            if j is None:
+                continue
+            body_offset = offset + sum(len(line) + 1 for line in lines[i:j + 1])
+        end = _block_end(content, lines, j + 1, body_offset, indent)
+        if end is None:
+            return None, {}
+        span = sum(map(len, lines[j + 1:end])) + end - j - 1
+        if 'import ' in content[body_offset:body_offset + span]:
+            continue      # Parsed whole: body imports come from the AST
+        resume = end
+
+        # Leading docstring (comments may sit above it)
+        k = j + 1
+        while k < end and _is_gap_line(lines[k]):
+            k += 1
+        doc_start = doc_end = 0
+        if k < end:
+            stripped = lines[k].lstrip().lstrip('rRbBuU')
+            if stripped.startswith(_QUOTES):
+                doc_start, k = k + 1, _docstring_end(lines, k, end)
+                doc_end = k
+            elif stripped[:1] in ('"', "'") and _is_string_line(lines[k]):
+                doc_start, doc_end, k = k + 1, k + 1, k + 1
+
+        placeholder = ''
+        for body in range(k, end):
+            stripped = lines[body].lstrip()
+            if stripped and stripped[0] != '#':
+                placeholder = lines[body][:len(lines[body]) - len(stripped)] + '...'
+                break
+
+        # `def _():` on the def line and `...` on its last line keeps every
+        # node's line span intact for the emitter
+        stub = 'async def _():' if lines[i].lstrip().startswith('async') else 'def _():'
+        pruned[i + 1:end] = [''] * (end - i - 1)
+        pruned[i] = lines[i][:indent] + stub
+        pruned[end - 1] = lines[i][:indent] + '    ...'
+        stubs[i + 1] = _Stub(j + 1, doc_start, doc_end, placeholder)
+
+    return pruned, stubs
+
+def _parse(lines):
+    """ast.parse with the cyclic GC paused (it only slows down node allocation)"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return ast.parse('\n'.join(lines))
+    finally:
+        if was_enabled:
+            gc.enable()
+
+def _skeletonize_ast(content):
+    lines = content.split('\n')
+    pruned, stubs = _prune_bodies(content, lines)
+    tree = None
+    if pruned is not None:
+        try:
+            tree = _parse(pruned)
+        except SyntaxError:
+            pass
+    if tree is None:
+        tree = _parse(lines)
+        stubs = {}
+
+    stmts = tree.body
+    if not stmts:
+        return content, []
+
+    emitter = _Emitter(lines, stubs)
+    emitter.body(stmts, 'module', 1)
+    # Trailing comments after the last statement
+    emitter.gap(stmts[-1].end_lineno + 1, len(lines) + 1)
+    emitter.imports.sort()
+    return '\n'.join(emitter.out), [text for _, text in emitter.imports]
+
+# ─────────────────────────────────────────────────
+# 🪛 TOKENIZE FALLBACK
+# ─────────────────────────────────────────────────
+# For files ast refuses (py2 leftovers, templates, half-edited code):
+# keep whole logical lines that open a def/class/decorator, standalone
+# strings (docstrings) and comments.
+
+_SKIPPED_TOKENS = {tokenize.INDENT, tokenize.DEDENT, tokenize.NL}
+_END_TOKENS = {tokenize.NEWLINE, tokenize.ENDMARKER}
+
+def _keeps_logical_line(tokens):
+    head = tokens[0].string
+    if head in ('def', 'class', '@'):
+        return True
+    if head == 'async' and len(tokens) > 1 and tokens[1].string == 'def':
+        return True
+    return all(tok.type == tokenize.STRING for tok in tokens)
+
+def _skeletonize_tokens(content):
+    lines = content.split('\n')
+    kept = set()
+    imports = []
+    logical = []
+
+    for tok in tokenize.generate_tokens(io.StringIO(content).readline):
+        if tok.type == tokenize.COMMENT:
+            if not logical:
+                kept.add(tok.start[0])
+            continue
+        if tok.type in _SKIPPED_TOKENS:
+            continue
+        if tok.type not in _END_TOKENS:
+            logical.append(tok)
+            continue
+        if logical:
+            start, end = logical[0].start[0], logical[-1].end[0]
+            if logical[0].string in ('import', 'from'):
+                imports.append(_join_import('\n'.join(lines[start - 1:end])))
+            elif _keeps_logical_line(logical):
+                kept.update(range(start, end + 1))
+            logical = []
+
+    out = [line for no, line in enumerate(lines, 1) if no in kept or not line.strip()]
+    return '\n'.join(out), imports
+
+# ─────────────────────────────────────────────────
+# 🧓 LAST RESORT: LINE PREFIXES
+# ─────────────────────────────────────────────────
+
+_SIGNALS = ('class ', 'def ', 'async def ', '@')
+
+def _skeletonize_lines(content):
+    skeleton_lines = []
+    imports = []
+    for line in content.split('\n'):
+        stripped = line.lstrip()
+        if stripped.startswith(('import ', 'from ')):
+            imports.append(stripped)
+        elif (not stripped or stripped.startswith(_SIGNALS) or stripped.startswith('#')
+                or '"""' in line or "'''" in line):
+            skeleton_lines.append(line)
+    return '\n'.join(skeleton_lines), imports
+
+# ─────────────────────────────────────────────────
+# 🚪 ENTRY POINT
+# ─────────────────────────────────────────────────
+
+def skeletonize_python(content):
+    """
+    Returns: (processed_content, list_of_imports)
+    """
+    try:
+        return _skeletonize_ast(content)
+    except (SyntaxError, ValueError, RecursionError):
+        pass
+    try:
+        return _skeletonize_tokens(content)
+    except (tokenize.TokenError, SyntaxError):
+        return _skeletonize_lines(content)
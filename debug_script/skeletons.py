@@ -0,0 +1,68 @@
+# skeletons.py | Version: 5.2.0
+# Skeletonizer registry: file extension -> blueprint engine.
+# An engine takes a file's text and returns (content, imports). Built-in
+# engines cover .py, .dart, .sql, .json and .yaml/.yml; anything else is
+# exported as is. Register your own with @register_skeletonizer('.ext'), in
+# a module listed in SKELETONIZER_PLUGINS so worker processes load it too.
+# A file engine (@register_file_skeletonizer) takes a path instead, and is
+# used for files over MAX_FILE_BYTES, which would otherwise be cut to size.
+
+import importlib
+from config import SKELETONIZER_PLUGINS
+
+_SKELETONIZERS = {}
+_FILE_SKELETONIZERS = {}
+
+def _registrar(registry, extensions, replace):
+    def register(func):
+        for ext in extensions:
+            ext = ext.lower() if ext.startswith('.') else '.' + ext.lower()
+            if ext in registry and not replace:
+                raise ValueError(f"A skeletonizer for {ext} is already registered (pass replace=True)")
+            registry[ext] = func
+        return func
+    return register
+
+def register_skeletonizer(*extensions, replace=False):
+    """Decorator: use the function as the blueprint engine for extensions"""
+    return _registrar(_SKELETONIZERS, extensions, replace)
+
+def register_file_skeletonizer(*extensions, replace=False):
+    """
+    Decorator: use the function for oversized files with these extensions.
+    It gets the path and returns (content, imports), or None to fall back
+    to LARGE_FILE_POLICY.
+    """
+    return _registrar(_FILE_SKELETONIZERS, extensions, replace)
+
+def get_skeletonizer(ext):
+    """Returns: the engine for ext, or None to export the file unchanged"""
+    return _SKELETONIZERS.get(ext.lower())
+
+def get_file_skeletonizer(ext):
+    """Returns: the engine that reads oversized ext files itself, or None"""
+    return _FILE_SKELETONIZERS.get(ext.lower())
+
+def registered_extensions():
+    return sorted(_SKELETONIZERS)
+
+# ─────────────────────────────────────────────────
+# 🧩 BUILT-INS + PLUGINS
+# ─────────────────────────────────────────────────
+
+from skeleton_python import skeletonize_python
+from skeleton_dart import skeletonize_dart
+from skeleton_data import skeletonize_sql, skeletonize_json, skeletonize_json_file, skeletonize_yaml
+
+register_skeletonizer('.py')(skeletonize_python)
+register_skeletonizer('.dart')(skeletonize_dart)
+register_skeletonizer('.sql')(skeletonize_sql)
+register_skeletonizer('.json')(skeletonize_json)
+register_file_skeletonizer('.json')(skeletonize_json_file)
+register_skeletonizer('.yaml', '.yml')(skeletonize_yaml)
+
+for _plugin in SKELETONIZER_PLUGINS:
+    try:
+        importlib.import_module(_plugin)
+    except Exception as e:
+        print(f"⚠️ Skeletonizer plugin {_plugin} failed to load: {e}")
@@ -0,0 +1,270 @@
+# snapshot_diff.py | Version: 5.2.0
+# Compares two snapshots of a project and reports added, removed and
+# modified files, with unified diffs of their content.
+# Both snapshots are streamed (one entry in memory at a time): the first pass
+# keeps a small signature per path, and only the files that changed are
+# kept whole. Reads every export flavor: plain/.gz/.xz, streaming or buffered,
+# dedup'd blobs and sharded indexes.
+# The result can also be written as a delta snapshot: just what changed,
+# ready to hand to an LLM that already has the older snapshot.
+
+import difflib
+import json
+from pathlib import Path
+from snapshot_writer import open_snapshot, open_writer
+from utils import content_hash
+
+READ_CHUNK = 1 << 20   # Characters read from the snapshot at a time
+
+# ─────────────────────────────────────────────────
+# 🌊 STREAMING READER
+# ─────────────────────────────────────────────────
+# Walks the top-level object of a snapshot document; `files` and `blobs`
+# are yielded element by element, every other key in one piece.
+
+class _JsonStream:
+    def __init__(self, fh):
+        self.fh = fh
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size=READ_CHUNK):
+        """Read at least `size` more characters. Returns: False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.fh.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos > READ_CHUNK:
+            self.buf, self.pos = self.buf[self.pos:], 0
+        self.buf += chunk
+        return True
+
+    def peek(self):
+        """Next non-blank character ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def take(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at character {self.pos} of the snapshot")
+        self.pos += 1
+
+    def value(self):
+        """Decode one whole JSON value, reading more until it is complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number cut at the end of the buffer would decode too early
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Grow geometrically so one huge value is not re-parsed endlessly
+            self._fill(max(READ_CHUNK, len(self.buf) - self.pos))
+
+    def items(self, close):
+        """Yield the elements of the array/object just opened, until `close`"""
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            following = self.peek()
+            self.pos += 1
+            if following == close:
+                return
+            if following != ',':
+                raise ValueError(f"Expected ',' or {close!r} at character {self.pos - 1} of the snapshot")
+
+def _events(path):
+    """Yield ('metadata'|'stats'|'shards'|..., value), ('file', entry) and ('blob', (digest, content))"""
+    with open_snapshot(path) as fh:
+        stream = _JsonStream(fh)
+        stream.take('{')
+        for key in stream.items('}'):
+            stream.take(':')
+            if key == 'files':
+                stream.take('[')
+                for entry in stream.items(']'):
+                    yield 'file', entry
+            elif key == 'blobs':
+                stream.take('{')
+                for digest in stream.items('}'):
+                    stream.take(':')
+                    yield 'blob', (digest, stream.value())
+            else:
+                yield key, stream.value()
+
+def _signature(entry):
+    """What makes two entries of the same path equal: content hash + every other field"""
+    digest = entry['blob'] if 'blob' in entry else content_hash(entry.get('content', ''))
+    rest = {key: value for key, value in entry.items() if key not in ('content', 'blob')}
+    return digest, json.dumps(rest, sort_keys=True, ensure_ascii=False)
+
+def scan_snapshot(path, keep=None):
+    """
+    One streaming pass over a snapshot (shards included).
+    `keep(entry, signature)` picks the entries to hold on to, content resolved.
+    Returns: (metadata, {path: signature}, {path: kept entry})
+    """
+    path = Path(path)
+    metadata, signatures, kept = {}, {}, {}
+    waiting = {}        # blob digest -> kept entries of this document sharing it
+    for kind, value in _events(path):
+        if kind == 'file':
+            signature = _signature(value)
+            signatures[value['path']] = signature
+            if keep is not None and keep(value, signature):
+                kept[value['path']] = value
+                if 'blob' in value:
+                    waiting.setdefault(value['blob'], []).append(value)
+        elif kind == 'blob':
+            # Blobs come after `files` in every writer, each shard with its own table
+            digest, content = value
+            for entry in waiting.pop(digest, ()):
+                entry['content'] = content
+                del entry['blob']
+        elif kind == 'metadata':
+            metadata = value
+        elif kind == 'shards':
+            for shard in value:
+                _, shard_signatures, shard_kept = scan_snapshot(path.parent / shard['file'], keep)
+                signatures.update(shard_signatures)
+                kept.update(shard_kept)
+    if waiting:
+        raise ValueError(f"{path}: {len(waiting)} blob(s) referenced but missing from the blobs table")
+    return metadata, signatures, kept
+
+# ─────────────────────────────────────────────────
+# 🔍 DIFF
+# ─────────────────────────────────────────────────
+
+class SnapshotDiff:
+    """Outcome of diff_snapshots; entries are the new side's, content resolved"""
+
+    def __init__(self, old_file, new_file, metadata):
+        self.old_file = Path(old_file)
+        self.new_file = Path(new_file)
+        self.metadata = metadata     # The new snapshot's
+        self.added = []              # New entries, new snapshot order
+        self.removed = []            # Paths, old snapshot order
+        self.modified = []           # (old entry, new entry), new snapshot order
+        self.unchanged = 0
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+    def counts(self):
+        return {'added': len(self.added), 'removed': len(self.removed),
+                'modified': len(self.modified), 'unchanged': self.unchanged}
+
+def diff_snapshots(old_file, new_file):
+    """Join two snapshots by path, three streaming passes, changed files only in memory"""
+    _, old, _ = scan_snapshot(old_file)
+
+    def changed(entry, signature):
+        return old.get(entry['path']) != signature
+    metadata, new, changes = scan_snapshot(new_file, keep=changed)
+
+    diff = SnapshotDiff(old_file, new_file, metadata)
+    # Third pass only for the old side of modified files
+    modified_paths = {path for path in changes if path in old}
+    old_entries = {}
+    if modified_paths:
+        _, _, old_entries = scan_snapshot(old_file, keep=lambda entry, _: entry['path'] in modified_paths)
+
+    for path, entry in changes.items():
+        if path in old:
+            diff.modified.append((old_entries[path], entry))
+        else:
+            diff.added.append(entry)
+    diff.removed = [path for path in old if path not in new]
+    diff.unchanged = len(new) - len(changes)
+    return diff
+
+def unified_diff(old_entry, new_entry, context=3):
+    """Returns: the unified diff of two entries' content ('' when only other fields changed)"""
+    path = new_entry['path']
+    return ''.join(difflib.unified_diff(
+        old_entry.get('content', '').splitlines(keepends=True),
+        new_entry.get('content', '').splitlines(keepends=True),
+        f"a/{path}", f"b/{path}", n=context
+    ))
+
+def _line_counts(patch):
+    added = removed = 0
+    for line in patch.splitlines():
+        if line.startswith('+') and not line.startswith('+++'):
+            added += 1
+        elif line.startswith('-') and not line.startswith('---'):
+            removed += 1
+    return added, removed
+
+# ─────────────────────────────────────────────────
+# 🖨️ REPORT
+# ─────────────────────────────────────────────────
+
+def print_diff(diff, stat_only=False, context=3):
+    """git-style listing, then every content diff unless stat_only"""
+    patches = [(new, unified_diff(old, new, context)) for old, new in diff.modified]
+    for entry in diff.added:
+        print(f"  + {entry['path']}")
+    for path in diff.removed:
+        print(f"  - {path}")
+    for entry, patch in patches:
+        if patch:
+            added, removed = _line_counts(patch)
+            print(f"  ~ {entry['path']} (+{added} -{removed})")
+        else:
+            print(f"  ~ {entry['path']} (metadata only)")
+
+    counts = diff.counts()
+    print(f"📊 {counts['added']} added, {counts['removed']} removed, {counts['modified']} modified, "
+          f"{counts['unchanged']} unchanged")
+
+    if not stat_only:
+        for _, patch in patches:
+            if patch:
+                print()
+                print(patch, end='' if patch.endswith('\n') else '\n')
+
+# ─────────────────────────────────────────────────
+# 🧾 DELTA SNAPSHOT
+# ─────────────────────────────────────────────────
+# Same {files, stats, metadata} document as an export, holding only the
+# changed files: added ones whole, modified ones as a `diff` against the
+# old snapshot (or whole with full_content). Removed paths go in metadata.
+
+def write_delta(diff, output_file, full_content=False, compact=False):
+    """Write the delta snapshot. Returns: its stats"""
+    writer = open_writer(output_file, streaming=True, compact=compact)
+    try:
+        for entry in diff.added:
+            writer.write(dict(entry, change='added'))
+        for old, new in diff.modified:
+            if full_content:
+                writer.write(dict(new, change='modified'))
+            else:
+                delta = {key: value for key, value in new.items() if key != 'content'}
+                delta['change'] = 'modified'
+                delta['diff'] = unified_diff(old, new)
+                writer.write(delta)
+
+        metadata = dict(diff.metadata, delta_of=diff.old_file.name, delta_to=diff.new_file.name,
+                        removed=diff.removed)
+        stats = dict(diff.counts(), total_files=len(diff.added) + len(diff.modified))
+        writer.close(metadata, stats)
+    except BaseException:
+        writer.abort()
+        raise
+    return stats
@@ -1,8 +1,34 @@
 # snapshot_export.py | Version: 5.2.0
+import codecs
+import cProfile
 import json
+import mmap
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
-from config import ALLOWED_EXTENSIONS, MODE_SKELETON, MODE_BLUEPRINT, IGNORED_FILES
-from utils import should_ignore_dir, find_bundle
+from config import (MODE_FULL, MODE_SKELETON, MODE_BLUEPRINT, STREAM_SNAPSHOTS, INCREMENTAL_EXPORTS, SHARD_SNAPSHOTS,
+                    COMPACT_JSON, DEDUP_CONTENT, MAX_FILE_BYTES, LARGE_FILE_POLICY, WRITE_IMPORT_GRAPH,
+                    PROFILE_EXPORTS, WRITE_SNAPSHOT_INDEX)
+from utils import find_bundle, content_hash, estimate_tokens
+from walker import walk_files
+from snapshot_writer import open_writer, COMPRESSED_SUFFIXES
+from snapshot_sqlite import SQLITE_SUFFIXES
+from snapshot_index import save_index
+from manifest import Manifest, manifest_path_for
+from skeletons import get_skeletonizer, get_file_skeletonizer
+from import_graph import ImportGraph, graph_path_for, closure_files
+from profiling import ExportProfile, profile_path_for
+
+_NOT_TIMED = nullcontext()
+
+MAX_CACHED_SKELETONS = 1024   # SkeletonCache entries; copies usually sit close in walk order
+
+def _untimed(name):
+    """Stand-in for ExportProfile.phase when profiling is off"""
+    return _NOT_TIMED
 
 def skeletonize(content: str, ext: str, filename: str | None = None):
     """
@@ -11,88 +37,459 @@ def skeletonize(content: str, ext: str, filename: str | None = None):
     if filename and filename.lower() == '__init__.py':
         return content, []
     
-    if ext not in {'.py', '.dart'}:
+    # 🌳 One engine per extension (see skeletons.py); unknown ones pass through
+    skeletonizer = get_skeletonizer(ext)
+    if skeletonizer is None:
         return content, []
+    return skeletonizer(content)
+
+class SkeletonCache:
+    """
+    Skeletons by content hash, shared by every export it is handed to
+    (workspace mode): a file copied across projects is skeletonized once.
+    Stands in for the skeleton process pool, which it owns when workers > 1
+    (started on the first skeleton, so full-mode exports never spawn it).
+    Least recently used skeletons are dropped past MAX_CACHED_SKELETONS.
+    """
+
+    def __init__(self, workers=1):
+        self.workers = workers
+        self.pool = None
+        self.hits = 0
+        self._futures = OrderedDict()   # key -> Future of (content, imports)
+        self._lock = threading.Lock()
+
+    def submit(self, fn, content, ext, filename=None):
+        key = (content_hash(content), ext, (filename or '').lower() == '__init__.py')
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self._futures.move_to_end(key)
+                self.hits += 1
+                return future
+            if self.workers > 1:
+                if self.pool is None:
+                    self.pool = ProcessPoolExecutor(max_workers=self.workers)
+                future = self._remember(key, self.pool.submit(fn, content, ext, filename))
+                return future
+            future = self._remember(key, Future())
+        # Inline (no pool): computed outside the lock, readers of the same key wait on the future
+        try:
+            future.set_result(fn(content, ext, filename))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _remember(self, key, future):
+        # Evicting a pending future is fine: whoever submitted it still holds it
+        self._futures[key] = future
+        if len(self._futures) > MAX_CACHED_SKELETONS:
+            self._futures.popitem(last=False)
+        return future
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+# ─────────────────────────────────────────────────
+# 🐘 OVERSIZED FILES
+# ─────────────────────────────────────────────────
+# Only the kept slices are ever decoded: the file is mapped, not read.
+
+class SkippedFile(Exception):
+    """A file deliberately left out of the snapshot (the message says why)"""
+
+def _decode_slice(data, from_middle=False):
+    """UTF-8 decode a byte slice cut at arbitrary offsets"""
+    if from_middle:
+        # Step over continuation bytes of a character cut in half
+        start = 0
+        while start < min(4, len(data)) and 0x80 <= data[start] <= 0xBF:
+            start += 1
+        data = data[start:]
+    # An incremental decoder holds back (drops) a trailing partial character
+    text = codecs.getincrementaldecoder('utf-8')().decode(data)
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+def read_oversized(path, size, max_bytes=MAX_FILE_BYTES, policy=LARGE_FILE_POLICY):
+    """
+    Returns: (content, truncated_info) for a file bigger than max_bytes
+    Raises SkippedFile under the 'skip' policy.
+    """
+    if policy == 'skip':
+        raise SkippedFile(f"{size:,} bytes > MAX_FILE_BYTES ({max_bytes:,})")
+    if policy not in ('truncate', 'sample'):
+        raise ValueError(f"Unknown LARGE_FILE_POLICY: {policy!r}")
     
-    lines = content.split('\n')
-    skeleton_lines = []
-    imports = []
+    with open(path, 'rb') as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if policy == 'truncate':
+            content = _decode_slice(mm[:max_bytes])
+        else:
+            half = max_bytes // 2
+            omitted = size - 2 * half
+            content = (_decode_slice(mm[:half])
+                       + f"\n\n... [{omitted:,} bytes omitted by snapshot] ...\n\n"
+                       + _decode_slice(mm[size - half:], from_middle=True))
     
-    for line in lines:
-        stripped = line.lstrip()
-        
-        # 🔗 Capture imports for the LLM's dependency map
-        if stripped.startswith(('import ', 'from ')):
-            imports.append(stripped)
-            continue
-        
-        # ✅ Keep structural signatures
-        signals = ['class ', 'def ', 'async def ', '@dataclass', '@property', 'void ', 'Future', 'Widget ']
-        if any(stripped.startswith(kw) for kw in signals):
-            skeleton_lines.append(line)
+    return content, {'policy': policy, 'original_bytes': size, 'kept_bytes': max_bytes}
+
+# ─────────────────────────────────────────────────
+# 📄 PER-FILE WORK
+# ─────────────────────────────────────────────────
+
+def build_entry(item, mode, skeleton_pool=None, manifest=None, profile=None):
+    """Read one walked file and turn it into a snapshot entry"""
+    if profile is None:
+        return _build_entry(item, mode, skeleton_pool, manifest, None, _untimed)
+    started = time.perf_counter()
+    entry = _build_entry(item, mode, skeleton_pool, manifest, profile, profile.phase)
+    profile.file_done(item.rel_path, time.perf_counter() - started)
+    return entry
+
+def _build_entry(item, mode, skeleton_pool, manifest, profile, timer):
+    # Cached by the walker's DirEntry on Windows, one stat() elsewhere
+    st = item.dir_entry.stat()
+    
+    if manifest is not None:
+        # ♻️ Unchanged size/mtime: reuse the last export without reading
+        cached = manifest.by_stat(item.rel_path, st)
+        if cached is not None:
+            return cached
+    
+    truncated = outlined = None
+    if st.st_size > MAX_FILE_BYTES and mode in [MODE_SKELETON, MODE_BLUEPRINT]:
+        # 📐 An engine that reads the file itself outlines all of it
+        # (cut to MAX_FILE_BYTES first, JSON wouldn't even parse)
+        file_skeletonizer = get_file_skeletonizer(item.ext)
+        if file_skeletonizer is not None:
+            with timer('skeletonize'):
+                outlined = file_skeletonizer(item.path)
+    with timer('read'):
+        if outlined is not None:
+            content = outlined[0]
+        elif st.st_size > MAX_FILE_BYTES:
+            content, truncated = read_oversized(item.path, st.st_size)
+        else:
+            with open(item.path, encoding='utf-8') as fh:
+                content = fh.read()
+    if profile is not None:
+        profile.count('bytes_read', truncated['kept_bytes'] if truncated else st.st_size)
+        profile.count('lines_processed', content.count('\n') + 1)
+    
+    if manifest is not None:
+        # Touched but identical content: still skip the skeleton pass
+        with timer('hash'):
+            digest = content_hash(content)
+        cached = manifest.by_hash(item.rel_path, digest, st)
+        if cached is not None:
+            return cached
+    
+    file_imports = []
+    
+    # If Blueprint mode, strip logic but save imports
+    if outlined is not None:
+        content, file_imports = outlined
+    elif mode in [MODE_SKELETON, MODE_BLUEPRINT]:
+        with timer('skeletonize'):
+            if skeleton_pool is None:
+                content, file_imports = skeletonize(content, item.ext, item.name)
+            else:
+                # CPU-bound, so it goes to another process while this thread waits
+                future = skeleton_pool.submit(skeletonize, content, item.ext, item.name)
+                content, file_imports = future.result()
+    
+    with timer('bundle'):
+        bundle = find_bundle(item.name)
+    entry = {
+        'path': item.rel_path, # Forward slashes for LLM compatibility
+        'bundle': bundle,
+        'language': item.ext[1:],
+        'content': content
+    }
+    
+    if file_imports:
+        entry['imports'] = file_imports
+    
+    if truncated:
+        entry['truncated'] = truncated
+    
+    if manifest is not None:
+        manifest.record(item.rel_path, st, digest)
+    
+    return entry
+
+def _settle(item, future):
+    try:
+        return item, future.result(), None
+    except Exception as e:
+        return item, None, e
+
+def _walk(project_path, walked, profile):
+    """The walk to export (walked if given), timed when profiling"""
+    if walked is None:
+        walked = walk_files(project_path, profile=profile)
+    return walked if profile is None else profile.timed(walked, 'walk')
+
+def iter_entries(project_path, mode, workers=1, manifest=None, walked=None, profile=None, skeleton_cache=None):
+    """
+    Yield (item, entry, error) for every exported file, in walk order.
+    With workers > 1, files are read on a thread pool and skeletonized on a
+    process pool; a bounded window of in-flight files keeps the order.
+    `walked` is an already walked FileEntry list (e.g. from a recent scan).
+    A `skeleton_cache` (SkeletonCache) replaces the process pool and is left running.
+    """
+    items = _walk(project_path, walked, profile)
+    if workers <= 1:
+        for item in items:
+            try:
+                yield item, build_entry(item, mode, skeleton_cache, manifest, profile), None
+            except Exception as e:
+                yield item, None, e
+        return
+    
+    needs_skeleton = mode in [MODE_SKELETON, MODE_BLUEPRINT] and skeleton_cache is None
+    readers = ThreadPoolExecutor(max_workers=workers)
+    skeleton_pool = ProcessPoolExecutor(max_workers=workers) if needs_skeleton else skeleton_cache
+    pending = deque()
+    try:
+        for item in items:
+            pending.append((item, readers.submit(build_entry, item, mode, skeleton_pool, manifest, profile)))
+            if len(pending) >= workers * 4:
+                yield _settle(*pending.popleft())
+        while pending:
+            yield _settle(*pending.popleft())
+    finally:
+        readers.shutdown(cancel_futures=True)
+        if needs_skeleton:
+            skeleton_pool.shutdown(cancel_futures=True)
+
+# ─────────────────────────────────────────────────
+# 🎯 TOKEN BUDGET
+# ─────────────────────────────────────────────────
+# Files are ranked by bundle (01_main before 99_unsorted, walk order inside
+# a bundle) and each gets the richest form that still fits the budget:
+# full content, then skeleton, then path only, then nothing. Every file is
+# read at most once, and only what was kept stays in memory.
+# Everything is measured as the writer lays it out (indentation included),
+# and the document around the entries is charged up front; the report itself
+# holds counts only (degraded entries say so in their own `degraded` key, and
+# skipped/truncated files are counted here instead of listed in the stats).
+
+def _entry_tokens(entry, compact=False):
+    if compact:
+        return estimate_tokens(',' + json.dumps(entry, ensure_ascii=False, separators=(',', ':')))
+    # Entries sit two levels deep, after ',\n    '
+    text = json.dumps(entry, ensure_ascii=False, indent=2)
+    return estimate_tokens(',\n    ' + text.replace('\n', '\n    '))
+
+def _document_tokens(project_path, mode, report, compact=False, metadata=None):
+    """The snapshot minus its entries: brackets, stats (with this report) and metadata"""
+    document = {'files': [], 'stats': {'total_files': 0, 'by_language': {}, 'token_budget': report},
+                'metadata': metadata or {'project_name': Path(project_path).name, 'mode': mode}}
+    if compact:
+        return estimate_tokens(json.dumps(document, ensure_ascii=False, separators=(',', ':')))
+    return estimate_tokens(json.dumps(document, ensure_ascii=False, indent=2))
+
+def _skeleton_entry(entry, item):
+    content, file_imports = skeletonize(entry['content'], item.ext, item.name)
+    skeleton = dict(entry, content=content)
+    if file_imports:
+        skeleton['imports'] = file_imports
+    return skeleton
+
+def _path_entry(entry):
+    return {key: value for key, value in entry.items() if key not in ('content', 'imports')}
+
+def iter_budgeted_entries(project_path, mode, budget, walked=None, report=None, profile=None, compact=False,
+                          metadata=None):
+    """
+    Yield (item, entry, error) like iter_entries, packed into `budget` tokens.
+    `report` (a dict) is filled with how many files were kept, degraded,
+    dropped, skipped and truncated. `metadata` is the document's, if known.
+    """
+    items = list(_walk(project_path, walked, profile))
+    ranked = sorted(range(len(items)), key=lambda i: find_bundle(items[i].name))
+    levels = ['full', 'skeleton', 'path'] if mode == MODE_FULL else ['skeleton', 'path']
+    
+    report = {} if report is None else report
+    report.update({'budget': budget, 'estimated_tokens': 0})
+    report.update({level: 0 for level in ('full', 'skeleton', 'path', 'dropped', 'skipped', 'truncated')})
+    remaining = budget - _document_tokens(project_path, mode, report, compact, metadata)
+    results = [None] * len(items)
+    timer = profile.phase if profile is not None else _untimed
+    
+    for i in ranked:
+        item = items[i]
+        try:
+            entry = build_entry(item, MODE_FULL, profile=profile)   # The one and only read
+        except Exception as e:
+            if isinstance(e, SkippedFile):
+                report['skipped'] += 1
+            results[i] = (None, e)
             continue
+        if 'truncated' in entry:
+            report['truncated'] += 1
         
-        # 📝 Keep Docstrings (Essential for LLM context!)
-        if stripped.startswith(('#', '//')) or '"""' in line or "'''" in line:
-            skeleton_lines.append(line)
-            continue
+        chosen = 'dropped'
+        for level in levels:
+            if level == 'skeleton':
+                with timer('skeletonize'):
+                    entry = _skeleton_entry(entry, item)
+            elif level == 'path':
+                entry = _path_entry(entry)
+            if level != levels[0]:
+                entry['degraded'] = level
+            tokens = _entry_tokens(entry, compact)
+            if tokens <= remaining:
+                chosen = level
+                remaining -= tokens
+                break
         
-        if not stripped:
-            skeleton_lines.append(line)
-            
-    return '\n'.join(skeleton_lines), imports
+        report[chosen] += 1
+        if chosen != 'dropped':
+            results[i] = (entry, None)
+    
+    report['estimated_tokens'] = budget - remaining
+    for item, result in zip(items, results):
+        if result is not None:
+            yield item, result[0], result[1]
+
+# ─────────────────────────────────────────────────
+# 📤 EXPORT ENGINE
+# ─────────────────────────────────────────────────
+
+def _size(item):
+    """Size from the walker's DirEntry (cached once stat'ed), 0 if the file vanished"""
+    try:
+        return item.dir_entry.stat().st_size
+    except OSError:
+        return 0
 
-def export_snapshot(project_path, output_file, mode):
+def export_snapshot(project_path, output_file, mode, streaming=STREAM_SNAPSHOTS, workers=1,
+                    incremental=INCREMENTAL_EXPORTS, sharded=SHARD_SNAPSHOTS, compact=COMPACT_JSON,
+                    dedup=DEDUP_CONTENT, walked=None, token_budget=None, import_graph=WRITE_IMPORT_GRAPH,
+                    closure=None, profile=PROFILE_EXPORTS, progress=None, prebuilt=None,
+                    index=WRITE_SNAPSHOT_INDEX, skeleton_cache=None, metadata=None):
+    """
+    Write one snapshot of project_path; returns its stats.
+    Any exception (Ctrl-C included) leaves the previous snapshot untouched.
+    `prebuilt` is an iterable of (item, entry, error) kept by the caller (watch
+    mode): nothing is walked or read, the entries are just written out.
+    `skeleton_cache` and extra `metadata` keys come from workspace mode.
+    """
     project_path = Path(project_path)
-    files_data = []
+    # ♻️ Reused entries are read back from the previous snapshot through its .idx;
+    # only skeletons are worth it, a full entry is the file itself
+    incremental = (incremental and mode != MODE_FULL and prebuilt is None and not token_budget
+                   and Path(output_file).suffix not in SQLITE_SUFFIXES + COMPRESSED_SUFFIXES)
+    index = index or incremental
+    if index:
+        if Path(output_file).suffix in SQLITE_SUFFIXES:
+            index = False       # A database is its own index
+        elif Path(output_file).suffix in COMPRESSED_SUFFIXES:
+            print(f"⚠️ No .idx for {Path(output_file).name}: compressed snapshots can't be seeked into")
+            index = False
+        else:
+            streaming = True    # Only the streaming writers know where each entry lands
     stats = {'total_files': 0, 'by_language': {}}
     
-    def walk_directory(dir_path, relative_to):
-        # Sort so the LLM sees files in a logical order
-        for item in sorted(dir_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower())):
-            if item.is_dir():
-                if not should_ignore_dir(item.name):
-                    walk_directory(item, relative_to)
-            elif item.is_file():
-                # 🛡️ SECURITY: Stop .env processing
-                if item.name in IGNORED_FILES:
-                    continue 
-                
-                ext = item.suffix.lower()
-                if ext not in ALLOWED_EXTENSIONS:
+    # ⏱️ Timers/counters land in stats['profile'], cProfile output next to the snapshot
+    # (cProfile only sees this thread: with workers > 1 the reads show up as waits)
+    profile = ExportProfile() if profile else None
+    profiler = cProfile.Profile() if profile is not None else None
+    if profiler is not None:
+        profiler.enable()
+    timer = profile.phase if profile is not None else _untimed
+    
+    try:
+        if closure:
+            # 🕸️ Only the given files and everything they (transitively) import
+            with timer('closure'):
+                walked = closure_files(project_path, closure, walked)
+        if progress is not None:
+            if walked is None:
+                # 📏 Quick count first; the export then reuses this walk
+                with timer('walk'):
+                    walked = list(walk_files(project_path, profile=profile))
+            progress.start(len(walked), sum(_size(item) for item in walked))
+        # A .gz/.xz output_file (see generate_output_path) is compressed on the fly, a .db one is SQLite
+        writer = open_writer(output_file, streaming=streaming, sharded=sharded, compact=compact, dedup=dedup,
+                             index=index)
+        graph = ImportGraph(project_path.name) if import_graph else None
+        metadata = {'project_name': project_path.name, 'mode': mode, **(metadata or {})}
+        if closure:
+            metadata['closure_of'] = list(closure)
+        
+        if prebuilt is not None:
+            manifest = None
+            entries = iter(prebuilt)
+        elif token_budget:
+            # Budgeted entries depend on every other file: no manifest, one thread
+            manifest = None
+            stats['token_budget'] = {}
+            entries = iter_budgeted_entries(project_path, mode, token_budget, walked, stats['token_budget'],
+                                            profile, compact, metadata)
+        else:
+            manifest = Manifest(manifest_path_for(output_file), mode, output_file) if incremental else None
+            entries = iter_entries(project_path, mode, workers, manifest, walked, profile, skeleton_cache)
+        
+        try:
+            # walk_files keeps the logical order: directories first, then names
+            for item, entry, error in entries:
+                if progress is not None:
+                    progress.advance(_size(item))
+                if isinstance(error, SkippedFile):
+                    # Under a budget the report counts them: a list would go uncharged
+                    if not token_budget:
+                        stats.setdefault('skipped', []).append({'path': item.rel_path, 'reason': str(error)})
                     continue
-                
-                rel_path = item.relative_to(relative_to)
-                try:
-                    content = item.read_text(encoding='utf-8')
-                    file_imports = []
-                    
-                    # If Blueprint mode, strip logic but save imports
-                    if mode in [MODE_SKELETON, MODE_BLUEPRINT]:
-                        content, file_imports = skeletonize(content, ext, item.name)
-                    
-                    entry = {
-                        'path': rel_path.as_posix(), # Forward slashes for LLM compatibility
-                        'bundle': find_bundle(item.name),
-                        'language': ext[1:],
-                        'content': content
-                    }
-                    
-                    if file_imports:
-                        entry['imports'] = file_imports
-
-                    files_data.append(entry)
-                    stats['total_files'] += 1
-                except Exception as e:
-                    print(f"⚠️ Error reading {rel_path}: {e}")
-
-    walk_directory(project_path, project_path)
-    
-    output = {
-        'metadata': {'project_name': project_path.name, 'mode': mode},
-        'files': files_data,
-        'stats': stats
-    }
+                if error is not None:
+                    print(f"⚠️ Error reading {item.rel_path}: {error}")
+                    continue
+                if 'truncated' in entry and not token_budget:
+                    stats.setdefault('truncated', []).append(item.rel_path)
+                with timer('write'):
+                    writer.write(entry)
+                stats['total_files'] += 1
+                if graph is not None:
+                    with timer('graph'):
+                        graph.add(item.rel_path, entry)
+            
+            if manifest is not None:
+                stats['reused_files'] = len(manifest.reused)
+                manifest.close()    # Before the previous snapshot gets replaced
+            
+            if graph is not None:
+                with timer('graph'):
+                    graph.save(graph_path_for(output_file))
+            
+            if profile is not None and not token_budget:
+                # Budgeted snapshots leave it out (it's returned all the same)
+                stats['profile'] = profile.as_dict()
+            with timer('finalize'):
+                writer.close(metadata, stats)
+        except BaseException:
+            if hasattr(entries, 'close'):
+                entries.close()    # Stops the reader/skeleton pools right away
+            if manifest is not None:
+                manifest.close()
+            writer.abort()
+            raise
+        
+        if index:
+            with timer('index'):
+                save_index(output_file, writer.index_documents())
+        
+        # Saved last: a manifest must never describe a snapshot that wasn't written
+        if manifest is not None:
+            with timer('manifest'):
+                manifest.save()
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path_for(output_file))
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+    if profile is not None:
+        # The returned copy also covers finalize and the manifest save
+        stats['profile'] = profile.as_dict()
+    return stats
@@ -0,0 +1,120 @@
+# snapshot_index.py | Version: 5.2.0
+# Random access into a finished snapshot without parsing it.
+# The exporter (WRITE_SNAPSHOT_INDEX / --index) saves <name>.json.idx next to
+# the snapshot: the byte offset and length of every entry, by path and by
+# bundle, plus where each dedup blob sits. SnapshotIndex then seeks to an
+# entry and decodes that entry alone, whatever the snapshot's size.
+# Uncompressed snapshots only: .gz/.xz streams can't be seeked into.
+
+import json
+import os
+from pathlib import Path
+
+INDEX_VERSION = 1
+
+def index_path_for(output_file):
+    """Debug/<project>/<name>_snapshot.json -> <name>_snapshot.json.idx"""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + '.idx')
+
+def _stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+def save_index(output_file, documents):
+    """
+    Write the sidecar of a snapshot that was just written.
+    `documents` comes from the writer's index_documents().
+    """
+    output_file = Path(output_file)
+    data = {'version': INDEX_VERSION, 'documents': [], 'files': {}, 'bundles': {}, 'blobs': {}}
+    for doc, (document, offsets, blob_offsets) in enumerate(documents):
+        data['documents'].append({
+            'file': Path(document).relative_to(output_file.parent).as_posix(),
+            'stamp': _stamp(document)
+        })
+        for path, bundle, offset, length in offsets:
+            data['files'][path] = [doc, offset, length]
+            data['bundles'].setdefault(bundle, []).append(path)
+        for digest, (offset, length) in blob_offsets.items():
+            data['blobs'].setdefault(digest, [doc, offset, length])
+
+    path = index_path_for(output_file)
+    part_file = path.with_name(path.name + '.part')
+    with open(part_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(part_file, path)
+
+class SnapshotIndex:
+    """
+    Read single entries of an indexed snapshot:
+
+        with SnapshotIndex('Debug/app/app_full_snapshot.json') as snapshot:
+            entry = snapshot.get('lib/main.dart')
+            for entry in snapshot.bundle('screens'): ...
+
+    Raises ValueError when the index has another version or no longer
+    matches the snapshot (re-exported without --index since).
+    """
+
+    def __init__(self, snapshot_file):
+        self.snapshot_file = Path(snapshot_file)
+        with open(index_path_for(self.snapshot_file), encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"{index_path_for(self.snapshot_file)}: unsupported index version")
+        self.documents = [self.snapshot_file.parent / doc['file'] for doc in data['documents']]
+        for document, doc in zip(self.documents, data['documents']):
+            if _stamp(document) != doc['stamp']:
+                raise ValueError(f"{index_path_for(self.snapshot_file)} is stale: {document} changed since")
+        self._files = data['files']
+        self._bundles = data['bundles']
+        self._blobs = data['blobs']
+        self._handles = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for fh in self._handles.values():
+            fh.close()
+        self._handles.clear()
+
+    def __len__(self):
+        return len(self._files)
+
+    def __contains__(self, path):
+        return path in self._files
+
+    def paths(self):
+        """Every entry path, snapshot order"""
+        return list(self._files)
+
+    def bundles(self):
+        """Returns: {bundle: [paths]}"""
+        return {bundle: list(paths) for bundle, paths in self._bundles.items()}
+
+    def _read(self, doc, offset, length):
+        fh = self._handles.get(doc)
+        if fh is None:
+            fh = self._handles[doc] = open(self.documents[doc], 'rb')
+        fh.seek(offset)
+        return json.loads(fh.read(length))
+
+    def get(self, path):
+        """The entry of `path` (KeyError if it is not in the snapshot), blob resolved"""
+        entry = self._read(*self._files[path])
+        if 'blob' in entry:
+            content = self._read(*self._blobs[entry['blob']])
+            # Back to the exported shape: 'content' where the 'blob' key was
+            entry = {('content' if key == 'blob' else key): (content if key == 'blob' else value)
+                     for key, value in entry.items()}
+        return entry
+
+    def bundle(self, name):
+        """Yield the entries of one bundle, snapshot order"""
+        for path in self._bundles.get(name, ()):
+            yield self.get(path)
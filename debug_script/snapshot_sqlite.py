@@ -0,0 +1,151 @@
+# snapshot_sqlite.py | Version: 5.2.0
+# SQLite backend for export_snapshot: the same entries, as rows of a local
+# database (<name>_snapshot.db, picked by the output suffix like .gz/.xz).
+# Rows go in with batched inserts inside one transaction on a .part file;
+# indexes on bundle/language and the FTS5 full-text index over content are
+# built once at the end, which is much faster than maintaining them per row.
+# search_snapshot() then answers "which file mentions X" in milliseconds.
+# Without FTS5 in the local sqlite3 build, search falls back to substring scans.
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+SQLITE_SUFFIXES = ('.db', '.sqlite')
+INSERT_BATCH = 500        # Rows per executemany
+SEARCH_LIMIT = 20         # Default number of hits
+
+# Entry keys with a column of their own; anything else lands in `extra` (JSON)
+_COLUMNS = ('path', 'bundle', 'language', 'content', 'imports')
+
+_SCHEMA = """
+CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    bundle TEXT NOT NULL,
+    language TEXT NOT NULL,
+    content TEXT NOT NULL,
+    imports TEXT,
+    extra TEXT
+);
+"""
+
+_INDEXES = (
+    'CREATE INDEX files_bundle ON files (bundle)',
+    'CREATE INDEX files_language ON files (language)',
+)
+
+# External-content table: the text lives in `files` only, FTS5 keeps the index
+_FTS = (
+    "CREATE VIRTUAL TABLE files_fts USING fts5 (path, content, content='files', content_rowid='id')",
+    "INSERT INTO files_fts (files_fts) VALUES ('rebuild')",
+)
+
+def _row(entry):
+    imports = entry.get('imports')
+    extra = {key: value for key, value in entry.items() if key not in _COLUMNS}
+    return (entry['path'], entry['bundle'], entry['language'], entry.get('content', ''),
+            json.dumps(imports, ensure_ascii=False) if imports else None,
+            json.dumps(extra, ensure_ascii=False) if extra else None)
+
+class SqliteSnapshotWriter:
+    """Same write/close/abort contract as the JSON writers (compact/dedup don't apply)"""
+
+    def __init__(self, output_file):
+        self.output_file = Path(output_file)
+        self.part_file = self.output_file.with_name(self.output_file.name + '.part')
+        self.part_file.unlink(missing_ok=True)
+        self.rows = []
+        self.conn = sqlite3.connect(self.part_file)
+        # A crash only ever loses the .part file, so no journal is needed
+        self.conn.execute('PRAGMA journal_mode = OFF')
+        self.conn.execute('PRAGMA synchronous = OFF')
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute('BEGIN')
+
+    def _flush(self):
+        self.conn.executemany(
+            'INSERT INTO files (path, bundle, language, content, imports, extra) VALUES (?, ?, ?, ?, ?, ?)',
+            self.rows
+        )
+        self.rows = []
+
+    def write(self, entry):
+        self.rows.append(_row(entry))
+        if len(self.rows) >= INSERT_BATCH:
+            self._flush()
+
+    def close(self, metadata, stats):
+        self._flush()
+        for statement in _INDEXES:
+            self.conn.execute(statement)
+        try:
+            for statement in _FTS:
+                self.conn.execute(statement)
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ No full-text index in {self.output_file.name} ({e}); searches will scan")
+        self.conn.executemany('INSERT INTO metadata (key, value) VALUES (?, ?)', [
+            ('metadata', json.dumps(metadata, ensure_ascii=False)),
+            ('stats', json.dumps(stats, ensure_ascii=False))
+        ])
+        self.conn.commit()
+        self.conn.close()
+        os.replace(self.part_file, self.output_file)
+
+    def abort(self):
+        self.conn.close()
+        self.part_file.unlink(missing_ok=True)
+
+# ─────────────────────────────────────────────────
+# 🔎 QUERIES
+# ─────────────────────────────────────────────────
+
+def _has_fts(conn):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'files_fts'").fetchone() is not None
+
+def _phrase(query):
+    """Any text as one FTS5 phrase (dots, quotes, operators... taken literally)"""
+    return '"' + query.replace('"', '""') + '"'
+
+def search_snapshot(db_file, query, limit=SEARCH_LIMIT, bundle=None, language=None):
+    """
+    Full-text search over a .db snapshot, best matches first. `query` uses FTS5
+    syntax (`foo AND bar`, `"exact phrase"`, `prefix*`); anything that doesn't
+    parse is searched as a plain phrase.
+    Returns: list of {'path', 'bundle', 'language', 'snippet'}
+    """
+    conn = sqlite3.connect(f"{Path(db_file).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        where, params = '', []
+        if bundle is not None:
+            where += ' AND f.bundle = ?'
+            params.append(bundle)
+        if language is not None:
+            where += ' AND f.language = ?'
+            params.append(language)
+
+        if not _has_fts(conn):
+            sql = (f"SELECT f.path, f.bundle, f.language, substr(f.content, max(instr(f.content, ?) - 40, 1), 120) "
+                   f"FROM files f WHERE instr(f.content, ?) > 0{where} ORDER BY f.id LIMIT ?")
+            rows = conn.execute(sql, [query, query, *params, limit]).fetchall()
+        else:
+            sql = (f"SELECT f.path, f.bundle, f.language, snippet(files_fts, 1, '[', ']', '…', 12) "
+                   f"FROM files_fts JOIN files f ON f.id = files_fts.rowid "
+                   f"WHERE files_fts MATCH ?{where} ORDER BY rank LIMIT ?")
+            try:
+                rows = conn.execute(sql, [query, *params, limit]).fetchall()
+            except sqlite3.OperationalError:
+                rows = conn.execute(sql, [_phrase(query), *params, limit]).fetchall()
+    finally:
+        conn.close()
+    return [{'path': path, 'bundle': bundle, 'language': language, 'snippet': snippet}
+            for path, bundle, language, snippet in rows]
+
+def print_hits(hits):
+    """One line per search hit, snippet squeezed onto it"""
+    for hit in hits:
+        snippet = ' '.join(hit['snippet'].split())
+        print(f"  📄 {hit['path']} [{hit['bundle']}]  {snippet}")
+    print(f"🔎 {len(hits)} hit(s)")
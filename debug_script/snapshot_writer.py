@@ -0,0 +1,335 @@
+# snapshot_writer.py | Version: 5.2.0
+# Output writers for export_snapshot.
+# The buffered and streaming writers produce the same {metadata, files, stats}
+# document; they only differ in how much of it lives in memory at once.
+# The sharded writer splits that document per bundle behind an index.
+# Any of them compresses on the fly when the output ends in .gz or .xz,
+# and can store each distinct content once in a `blobs` table (dedup).
+# A .db output goes to the SQLite backend instead (snapshot_sqlite).
+
+import gzip
+import json
+import lzma
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from utils import content_hash
+from snapshot_sqlite import SqliteSnapshotWriter, SQLITE_SUFFIXES
+
+# ─────────────────────────────────────────────────
+# 🗜️ ENCODING & COMPRESSION
+# ─────────────────────────────────────────────────
+# The output suffix (picked by utils.generate_output_path) decides the
+# compressor, so a snapshot's name always says how to open it.
+
+COMPRESSED_SUFFIXES = ('.gz', '.xz')
+
+def open_snapshot(path, mode='rt', suffix=None, newline=None):
+    """Open a snapshot as text, (de)compressing by suffix (default: path's own)"""
+    suffix = Path(path).suffix if suffix is None else suffix
+    if suffix == '.gz':
+        # Level 9 takes about twice as long as 6 for ~2% smaller output
+        return gzip.open(path, mode, compresslevel=6, encoding='utf-8', newline=newline)
+    if suffix == '.xz':
+        return lzma.open(path, mode, encoding='utf-8', newline=newline)
+    return open(path, mode, encoding='utf-8', newline=newline)
+
+def _dump_kwargs(compact):
+    if compact:
+        return {'ensure_ascii': False, 'separators': (',', ':')}
+    return {'ensure_ascii': False, 'indent': 2}
+
+# ─────────────────────────────────────────────────
+# ♻️ CONTENT DEDUP
+# ─────────────────────────────────────────────────
+# With dedup on, entries carry `blob: <hash>` instead of `content`, and the
+# document gets a `blobs` table mapping each hash to its content once.
+# Hashes are taken from the exported content, so identical skeletons of
+# different sources share a blob too.
+
+def _as_blob_ref(entry, digest):
+    """Same entry (same key order) with 'content' swapped for a 'blob' hash"""
+    return {
+        ('blob' if key == 'content' else key): (digest if key == 'content' else value)
+        for key, value in entry.items()
+    }
+
+# ─────────────────────────────────────────────────
+# 📦 BUFFERED WRITER (classic behavior)
+# ─────────────────────────────────────────────────
+
+class SnapshotWriter:
+    """Collects every entry and dumps the whole document on close"""
+
+    def __init__(self, output_file, compact=False, dedup=False):
+        self.output_file = Path(output_file)
+        self.part_file = self.output_file.with_name(self.output_file.name + '.part')
+        self.compact = compact
+        self.files = []
+        self.blobs = {} if dedup else None
+
+    def write(self, entry):
+        if self.blobs is not None:
+            digest = content_hash(entry['content'])
+            self.blobs.setdefault(digest, entry['content'])
+            entry = _as_blob_ref(entry, digest)
+        self.files.append(entry)
+
+    def close(self, metadata, stats):
+        output = {
+            'metadata': metadata,
+            'files': self.files,
+            'stats': stats
+        }
+        if self.blobs is not None:
+            output['blobs'] = self.blobs
+            output['stats'] = dict(stats, unique_blobs=len(self.blobs))
+        # Same .part dance as the streaming writer: a Ctrl-C mid-dump never
+        # leaves a truncated snapshot behind
+        with open_snapshot(self.part_file, 'wt', self.output_file.suffix) as f:
+            json.dump(output, f, **_dump_kwargs(self.compact))
+        os.replace(self.part_file, self.output_file)
+
+    def abort(self):
+        self.files = []
+        self.blobs = None if self.blobs is None else {}
+        self.part_file.unlink(missing_ok=True)
+
+# ─────────────────────────────────────────────────
+# 🌊 STREAMING WRITER
+# ─────────────────────────────────────────────────
+# Each entry hits the disk as soon as it is produced, so memory stays
+# bounded by the largest single file. stats and metadata go last.
+# With dedup, new blobs are spooled to a temp file and copied in after
+# `files`; only the set of seen hashes stays in memory.
+# With index on, the writer also counts the bytes it writes and records where
+# each entry (and blob) landed, for the snapshot_index sidecar. Newlines are
+# then written as-is ('\n' on Windows too) so the counts match the file.
+
+def _nbytes(text):
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+def _dumps(value, depth, compact=False):
+    """Encode like json.dump would at the given nesting depth"""
+    if compact:
+        return json.dumps(value, **_dump_kwargs(True))
+    text = json.dumps(value, indent=2, ensure_ascii=False)
+    return text.replace('\n', '\n' + '  ' * depth)
+
+class StreamingSnapshotWriter:
+    """Writes entries one by one into a .part file, renamed into place on close"""
+
+    def __init__(self, output_file, compact=False, dedup=False, index=False):
+        self.output_file = Path(output_file)
+        self.part_file = self.output_file.with_name(self.output_file.name + '.part')
+        self.compact = compact
+        self.count = 0
+        # Whitespace between tokens: none at all when compact
+        self._nl, self._sp = ('', '') if compact else ('\n', ' ')
+        self._blobs = set() if dedup else None
+        self._spool = tempfile.TemporaryFile('w+', encoding='utf-8') if dedup else None
+        # 🗂️ (path, bundle, offset, length) per entry and digest -> (offset, length)
+        self.offsets = [] if index else None
+        self.blob_offsets = {} if index and dedup else None
+        self._pos = 0
+        self._spool_pos = 0
+        self._fh = open_snapshot(self.part_file, 'wt', self.output_file.suffix, newline='' if index else None)
+        self._emit('{' + self._nl + '  ' * (not compact) + '"files":' + self._sp + '[')
+
+    def _emit(self, text):
+        self._fh.write(text)
+        if self.offsets is not None:
+            self._pos += _nbytes(text)
+
+    def _spool_blob(self, entry):
+        """Returns: the entry as a blob reference, spooling unseen content"""
+        digest = content_hash(entry['content'])
+        if digest not in self._blobs:
+            head = self._nl + '    ' * (not self.compact) + json.dumps(digest) + ':' + self._sp
+            if self._blobs:
+                head = ',' + head
+            text = _dumps(entry['content'], 2, self.compact)
+            self._spool.write(head)
+            self._spool.write(text)
+            if self.blob_offsets is not None:
+                # Relative to the spool for now, shifted when it is copied in
+                self._spool_pos += _nbytes(head)
+                self.blob_offsets[digest] = (self._spool_pos, _nbytes(text))
+                self._spool_pos += self.blob_offsets[digest][1]
+            self._blobs.add(digest)
+        return _as_blob_ref(entry, digest)
+
+    def write(self, entry):
+        if self._blobs is not None:
+            entry = self._spool_blob(entry)
+        if self.count:
+            self._emit(',')
+        self._emit(self._nl + '    ' * (not self.compact))
+        text = _dumps(entry, 2, self.compact)
+        if self.offsets is not None:
+            self.offsets.append((entry['path'], entry['bundle'], self._pos, _nbytes(text)))
+        self._emit(text)
+        self.count += 1
+
+    def close(self, metadata, stats):
+        nl, sp, indent = self._nl, self._sp, '  ' * (not self.compact)
+        self._emit((nl + indent if self.count else '') + '],')
+        if self._blobs is not None:
+            self._emit(nl + indent + '"blobs":' + sp + '{')
+            self._spool.seek(0)
+            shutil.copyfileobj(self._spool, self._fh)
+            self._spool.close()
+            if self.blob_offsets is not None:
+                self.blob_offsets = {digest: (self._pos + offset, length)
+                                     for digest, (offset, length) in self.blob_offsets.items()}
+                self._pos += self._spool_pos
+            self._emit((nl + indent if self._blobs else '') + '},')
+            stats = dict(stats, unique_blobs=len(self._blobs))
+        self._emit(nl + indent + '"stats":' + sp + _dumps(stats, 1, self.compact))
+        self._emit(',' + nl + indent + '"metadata":' + sp + _dumps(metadata, 1, self.compact))
+        self._emit(nl + '}')
+        self._fh.close()
+        # Only a finished document ever replaces the previous snapshot
+        os.replace(self.part_file, self.output_file)
+
+    def index_documents(self):
+        """Returns: [(document, entry offsets, blob offsets)] for snapshot_index"""
+        return [(self.output_file, self.offsets, self.blob_offsets or {})]
+
+    def abort(self):
+        """Drop the half-written .part file"""
+        self._fh.close()
+        if self._spool is not None:
+            self._spool.close()
+        self.part_file.unlink(missing_ok=True)
+
+# ─────────────────────────────────────────────────
+# 🧩 SHARDED WRITER (one file per bundle)
+# ─────────────────────────────────────────────────
+# <name>_snapshot.json becomes a small index; the entries themselves go to
+# <name>_snapshot/<bundle>, one streaming document per BUNDLE_MAP target
+# (compressed shards keep the index's .gz/.xz suffix).
+# Each shard has its own single-thread lane, so shards are encoded and
+# written concurrently while entries within a shard keep walk order.
+# With dedup, every shard keeps its own blobs table so it still loads alone.
+
+MAX_PENDING_WRITES = 32  # Per shard, before the exporter waits for the disk
+
+def shard_dir_for(output_file):
+    """Debug/<project>/<name>_snapshot.json[.gz] -> Debug/<project>/<name>_snapshot/"""
+    output_file = Path(output_file)
+    compression = output_file.suffix if output_file.suffix in COMPRESSED_SUFFIXES else ''
+    stem = output_file.name[:len(output_file.name) - len(compression)]
+    return output_file.with_name(stem).with_suffix('')
+
+class _Shard:
+    def __init__(self, path, compact, dedup, index):
+        self.writer = StreamingSnapshotWriter(path, compact, dedup, index)
+        self.lane = ThreadPoolExecutor(max_workers=1)
+        self.pending = deque()
+        self.count = 0
+
+    def submit(self, fn, *args):
+        self.pending.append(self.lane.submit(fn, *args))
+        while len(self.pending) > MAX_PENDING_WRITES:
+            self.pending.popleft().result()
+
+    def drain(self):
+        while self.pending:
+            self.pending.popleft().result()
+
+class ShardedSnapshotWriter:
+    """Routes entries to per-bundle shard files and writes an index on close"""
+
+    def __init__(self, output_file, compact=False, dedup=False, index=False):
+        self.output_file = Path(output_file)
+        self.compact = compact
+        self.dedup = dedup
+        self.index = index
+        self.compression = self.output_file.suffix if self.output_file.suffix in COMPRESSED_SUFFIXES else ''
+        self.shard_dir = shard_dir_for(self.output_file)
+        self.shards = {}
+
+    def _shard_path(self, bundle):
+        return self.shard_dir / (bundle + self.compression)
+
+    def write(self, entry):
+        bundle = entry['bundle']
+        shard = self.shards.get(bundle)
+        if shard is None:
+            self.shard_dir.mkdir(parents=True, exist_ok=True)
+            shard = self.shards[bundle] = _Shard(self._shard_path(bundle), self.compact, self.dedup, self.index)
+        shard.submit(shard.writer.write, entry)
+        shard.count += 1
+
+    def _previous_shards(self):
+        """Shard files named by the index we are about to replace"""
+        try:
+            with open_snapshot(self.output_file) as f:
+                return {shard['file'] for shard in json.load(f).get('shards', [])}
+        except (OSError, EOFError, lzma.LZMAError, ValueError, AttributeError, KeyError, TypeError):
+            return set()
+
+    def close(self, metadata, stats):
+        for bundle, shard in self.shards.items():
+            shard_stats = {'total_files': shard.count}
+            shard.submit(shard.writer.close, dict(metadata, bundle=bundle), shard_stats)
+        try:
+            for shard in self.shards.values():
+                shard.drain()
+        finally:
+            for shard in self.shards.values():
+                shard.lane.shutdown()
+
+        index = []
+        for bundle in sorted(self.shards):
+            shard_file = self._shard_path(bundle)
+            index.append({
+                'bundle': bundle,
+                'file': shard_file.relative_to(self.output_file.parent).as_posix(),
+                'files': self.shards[bundle].count,
+                'bytes': shard_file.stat().st_size
+            })
+        stale = self._previous_shards() - {shard['file'] for shard in index}
+
+        output = {'metadata': metadata, 'shards': index, 'stats': stats}
+        part_file = self.output_file.with_name(self.output_file.name + '.part')
+        with open_snapshot(part_file, 'wt', self.compression) as f:
+            json.dump(output, f, **_dump_kwargs(self.compact))
+        os.replace(part_file, self.output_file)
+
+        # 🧹 Bundles that no longer have any file
+        for name in stale:
+            (self.output_file.parent / name).unlink(missing_ok=True)
+
+    def index_documents(self):
+        """Returns: [(shard, entry offsets, blob offsets)], bundle order"""
+        return [doc for bundle in sorted(self.shards) for doc in self.shards[bundle].writer.index_documents()]
+
+    def abort(self):
+        """Drop every half-written shard; finished shards of the old run stay"""
+        for shard in self.shards.values():
+            shard.lane.shutdown(cancel_futures=True)
+            shard.writer.abort()
+
+def snapshot_bytes(output_file, sharded=False):
+    """On-disk size of a finished snapshot: a sharded one's index plus every shard it lists"""
+    output_file = Path(output_file)
+    total = output_file.stat().st_size
+    if sharded and output_file.suffix not in SQLITE_SUFFIXES:
+        with open_snapshot(output_file) as f:
+            total += sum(shard['bytes'] for shard in json.load(f).get('shards', []))
+    return total
+
+def open_writer(output_file, streaming=False, sharded=False, compact=False, dedup=False, index=False):
+    """Pick the writer for an export (`index` needs the streaming or sharded one)"""
+    if Path(output_file).suffix in SQLITE_SUFFIXES:
+        return SqliteSnapshotWriter(output_file)
+    if sharded:
+        return ShardedSnapshotWriter(output_file, compact, dedup, index)
+    if streaming:
+        return StreamingSnapshotWriter(output_file, compact, dedup, index)
+    return SnapshotWriter(output_file, compact, dedup)
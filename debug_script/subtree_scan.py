@@ -0,0 +1,145 @@
+# subtree_scan.py | Version: 5.2.0
+# Background size scanner for the explorer.
+# Walks a folder with the exporter's own walker (same filters, same files),
+# totals file counts and bytes per child folder, and estimates how big a
+# full or skeleton snapshot would be, in bytes and in LLM tokens.
+# Estimates only: exports always walk again, since a scan's stat results
+# (and its file list) go stale as soon as files are edited or added.
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from config import MODE_FULL, CHARS_PER_TOKEN
+from walker import walk_files
+
+# ─────────────────────────────────────────────────
+# 📏 ESTIMATES
+# ─────────────────────────────────────────────────
+# Measured on the CPython stdlib: skeletons keep ~1/3 of a .py file, JSON
+# string escaping adds ~4%. Each entry's keys and indentation add ~120 bytes.
+# Data outlines (skeleton_data.py) vary wildly; those ratios are rough guesses.
+
+JSON_ESCAPE_FACTOR = 1.04
+ENTRY_OVERHEAD_BYTES = 120
+SKELETON_KEEP_RATIO = {'.py': 0.33, '.dart': 0.4, '.sql': 0.3, '.json': 0.1, '.yaml': 0.7, '.yml': 0.7}
+
+# A scan younger than this isn't redone when its folder is shown again
+SCAN_REUSE_SECONDS = 60
+MAX_CACHED_SCANS = 32
+
+class Totals(NamedTuple):
+    files: int = 0
+    bytes: int = 0
+    full_bytes: int = 0
+    skeleton_bytes: int = 0
+
+    def add(self, size, ext):
+        full = size * JSON_ESCAPE_FACTOR + ENTRY_OVERHEAD_BYTES
+        skeleton = size * SKELETON_KEEP_RATIO.get(ext, 1.0) * JSON_ESCAPE_FACTOR + ENTRY_OVERHEAD_BYTES
+        return Totals(self.files + 1, self.bytes + size, self.full_bytes + int(full),
+                      self.skeleton_bytes + int(skeleton))
+
+    def snapshot_bytes(self, mode):
+        return self.full_bytes if mode == MODE_FULL else self.skeleton_bytes
+
+    def tokens(self, mode):
+        return self.snapshot_bytes(mode) // CHARS_PER_TOKEN
+
+class ScanResult(NamedTuple):
+    totals: Totals
+    children: dict       # first-level folder name -> Totals
+    finished_at: float   # time.monotonic()
+
+def _human(n, unit=''):
+    for suffix in ('', 'k', 'M', 'G'):
+        if abs(n) < 1000:
+            return f"{n:.0f}{suffix}{unit}" if suffix == '' else f"{n:.1f}{suffix}{unit}"
+        n /= 1000
+    return f"{n:.1f}T{unit}"
+
+def describe(totals):
+    """One-line summary for a menu entry"""
+    return (f"{totals.files} files, {_human(totals.bytes, 'B')} · "
+            f"full ~{_human(totals.snapshot_bytes(MODE_FULL), 'B')} / ~{_human(totals.tokens(MODE_FULL))} tok, "
+            f"skeleton ~{_human(totals.snapshot_bytes('skeleton'), 'B')} / ~{_human(totals.tokens('skeleton'))} tok")
+
+# ─────────────────────────────────────────────────
+# 🔭 SCANNER
+# ─────────────────────────────────────────────────
+
+class ScanCancelled(Exception):
+    pass
+
+def scan(path, cancel=None):
+    """Walk path once; raises ScanCancelled as soon as cancel is set"""
+    totals = Totals()
+    children = {}
+    for item in walk_files(path):
+        if cancel is not None and cancel.is_set():
+            raise ScanCancelled(path)
+        size = item.dir_entry.stat().st_size
+        totals = totals.add(size, item.ext)
+        head, sep, _ = item.rel_path.partition('/')
+        if sep:
+            children[head] = children.get(head, Totals()).add(size, item.ext)
+    return ScanResult(totals, children, time.monotonic())
+
+class SubtreeScanner:
+    """One background scan at a time; asking for another folder cancels it"""
+
+    def __init__(self, maxsize=MAX_CACHED_SCANS):
+        self.maxsize = maxsize
+        self._results = OrderedDict()   # str(path) -> ScanResult
+        self._lock = threading.Lock()
+        self._pool = None
+        self._running = None            # (key, future, cancel event)
+
+    def _run(self, key, path, cancel):
+        result = scan(path, cancel)
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def request(self, path):
+        """Start scanning path unless a recent result or a running scan covers it"""
+        key = str(path)
+        cached = self._results.get(key)
+        if cached is not None and time.monotonic() - cached.finished_at < SCAN_REUSE_SECONDS:
+            return
+        if self._running is not None:
+            running_key, future, cancel = self._running
+            if running_key == key and not future.done():
+                return
+            cancel.set()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scan')
+        cancel = threading.Event()
+        self._running = (key, self._pool.submit(self._run, key, path, cancel), cancel)
+
+    def result(self, path, timeout=0):
+        """Latest ScanResult for path (possibly an older one), waiting up to timeout"""
+        key = str(path)
+        if self._running is not None and self._running[0] == key:
+            try:
+                self._running[1].result(timeout=timeout)
+            except Exception:
+                pass      # Still running, cancelled or failed: fall back to the cache
+        with self._lock:
+            return self._results.get(key)
+
+    def cancel(self):
+        """Stop the running scan (before an export: both would fight over the disk)"""
+        if self._running is not None:
+            self._running[2].set()
+
+    def close(self):
+        """Cancel and let go of the scan thread, so quitting doesn't wait for a whole walk"""
+        self.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
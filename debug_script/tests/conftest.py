@@ -0,0 +1,8 @@
+# conftest.py | Version: 5.2.0
+# The scripts import each other by bare module name (config, utils...),
+# so the tests run with debug_script/ itself on sys.path.
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,83 @@
+# test_incremental.py | Version: 5.2.0
+# Incremental skeleton exports: unchanged files are read back from the
+# previous snapshot, and the result must equal a fresh export.
+
+import json
+import os
+import time
+import manifest
+from snapshot_export import export_snapshot
+
+HOUR_NS = 3600 * 10**9
+
+def _project(tmp_path):
+    project = tmp_path / 'project'
+    (project / 'pkg').mkdir(parents=True)
+    for i in range(5):
+        (project / 'pkg' / f'mod{i}.py').write_text(
+            f'import os\n\ndef f{i}(x):\n    """Doc {i}"""\n    return os.sep * x\n', encoding='utf-8')
+    (project / 'fixtures.json').write_text('{"name": "demo", "items": [1, 2, 3]}', encoding='utf-8')
+    _age(project)
+    return project
+
+def _age(project):
+    """Backdate every file past the manifest's racy window, so size/mtime alone are trusted"""
+    old = time.time_ns() - HOUR_NS
+    for path in project.rglob('*'):
+        if path.is_file():
+            os.utime(path, ns=(old, old))
+
+def _export(project, output):
+    stats = export_snapshot(project, output, 'skeleton', incremental=True, streaming=True)
+    with open(output, encoding='utf-8') as f:
+        return stats, json.load(f)['files']
+
+def _fresh(project, tmp_path):
+    """Entries of a from-scratch export, for comparison"""
+    output = tmp_path / 'fresh' / 'snapshot.json'
+    output.parent.mkdir(exist_ok=True)
+    export_snapshot(project, output, 'skeleton', incremental=False)
+    with open(output, encoding='utf-8') as f:
+        return json.load(f)['files']
+
+def test_warm_export_reuses_everything(tmp_path):
+    project, output = _project(tmp_path), tmp_path / 'snapshot.json'
+    stats, cold = _export(project, output)
+    assert stats.get('reused_files', 0) == 0
+    assert output.with_name(output.name + '.manifest').exists()
+
+    stats, warm = _export(project, output)
+    assert stats['reused_files'] == 6
+    assert warm == cold
+
+def test_edited_and_touched_files(tmp_path):
+    project, output = _project(tmp_path), tmp_path / 'snapshot.json'
+    _export(project, output)
+
+    (project / 'pkg' / 'mod1.py').write_text('def changed():\n    return 1\n', encoding='utf-8')
+    # Touched, same content: the hash still matches
+    os.utime(project / 'pkg' / 'mod2.py')
+    (project / 'pkg' / 'mod3.py').unlink()
+
+    stats, files = _export(project, output)
+    assert stats['reused_files'] == 4
+    assert files == _fresh(project, tmp_path)
+    by_path = {entry['path']: entry for entry in files}
+    assert 'def changed():' in by_path['pkg/mod1.py']['content']
+    assert 'pkg/mod3.py' not in by_path
+
+def test_settings_change_invalidates_manifest(tmp_path, monkeypatch):
+    project, output = _project(tmp_path), tmp_path / 'snapshot.json'
+    _export(project, output)
+    monkeypatch.setattr(manifest, 'MAX_FILE_BYTES', manifest.MAX_FILE_BYTES + 1)
+    stats, _ = _export(project, output)
+    assert stats.get('reused_files', 0) == 0
+
+def test_rewritten_snapshot_is_not_trusted(tmp_path):
+    project, output = _project(tmp_path), tmp_path / 'snapshot.json'
+    _export(project, output)
+    # Another export (a budgeted one) replaces the snapshot but not the manifest
+    export_snapshot(project, output, 'skeleton', token_budget=10_000, incremental=False)
+    stats, files = _export(project, output)
+    assert stats.get('reused_files', 0) == 0
+    assert files == _fresh(project, tmp_path)
@@ -0,0 +1,50 @@
+# test_skeleton_data.py | Version: 5.2.0
+# JSON over MAX_FILE_BYTES is outlined from disk, never cut to size first:
+# the streamed outline must equal skeletonize_json on the whole text.
+
+import json
+import pytest
+import skeleton_data
+from skeleton_data import skeletonize_json, skeletonize_json_file
+from snapshot_export import export_snapshot, MAX_FILE_BYTES
+
+DOCUMENTS = [
+    {'name': 'x' * 300, 'n': -25000000000.0, 'big': 12345678901234567890, 'tiny': 1e-7},
+    {f'k{i}"': [i, 'q"é\\', None, True] for i in range(60)},
+    [[{'a': list(range(40))}], {}, [], 'é' * 100],
+]
+
+@pytest.mark.parametrize('chunk', [1, 7, 1 << 20])
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_streamed_outline_matches_in_memory(tmp_path, monkeypatch, chunk, document):
+    monkeypatch.setattr(skeleton_data, '_READ_CHUNK', chunk)
+    for text in (json.dumps(document), json.dumps(document, indent=2, ensure_ascii=False)):
+        path = tmp_path / 'doc.json'
+        path.write_text(text, encoding='utf-8')
+        assert skeletonize_json_file(path) == skeletonize_json(text)
+
+def test_json_lines_and_invalid(tmp_path, monkeypatch):
+    monkeypatch.setattr(skeleton_data, '_READ_CHUNK', 5)
+    path = tmp_path / 'rows.json'
+    text = '\n'.join(json.dumps({'id': i, 'tags': ['a', 'b']}) for i in range(30))
+    path.write_text(text, encoding='utf-8')
+    assert skeletonize_json_file(path) == skeletonize_json(text)
+    path.write_text('{"cut": [1, 2', encoding='utf-8')
+    assert skeletonize_json_file(path) is None
+
+def test_oversized_json_is_outlined_not_sampled(tmp_path):
+    project = tmp_path / 'project'
+    project.mkdir()
+    rows = [{'id': i, 'name': f'row {i}', 'payload': 'x' * 200} for i in range(MAX_FILE_BYTES // 200 + 1)]
+    (project / 'data.json').write_text(json.dumps({'rows': rows, 'total': len(rows)}), encoding='utf-8')
+    assert (project / 'data.json').stat().st_size > MAX_FILE_BYTES
+
+    output = tmp_path / 'snapshot.json'
+    export_snapshot(project, output, 'skeleton', incremental=False)
+    snapshot = json.loads(output.read_text(encoding='utf-8'))
+    entry, = [entry for entry in snapshot['files'] if entry['path'] == 'data.json']
+    assert 'truncated' not in entry
+    outline = json.loads(entry['content'])
+    assert list(outline) == ['rows', 'total']
+    assert outline['total'] == len(rows)
+    assert len(entry['content']) < 10_000
@@ -0,0 +1,102 @@
+# test_skeleton_python.py | Version: 5.2.0
+# Body pruning must never change a skeleton: every case is checked against
+# the plain AST path (pruning switched off).
+
+import skeleton_python
+from skeleton_python import skeletonize_python
+
+def _unpruned(content, monkeypatch):
+    monkeypatch.setattr(skeleton_python, '_prune_bodies', lambda content, lines: (None, {}))
+    return skeletonize_python(content)
+
+def test_triple_quote_inside_a_string_keeps_every_def(monkeypatch):
+    source = (
+        'def a(src):\n'
+        '    return src.startswith("\'\'\'")\n'
+        '\n'
+        'def b():\n'
+        '    return 1\n'
+        '\n'
+        'def c(src):\n'
+        '    return src.endswith("\'\'\'")\n'
+        '\n'
+        'def d():\n'
+        '    return 2\n'
+    )
+    skeleton, _ = skeletonize_python(source)
+    for name in ('a', 'b', 'c', 'd'):
+        assert f'def {name}(' in skeleton
+    assert (skeleton, []) == _unpruned(source, monkeypatch)
+
+def test_multiline_body_import_is_joined():
+    source = (
+        'def f():\n'
+        '    from a.b import (c,\n'
+        '        d)\n'
+        '    return c\n'
+    )
+    _, imports = skeletonize_python(source)
+    assert imports == ['from a.b import (c, d)']
+
+def test_import_inside_a_string_is_not_an_import(monkeypatch):
+    source = (
+        'def f():\n'
+        "    text = '''\n"
+        'import os\n'
+        "'''\n"
+        '    return text\n'
+    )
+    skeleton, imports = skeletonize_python(source)
+    assert imports == []
+    assert (skeleton, imports) == _unpruned(source, monkeypatch)
+
+def test_tab_indented_placeholders(monkeypatch):
+    source = (
+        'class A:\n'
+        '\tdef f(self):\n'
+        '\t\treturn "\'\'\'"\n'
+        '\n'
+        '\tdef g(self):\n'
+        '\t\treturn 1\n'
+    )
+    expected = 'class A:\n\tdef f(self):\n\t\t...\n\n\tdef g(self):\n\t\t...\n'
+    assert skeletonize_python(source) == (expected, [])
+    assert _unpruned(source, monkeypatch) == (expected, [])
+
+def test_string_expression_is_not_a_docstring(monkeypatch):
+    source = (
+        'def f():\n'
+        "    'abc'.upper()\n"
+        '    return 1\n'
+    )
+    skeleton, _ = skeletonize_python(source)
+    assert 'upper' not in skeleton
+    assert (skeleton, []) == _unpruned(source, monkeypatch)
+
+def test_docstrings_and_signatures_survive_pruning(monkeypatch):
+    source = (
+        '"""Module docs"""\n'
+        'import os\n'
+        '\n'
+        'class Vault:\n'
+        '    """Vault docs"""\n'
+        '    limit = 10\n'
+        '\n'
+        '    @property\n'
+        '    def size(self,\n'
+        '             other=None) -> int:\n'
+        '        """How big"""\n'
+        '        return len(os.listdir("."))\n'
+        '\n'
+        '    async def load(self):\n'
+        '        import json\n'
+        '        return json.loads("{}")\n'
+        '\n'
+        'if __name__ == "__main__":\n'
+        '    Vault()\n'
+    )
+    skeleton, imports = skeletonize_python(source)
+    assert '    def size(self,\n             other=None) -> int:\n        """How big"""\n        ...' in skeleton
+    assert 'async def load(self):' in skeleton
+    assert imports == ['import os', 'import json']
+    assert (skeleton, imports) == _unpruned(source, monkeypatch)
@@ -0,0 +1,99 @@
+# test_snapshot_diff.py | Version: 5.2.0
+# Diff round-trip: the old snapshot plus the delta must give back the new
+# one, whatever flavor (buffered, streaming, dedup, sharded, .gz) each side has.
+
+import json
+import pytest
+from snapshot_export import export_snapshot
+from snapshot_diff import diff_snapshots, scan_snapshot, unified_diff, write_delta
+
+FLAVORS = {
+    'buffered': ('snapshot.json', {'streaming': False}),
+    'streaming': ('snapshot.json', {'streaming': True}),
+    'dedup': ('snapshot.json', {'dedup': True}),
+    'sharded': ('snapshot.json', {'sharded': True}),
+    'gzip': ('snapshot.json.gz', {}),
+}
+
+def _write(project, files):
+    for path in project.rglob('*'):
+        if path.is_file():
+            path.unlink()
+    for rel_path, content in files.items():
+        path = project / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+
+OLD = {
+    'main.py': 'def main():\n    return 1\n',
+    'pkg/a.py': 'A = 1\n',
+    'pkg/b.py': 'B = 2\n',
+    'pkg/copy.py': 'A = 1\n',        # Same content as a.py: one blob under dedup
+    'notes.md': 'first\nsecond\nthird\n',
+}
+NEW = {
+    'main.py': 'def main():\n    return 2\n',
+    'pkg/a.py': 'A = 1\n',
+    'pkg/copy.py': 'A = 1\n',
+    'pkg/c.py': 'C = 3\n',
+    'notes.md': 'first\nsecond, edited\nthird\n',
+}
+
+def _export(project, folder, flavor, files):
+    _write(project, files)
+    name, options = FLAVORS[flavor]
+    output = folder / flavor / name
+    output.parent.mkdir(parents=True, exist_ok=True)
+    export_snapshot(project, output, 'full', incremental=False, **options)
+    return output
+
+def _entries(snapshot):
+    _, _, entries = scan_snapshot(snapshot, keep=lambda entry, signature: True)
+    return entries
+
+@pytest.mark.parametrize('old_flavor,new_flavor', [
+    ('buffered', 'buffered'), ('streaming', 'dedup'), ('dedup', 'sharded'), ('sharded', 'gzip'), ('gzip', 'buffered'),
+])
+def test_old_plus_delta_is_new(tmp_path, old_flavor, new_flavor):
+    project = tmp_path / 'project'
+    old = _export(project, tmp_path / 'old', old_flavor, OLD)
+    new = _export(project, tmp_path / 'new', new_flavor, NEW)
+
+    diff = diff_snapshots(old, new)
+    assert [entry['path'] for entry in diff.added] == ['pkg/c.py']
+    assert diff.removed == ['pkg/b.py']
+    assert sorted(new_entry['path'] for _, new_entry in diff.modified) == ['main.py', 'notes.md']
+    assert diff.unchanged == 2
+
+    delta = tmp_path / 'delta.json'
+    write_delta(diff, delta, full_content=True)
+    document = json.loads(delta.read_text(encoding='utf-8'))
+    rebuilt = {path: entry for path, entry in _entries(old).items()
+               if path not in document['metadata']['removed']}
+    for entry in document['files']:
+        rebuilt[entry['path']] = {key: value for key, value in entry.items() if key != 'change'}
+    assert rebuilt == _entries(new)
+
+def test_delta_diffs_hold_only_the_changed_lines(tmp_path):
+    project = tmp_path / 'project'
+    old = _export(project, tmp_path / 'old', 'streaming', OLD)
+    new = _export(project, tmp_path / 'new', 'streaming', NEW)
+    diff = diff_snapshots(old, new)
+
+    delta = tmp_path / 'delta.json'
+    stats = write_delta(diff, delta)
+    assert stats == {'added': 1, 'removed': 1, 'modified': 2, 'unchanged': 2, 'total_files': 3}
+    changes = {entry['path']: entry for entry in json.loads(delta.read_text(encoding='utf-8'))['files']}
+    assert changes['pkg/c.py']['content'] == NEW['pkg/c.py']
+    patch = changes['notes.md']['diff']
+    assert 'content' not in changes['notes.md']
+    assert '-second\n+second, edited\n' in patch
+    assert patch == unified_diff({'content': OLD['notes.md']}, {'path': 'notes.md', 'content': NEW['notes.md']})
+
+def test_identical_snapshots_have_no_diff(tmp_path):
+    project = tmp_path / 'project'
+    old = _export(project, tmp_path / 'old', 'dedup', OLD)
+    new = _export(project, tmp_path / 'new', 'gzip', OLD)
+    diff = diff_snapshots(old, new)
+    assert not diff
+    assert diff.unchanged == len(OLD)
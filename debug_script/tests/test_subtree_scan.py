@@ -0,0 +1,34 @@
+# test_subtree_scan.py | Version: 5.2.0
+
+import time
+import subtree_scan
+from subtree_scan import SubtreeScanner, scan, describe
+
+def _project(tmp_path, files=5):
+    for i in range(files):
+        (tmp_path / f"mod_{i}.py").write_text('def f():\n    return 1\n' * 20, encoding='utf-8')
+    return tmp_path
+
+def test_describe_shows_bytes_and_tokens(tmp_path):
+    line = describe(scan(_project(tmp_path)).totals)
+    assert line.startswith('5 files, ')
+    assert 'full ~' in line and 'kB / ~' in line and 'tok' in line
+
+def test_close_stops_a_running_scan(tmp_path, monkeypatch):
+    walk = subtree_scan.walk_files
+
+    def slow_walk(*args, **kwargs):
+        for item in walk(*args, **kwargs):
+            time.sleep(0.2)
+            yield item
+    monkeypatch.setattr(subtree_scan, 'walk_files', slow_walk)
+
+    scanner = SubtreeScanner()
+    scanner.request(_project(tmp_path, files=50))
+    future = scanner._running[1]
+    start = time.monotonic()
+    scanner.close()
+    while not future.done():
+        time.sleep(0.01)
+    assert time.monotonic() - start < 1
+    assert scanner.result(tmp_path) is None
@@ -0,0 +1,48 @@
+# test_token_budget.py | Version: 5.2.0
+# A budgeted snapshot must fit its budget as a whole: the entries, and
+# everything written around them (stats, report, metadata).
+
+import functools
+import json
+import pytest
+import snapshot_export
+from snapshot_export import export_snapshot, MAX_FILE_BYTES
+from utils import estimate_tokens
+
+def _project(tmp_path, oversized=3):
+    project = tmp_path / 'project'
+    project.mkdir()
+    for i in range(120):
+        (project / f'module_with_a_long_name_{i:03}.py').write_text(
+            f'def f{i}(x):\n    """Doc {i}"""\n    return x * {i}\n', encoding='utf-8')
+    for i in range(oversized):
+        (project / f'huge_log_{i}.txt').write_text('line\n' * (MAX_FILE_BYTES // 5 + 1), encoding='utf-8')
+    return project
+
+@pytest.mark.parametrize('policy', ['sample', 'skip'])
+@pytest.mark.parametrize('compact', [False, True])
+def test_budgeted_snapshot_fits(tmp_path, monkeypatch, policy, compact):
+    monkeypatch.setattr(snapshot_export, 'read_oversized',
+                        functools.partial(snapshot_export.read_oversized, policy=policy))
+    budget = 2000
+    output = tmp_path / 'snapshot.json'
+    stats = export_snapshot(_project(tmp_path), output, 'full', token_budget=budget, compact=compact,
+                            profile=True, incremental=False)
+    text = output.read_text(encoding='utf-8')
+    assert estimate_tokens(text) <= budget
+
+    snapshot = json.loads(text)
+    report = snapshot['stats']['token_budget']
+    assert report['dropped'] > 0
+    assert report['skipped' if policy == 'skip' else 'truncated'] == 3
+    for key in ('skipped', 'truncated', 'profile'):
+        assert key not in snapshot['stats']
+    assert 'profile' in stats      # Still handed back to the caller
+
+def test_unbudgeted_snapshot_lists_skipped_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot_export, 'read_oversized',
+                        functools.partial(snapshot_export.read_oversized, policy='skip'))
+    output = tmp_path / 'snapshot.json'
+    export_snapshot(_project(tmp_path, oversized=1), output, 'full', incremental=False)
+    skipped = json.loads(output.read_text(encoding='utf-8'))['stats']['skipped']
+    assert [entry['path'] for entry in skipped] == ['huge_log_0.txt']
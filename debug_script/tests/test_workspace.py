@@ -0,0 +1,42 @@
+# test_workspace.py | Version: 5.2.0
+
+import json
+from pathlib import Path, PureWindowsPath
+from workspace import namespaces, export_workspace
+
+def _roots(tmp_path):
+    """Two roots holding a project folder of the same name (and the same parent name)"""
+    projects = []
+    for root in ('d', 'e'):
+        project = tmp_path / root / 'Coding' / 'app'
+        project.mkdir(parents=True)
+        (project / 'main.py').write_text(f'def {root}():\n    return 1\n', encoding='utf-8')
+        projects.append(project)
+    return projects
+
+def test_namespaces_grow_until_unique():
+    projects = [Path('/d/Coding/app'), Path('/e/Coding/app'), Path('/e/Coding/lib')]
+    assert namespaces(projects) == ['d-Coding-app', 'e-Coding-app', 'lib']
+
+def test_namespaces_windows_drives():
+    projects = [PureWindowsPath(r'D:\Coding\app'), PureWindowsPath(r'E:\Coding\app')]
+    assert namespaces(projects) == ['D-Coding-app', 'E-Coding-app']
+
+def test_same_folder_twice_gets_a_suffix():
+    assert namespaces([Path('/d/Coding/app'), Path('/d/Coding/app')]) == ['app', 'app-2']
+
+def test_per_project_exports_do_not_overwrite_each_other(tmp_path):
+    results = export_workspace(_roots(tmp_path), tmp_path / 'Debug', 'full')
+    outputs = [result['output'] for result in results]
+    assert all(result['error'] is None for result in results)
+    assert len(set(outputs)) == 2
+
+def test_combined_snapshot_has_unique_paths(tmp_path):
+    results = export_workspace(_roots(tmp_path), tmp_path / 'Debug', 'full', name='ws')
+    with open(results[0]['output'], encoding='utf-8') as f:
+        paths = [entry['path'] for entry in json.load(f)['files']]
+    assert len(paths) == len(set(paths)) == 2
+
+def test_combined_sqlite_snapshot(tmp_path):
+    results = export_workspace(_roots(tmp_path), tmp_path / 'Debug', 'full', name='ws', backend='sqlite')
+    assert results[0]['error'] is None and results[0]['files'] == 2
@@ -1,8 +1,10 @@
 # utils.py | Version: 5.1.0
 # Utility helpers for the debug / export pipeline.
 
+import hashlib
 from pathlib import Path
-from config import IGNORED_DIRS, OUTPUT_PATH, FILENAME_TO_BUNDLE
+from config import (IGNORED_DIRS, OUTPUT_PATH, FILENAME_TO_BUNDLE, SNAPSHOT_COMPRESSION, SNAPSHOT_BACKEND,
+                    CHARS_PER_TOKEN)
 
 # ─────────────────────────────────────────────────
 # 📂 PROJECT DISCOVERY
@@ -34,19 +36,45 @@ def find_bundle(filename):
     """Find which bundle a file belongs to, defaulting to unsorted"""
     return FILENAME_TO_BUNDLE.get(filename.lower(), '99_unsorted.json')
 
+# ─────────────────────────────────────────────────
+# 🔑 CONTENT HASHING
+# ─────────────────────────────────────────────────
+
+def content_hash(content):
+    """Stable short hash of a file's decoded text"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+# ─────────────────────────────────────────────────
+# 🎯 TOKEN ESTIMATE
+# ─────────────────────────────────────────────────
+
+def estimate_tokens(text):
+    """Rough LLM token count: no tokenizer, just CHARS_PER_TOKEN"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
 # ─────────────────────────────────────────────────
 # 📝 FILENAME GENERATOR
 # ─────────────────────────────────────────────────
 
-def generate_output_path(base_path, folder_name, mode):
-    """Generate output path with mode suffix"""
+# 🗜️ Compression name -> file suffix (the writers pick the codec from it)
+COMPRESSION_SUFFIXES = {None: '.json', 'gzip': '.json.gz', 'lzma': '.json.xz'}
+BACKENDS = ('json', 'sqlite')
+
+def generate_output_path(base_path, folder_name, mode, compression=SNAPSHOT_COMPRESSION, backend=SNAPSHOT_BACKEND):
+    """Generate output path with mode and compression (or .db backend) suffix"""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown snapshot compression: {compression!r}")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown snapshot backend: {backend!r}")
+    
     output_dir = Path(base_path) / folder_name
     ensure_dir(output_dir)
+    suffix = '.db' if backend == 'sqlite' else COMPRESSION_SUFFIXES[compression]
     
     if mode == 'skeleton' or mode == 'blueprint':
-        return output_dir / f'{folder_name}_blueprint.json'
+        return output_dir / f'{folder_name}_blueprint{suffix}'
     else:
-        return output_dir / f'{folder_name}_snapshot.json'
+        return output_dir / f'{folder_name}_snapshot{suffix}'
 
 # The cake is a lie.
 # 42
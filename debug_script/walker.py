@@ -0,0 +1,81 @@
+# walker.py | Version: 5.2.0
+# Iterative directory walker for the export pipeline.
+# Built on os.scandir so file types come from the cached DirEntry,
+# and on an explicit stack so deep trees never hit the recursion limit.
+# Ignored directories are pruned before they are ever scanned.
+
+import os
+from typing import NamedTuple
+from filters import PathFilter
+
+# ─────────────────────────────────────────────────
+# 📄 FILE RECORDS
+# ─────────────────────────────────────────────────
+
+class FileEntry(NamedTuple):
+    """A file accepted by the walker, ready to be read"""
+    path: str          # Absolute (or root-joined) filesystem path
+    rel_path: str      # Forward-slash path relative to the walk root
+    name: str
+    ext: str           # Lowercased suffix, dot included
+    dir_entry: os.DirEntry
+
+# ─────────────────────────────────────────────────
+# 🚶 TRAVERSAL
+# ─────────────────────────────────────────────────
+
+def _sort_key(entry):
+    # Directories first, then case-insensitive names (same order as v5.1)
+    return (not entry.is_dir(), entry.name.lower())
+
+def _scan_sorted(dir_path):
+    with os.scandir(dir_path) as it:
+        return sorted(it, key=_sort_key)
+
+def walk_files(root, path_filter=None, profile=None, dirs=None):
+    """
+    Yield a FileEntry for every exportable file under root, depth-first.
+    `dirs` (a list) collects the path of every directory actually scanned.
+    """
+    path_filter = path_filter or PathFilter()
+    root_entries = _scan_sorted(root)
+    if dirs is not None:
+        dirs.append(str(root))
+    rules = path_filter.rules_for(root, '', root_entries, path_filter.root_rules)
+    stack = [(iter(root_entries), '', rules)]
+
+    while stack:
+        entries, prefix, rules = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+
+        rel_path = prefix + entry.name
+
+        if entry.is_dir():
+            if path_filter.skip_dir(entry.name, rel_path, rules):
+                if profile is not None:
+                    profile.skipped(path_filter.dir_skip_reason(entry.name, rel_path, rules))
+                continue
+            try:
+                children = _scan_sorted(entry.path)
+            except OSError as e:
+                print(f"⚠️ Error reading {rel_path}/: {e}")
+                continue
+            if profile is not None:
+                profile.count('dirs_visited')
+            if dirs is not None:
+                dirs.append(entry.path)
+            child_prefix = rel_path + '/'
+            stack.append((iter(children), child_prefix,
+                          path_filter.rules_for(entry.path, child_prefix, children, rules)))
+
+        elif entry.is_file():
+            ext = os.path.splitext(entry.name)[1].lower()
+            if not path_filter.accept_file(entry.name, ext, rel_path, rules):
+                if profile is not None:
+                    profile.skipped(path_filter.file_skip_reason(entry.name, ext, rel_path, rules))
+                continue
+
+            yield FileEntry(entry.path, rel_path, entry.name, ext, entry)
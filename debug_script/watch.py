@@ -0,0 +1,187 @@
+# watch.py | Version: 5.2.0
+# Watch mode: keeps one project's snapshot continuously up to date.
+# Entries live in memory between syncs. The tree is polled cheaply (one stat
+# per folder and per tracked file, no reads); once it has been quiet for a
+# moment, changed files alone are re-read and the snapshot is rewritten
+# atomically. A branch checkout touching thousands of files = one rewrite.
+# Pure polling, no inotify/watchdog dependency: works the same everywhere.
+
+import os
+import time
+from pathlib import Path
+from config import MODE_FULL, INCREMENTAL_EXPORTS, WRITE_IMPORT_GRAPH, SHARD_SNAPSHOTS
+from walker import walk_files
+from manifest import Manifest, manifest_path_for
+from import_graph import graph_path_for
+from snapshot_index import index_path_for
+from profiling import profile_path_for
+from snapshot_writer import COMPRESSED_SUFFIXES, shard_dir_for
+from snapshot_sqlite import SQLITE_SUFFIXES
+from snapshot_export import export_snapshot, iter_entries
+
+POLL_SECONDS = 1.0         # Idle polling period
+QUIET_SECONDS = 0.5        # A change burst is over after this long without changes
+MAX_DELAY_SECONDS = 10.0   # ... or after this long anyway (never starve the rewrite)
+
+def _stamp(st):
+    return (st.st_size, st.st_mtime_ns)
+
+class SnapshotWatcher:
+    """In-memory snapshot of one project, synced to disk after each change burst"""
+
+    def __init__(self, project_path, output_file, mode, workers=1, import_graph=WRITE_IMPORT_GRAPH):
+        self.project_path = Path(project_path)
+        self.output_file = Path(output_file)
+        self.mode = mode
+        self.workers = workers
+        self.import_graph = import_graph
+        self.items = []          # FileEntry list, walk order
+        self.entries = {}        # rel_path -> snapshot entry
+        self.stamps = {}         # rel_path -> (size, mtime_ns) the entry was built from
+        self.dirs = []           # folders scanned by the last walk
+        self.synced = None       # fingerprint of what the entries were built from
+        self.incremental = False
+
+    # ────────────────────────
+    # POLLING
+    # ────────────────────────
+
+    def fingerprint(self):
+        """Every folder's mtime (adds/removes/renames) and every file's size/mtime"""
+        stamps = []
+        for path in self.dirs:
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        for item in self.items:
+            try:
+                stamps.append(_stamp(os.stat(item.path)))
+            except OSError:
+                stamps.append(None)
+        return stamps
+
+    # ────────────────────────
+    # SYNC
+    # ────────────────────────
+
+    def _own_files(self):
+        """The snapshot, its sidecars and their .part files: written by every sync"""
+        paths = [self.output_file, manifest_path_for(self.output_file), graph_path_for(self.output_file),
+                 index_path_for(self.output_file), profile_path_for(self.output_file)]
+        own = set()
+        for path in paths:
+            path = os.path.abspath(path)
+            own.update((path, path + '.part'))
+        return own
+
+    def _walk(self):
+        dirs = []
+        # The snapshot may be written inside the watched tree (even at its
+        # root): never watch it, but do watch everything else around it
+        own = self._own_files()
+        shard_dir = os.path.abspath(shard_dir_for(self.output_file)) + os.sep if SHARD_SNAPSHOTS else None
+        items = [item for item in walk_files(self.project_path, dirs=dirs)
+                 if os.path.abspath(item.path) not in own
+                 and not (shard_dir and os.path.abspath(item.path).startswith(shard_dir))]
+        if shard_dir:
+            dirs = [path for path in dirs if not (os.path.abspath(path) + os.sep).startswith(shard_dir)]
+        return items, dirs
+
+    def sync(self, manifest=None):
+        """
+        Re-walk (fresh stats), rebuild changed entries, rewrite the snapshot.
+        With a manifest, the snapshot gets its .idx and the manifest is saved
+        after it, so the next start reuses this rewrite.
+        Returns: (changed, removed) counts
+        """
+        first = self.synced is None
+        items, dirs = self._walk()
+        # Taken before any read: whatever moves from here on shows up next poll
+        dir_stamps = []
+        for path in dirs:
+            try:
+                dir_stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                dir_stamps.append(None)
+        
+        stale = [item for item in items if self.stamps.get(item.rel_path) != _stamp(item.dir_entry.stat())]
+        present = {item.rel_path for item in items}
+        removed = [rel_path for rel_path in self.stamps if rel_path not in present]
+        for rel_path in removed:
+            self.entries.pop(rel_path, None)
+            del self.stamps[rel_path]
+        if manifest is not None:
+            stale_paths = {item.rel_path for item in stale}
+            for item in items:
+                if item.rel_path not in stale_paths:
+                    manifest.keep(item.rel_path)
+        
+        for item, entry, error in iter_entries(self.project_path, self.mode, self.workers, manifest, stale):
+            try:
+                # Stamped either way: an unreadable file is retried once it changes
+                self.stamps[item.rel_path] = _stamp(item.dir_entry.stat())
+            except OSError:
+                self.stamps[item.rel_path] = None     # Gone already; the next walk drops it
+            if error is not None:
+                print(f"⚠️ Error reading {item.rel_path}: {error}")
+                self.entries.pop(item.rel_path, None)
+                continue
+            self.entries[item.rel_path] = entry
+        
+        self.items, self.dirs = items, dirs
+        self.synced = dir_stamps + [self.stamps[item.rel_path] for item in items]
+        if manifest is not None:
+            manifest.close()    # Before the previous snapshot gets replaced
+        if stale or removed or first:
+            export_snapshot(self.project_path, self.output_file, self.mode, import_graph=self.import_graph,
+                            prebuilt=[(item, self.entries[item.rel_path], None) for item in items
+                                      if item.rel_path in self.entries], index=manifest is not None)
+            if manifest is not None:
+                manifest.save()
+        return len(stale), len(removed)
+
+    def _manifest(self):
+        """Same rules as export_snapshot: skeletons only, plain .json only (read back through the .idx)"""
+        if (not self.incremental or self.mode == MODE_FULL
+                or self.output_file.suffix in SQLITE_SUFFIXES + COMPRESSED_SUFFIXES):
+            return None
+        return Manifest(manifest_path_for(self.output_file), self.mode, self.output_file)
+
+    def start(self, incremental=INCREMENTAL_EXPORTS):
+        """First sync: the manifest (when on) spares re-reading unchanged files"""
+        self.incremental = incremental
+        changed, _ = self.sync(self._manifest())
+        return changed
+
+    def run(self, poll_seconds=POLL_SECONDS, quiet_seconds=QUIET_SECONDS, max_delay=MAX_DELAY_SECONDS):
+        """Poll forever (Ctrl-C to stop); one rewrite per burst of changes"""
+        while True:
+            time.sleep(poll_seconds)
+            seen = self.fingerprint()
+            if seen == self.synced:
+                continue
+            # ⏳ Coalesce: wait until the tree stops moving
+            burst_start = time.monotonic()
+            while time.monotonic() - burst_start < max_delay:
+                time.sleep(quiet_seconds)
+                previous, seen = seen, self.fingerprint()
+                if seen == previous:
+                    break
+            start = time.perf_counter()
+            changed, removed = self.sync(self._manifest())
+            if changed or removed:
+                print(f"🔄 {time.strftime('%H:%M:%S')} {changed} changed, {removed} removed "
+                      f"→ {len(self.entries)} files rewritten in {time.perf_counter() - start:.2f}s")
+
+def watch(project_path, output_file, mode, workers=1):
+    """Export once, then keep output_file in sync until Ctrl-C"""
+    watcher = SnapshotWatcher(project_path, output_file, mode, workers)
+    start = time.perf_counter()
+    watcher.start()
+    print(f"👀 Watching {project_path} ({len(watcher.entries)} files, first sync "
+          f"{time.perf_counter() - start:.2f}s) → {output_file}. Ctrl-C to stop.")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching; the last written snapshot is complete.")
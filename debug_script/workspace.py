@@ -0,0 +1,106 @@
+# workspace.py | Version: 5.2.0
+# Several projects, possibly from several roots, exported in one pass.
+# Every project is walked at once (scandir waits on the disk, not the GIL)
+# with one compiled PathFilter; the exports then share one SkeletonCache,
+# so one skeleton process pool serves them all and a file vendored or copied
+# across repos is skeletonized once.
+# Output: one combined snapshot with <project>/ prefixed paths (with dedup,
+# one blobs table for the whole workspace) or one snapshot per project.
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePath
+from config import SNAPSHOT_BACKEND
+from filters import PathFilter
+from walker import walk_files
+from snapshot_export import SkeletonCache
+from batch import export_project, print_result
+
+WALK_THREADS = 8
+
+def _folders(project):
+    """'D:\\Coding\\app' -> ['D', 'Coding', 'app'] (anchor dropped, drive letter kept)"""
+    project = project if isinstance(project, PurePath) else Path(project)
+    drive = project.drive.rstrip(':\\/').replace('\\', '-').replace('/', '-').strip('-')
+    return ([drive] if drive else []) + list(project.parts[1:] if project.anchor else project.parts)
+
+def namespaces(projects):
+    """
+    Path prefix per project: its name, with as many parent folders in front
+    (<root>-<parent>-<name>) as it takes to tell it apart from the others.
+    The very same folder given twice gets a numeric suffix.
+    """
+    folders = [_folders(project) for project in projects]
+    depths = [1] * len(projects)
+    while True:
+        prefixes = ['-'.join(parts[-depth:]) for parts, depth in zip(folders, depths)]
+        # Only a clash with another folder is worth a level (not the same one twice)
+        deeper = [i for i, prefix in enumerate(prefixes) if depths[i] < len(folders[i])
+                  and any(other == prefix and folders[j] != folders[i] for j, other in enumerate(prefixes))]
+        if not deeper:
+            break
+        for i in deeper:
+            depths[i] += 1
+
+    seen = {}
+    for i, prefix in enumerate(prefixes):
+        seen[prefix] = seen.get(prefix, 0) + 1
+        if seen[prefix] > 1:
+            prefixes[i] = f"{prefix}-{seen[prefix]}"
+    return prefixes
+
+def walk_projects(projects, path_filter=None, threads=WALK_THREADS):
+    """
+    Walk every project concurrently with one filter.
+    Returns: [(FileEntry list, error)], project order
+    """
+    path_filter = path_filter or PathFilter()
+
+    def walk(project):
+        try:
+            return list(walk_files(project, path_filter)), None
+        except OSError as e:
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(threads, len(projects)))) as pool:
+        return list(pool.map(walk, projects))
+
+def export_workspace(projects, output_root, mode, name=None, workers=1, token_budget=None, profile=False,
+                     progress=False, index=False, backend=SNAPSHOT_BACKEND):
+    """
+    With `name`: one combined snapshot <output_root>/<name>/, paths <project>/<path>.
+    Without: one snapshot per project, like run_batch.
+    Returns: list of export_project results
+    """
+    walks = walk_projects(projects)
+    prefixes = namespaces(projects)
+    cache = SkeletonCache(workers)
+    results = []
+    try:
+        if name:
+            walked = []
+            for prefix, (items, error) in zip(prefixes, walks):
+                if error is not None:
+                    print(f"⚠️ Error reading {prefix}: {error}")
+                    continue
+                walked.extend(item._replace(rel_path=f"{prefix}/{item.rel_path}") for item in items)
+            results.append(export_project(name, output_root, mode, workers, token_budget, None, profile, progress,
+                                          index, backend, walked=walked, skeleton_cache=cache,
+                                          metadata={'projects': [prefix for prefix, (_, error) in zip(prefixes, walks)
+                                                                 if error is None]}))
+            print_result(results[-1])
+        else:
+            # Same prefixes as output folders: two roots' "app" must not overwrite each other
+            for project, prefix, (items, error) in zip(projects, prefixes, walks):
+                if error is not None:
+                    results.append({'project': prefix, 'output': None, 'files': 0, 'bytes': 0,
+                                    'seconds': 0.0, 'error': f"{type(error).__name__}: {error}"})
+                else:
+                    results.append(export_project(project, output_root, mode, workers, token_budget, None, profile,
+                                                  progress, index, backend, walked=items, skeleton_cache=cache,
+                                                  name=prefix))
+                print_result(results[-1])
+    finally:
+        cache.shutdown()
+    if cache.hits:
+        print(f"♻️ {cache.hits:,} skeleton(s) shared between files with identical content")
+    return results